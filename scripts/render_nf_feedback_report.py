@@ -28,17 +28,22 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import io
+import itertools
 import json
 import math
 import os
 import pathlib
+import re
+import statistics
 import webbrowser
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from report_common import (
     BASE_CSS,
     JS_SORT_TABLE,
+    atomic_output as _atomic_output,
     downsample_indices as _downsample_indices,
     e as _e,
     finite_minmax as _finite_minmax,
@@ -320,47 +325,71 @@ def _fraction_ones(flags: Optional[Sequence[int]]) -> float:
         return math.nan
     if len(flags) == 0:
         return math.nan
-    return float(sum(1 for x in flags if x == 1)) / float(len(flags))
+    return float(flags.count(1)) / float(len(flags))
 
 
-def _build_table(headers: Sequence[str], rows: Sequence[Dict[str, str]], *, max_rows: int) -> str:
+_TableRow = Union[Dict[str, str], Sequence[str]]
+
+
+def _write_table(write: Callable[[str], Any], headers: Sequence[str], rows: Sequence[_TableRow], *, max_rows: int) -> None:
+    """Write a sortable table (or a short note) through write(), one row at a time.
+
+    Rows may be dicts keyed by header (e.g., raw CSV rows) or tuples whose
+    cells are already in header order.
+    """
     if not rows:
-        return '<div class="note">No rows available.</div>'
+        write('<div class="note">No rows available.</div>')
+        return
     max_rows = max(0, int(max_rows))
     if max_rows == 0:
-        return '<div class="note">Table disabled (max rows = 0).</div>'
+        write('<div class="note">Table disabled (max rows = 0).</div>')
+        return
 
     # Downsample to at most max_rows rows.
     idx = _downsample_indices(len(rows), max_rows)
-    use_rows = [rows[i] for i in idx]
 
     ths = "".join(f'<th onclick="sortTable(this)">{_e(h)}</th>' for h in headers)
-    body: List[str] = []
-    for r in use_rows:
+    write(f'<table class="data-table sticky"><thead><tr>{ths}</tr></thead><tbody>')
+    for i in idx:
+        r = rows[i]
+        cells = [r.get(h) for h in headers] if isinstance(r, dict) else r
         tds: List[str] = []
-        for h in headers:
-            v = (r.get(h) or "").strip()
+        for v in cells:
+            v = (v or "").strip()
             # Numeric hint for sorting
             fv = _try_float(v)
             if math.isfinite(fv) and v != "":
-                tds.append(f'<td data-num="{_e(f"{fv:.12g}")}">{_e(v)}</td>')
+                # A formatted finite float never needs HTML escaping.
+                tds.append(f'<td data-num="{fv:.12g}">{_e(v)}</td>')
             else:
                 tds.append(f"<td>{_e(v)}</td>")
-        body.append("<tr>" + "".join(tds) + "</tr>")
+        write("<tr>" + "".join(tds) + "</tr>")
+    write("</tbody></table>")
 
-    return (
-        '<table class="data-table sticky">'
-        f"<thead><tr>{ths}</tr></thead>"
-        f"<tbody>{''.join(body)}</tbody>"
-        "</table>"
-    )
+
+def _build_table(headers: Sequence[str], rows: Sequence[_TableRow], *, max_rows: int) -> str:
+    buf = io.StringIO()
+    _write_table(buf.write, headers, rows, max_rows=max_rows)
+    return buf.getvalue()
+
+
+_JSON_SNIPPET_ENCODER = json.JSONEncoder(indent=2, sort_keys=True)
 
 
 def _pretty_json_snippet(obj: Dict[str, Any], *, pick: Sequence[str], max_chars: int = 12000) -> str:
     picked: Dict[str, Any] = {k: obj.get(k) for k in pick if k in obj}
     if not picked:
         return ""
-    s = json.dumps(picked, indent=2, sort_keys=True)
+    # Encode incrementally and stop once past max_chars: large values (e.g., long
+    # Outputs lists in nf_run_meta.json) are not fully serialized only to be cut.
+    chunks: List[str] = []
+    n = 0
+    for chunk in _JSON_SNIPPET_ENCODER.iterencode(picked):
+        chunks.append(chunk)
+        n += len(chunk)
+        if n > max_chars:
+            break
+    s = "".join(chunks)
     if len(s) > max_chars:
         s = s[:max_chars] + "\n… (truncated)"
     return "<pre>" + _e(s) + "</pre>"
@@ -490,6 +519,237 @@ def _svg_events_timeline(events: Sequence[Dict[str, Any]], *, title: str) -> str
     return "".join(parts)
 
 
+# Report stylesheet, assembled once per process (batch callers such as the
+# sessions dashboard render many reports). Runs of whitespace are collapsed;
+# the CSS contains no whitespace-sensitive strings.
+_REPORT_CSS = re.sub(
+    r"\s+",
+    " ",
+    BASE_CSS
+    + r"""
+
+/* NF report specifics */
+.kv { display: grid; grid-template-columns: 260px 1fr; gap: 6px 12px; font-size: 13px; }
+.kv div:nth-child(odd) { color: var(--muted); }
+
+.ts { width: 100%; height: auto; }
+.evt-ts { width: 100%; height: auto; }
+.frame { fill: #0c131f; stroke: #20324a; stroke-width: 1; }
+.grid { stroke: rgba(255,255,255,0.06); stroke-width: 1; }
+.evt-grid { stroke: rgba(255,255,255,0.04); stroke-width: 1; }
+
+.ts-title { fill: #dce7ff; font-weight: 700; font-size: 13px; }
+.axis-label { fill: var(--muted); font-size: 12px; }
+.evt-label { fill: #dce7ff; font-size: 12px; opacity: 0.9; }
+
+.line-metric { fill: none; stroke: var(--accent); stroke-width: 2; opacity: 0.95; }
+.line-metricraw { fill: none; stroke: rgba(143,183,255,0.45); stroke-width: 1.5; opacity: 0.85; stroke-dasharray: 4 4; }
+.line-thr { fill: none; stroke: #ffd37f; stroke-width: 2; opacity: 0.9; stroke-dasharray: 6 4; }
+.line-thrdes { fill: none; stroke: rgba(255,211,127,0.55); stroke-width: 1.5; opacity: 0.85; stroke-dasharray: 2 6; }
+.line-rr { fill: none; stroke: #8cffaa; stroke-width: 2; opacity: 0.95; }
+.line-metricz { fill: none; stroke: #c6a8ff; stroke-width: 2; opacity: 0.95; }
+.line-thrz { fill: none; stroke: #ffd37f; stroke-width: 2; opacity: 0.85; stroke-dasharray: 6 4; }
+.line-feedback { fill: none; stroke: #8fb7ff; stroke-width: 2; opacity: 0.95; }
+.line-rewardvalue { fill: none; stroke: #ffb86b; stroke-width: 2; opacity: 0.95; }
+
+.line-metric-legend { fill: var(--accent); }
+.line-metricraw-legend { fill: rgba(143,183,255,0.45); }
+.line-thr-legend { fill: #ffd37f; }
+.line-thrdes-legend { fill: rgba(255,211,127,0.55); }
+.line-rr-legend { fill: #8cffaa; }
+.line-metricz-legend { fill: #c6a8ff; }
+.line-thrz-legend { fill: #ffd37f; }
+.line-feedback-legend { fill: #8fb7ff; }
+.line-rewardvalue-legend { fill: #ffb86b; }
+
+.shade-reward { fill: rgba(127, 179, 255, 0.14); }
+.shade-artifact { fill: rgba(255, 120, 150, 0.14); }
+
+.phase-baseline { fill: rgba(200, 200, 200, 0.12); }
+.phase-train { fill: rgba(127, 179, 255, 0.22); }
+.phase-rest { fill: rgba(255, 211, 127, 0.18); }
+.phase-other { fill: rgba(155, 176, 208, 0.14); }
+
+.legend-text { fill: #dce7ff; font-size: 12px; }
+.legend-reward { fill: rgba(127, 179, 255, 0.55); }
+.legend-artifact { fill: rgba(255, 120, 150, 0.6); }
+
+/* Derived events timeline */
+.evt { stroke: rgba(255,255,255,0.10); stroke-width: 1; }
+.evt-baseline { fill: rgba(200,200,200,0.22); }
+.evt-train { fill: rgba(127, 179, 255, 0.30); }
+.evt-rest { fill: rgba(255, 211, 127, 0.26); }
+.evt-reward { fill: rgba(127, 179, 255, 0.45); }
+.evt-artifact { fill: rgba(255, 120, 150, 0.42); }
+.evt-nf { fill: rgba(155, 176, 208, 0.28); }
+.evt-other { fill: rgba(155, 176, 208, 0.20); }
+
+.warn { color: var(--warn); }
+""",
+).strip()
+
+
+# "Columns used" card: the labels are fixed, so they are escaped once.
+_USED_ROW_TMPL = "<div>{k}</div><div><code>{v}</code></div>"
+_USED_LABELS_ESC: Dict[str, str] = {
+    k: _e(k)
+    for k in (
+        "time",
+        "metric",
+        "metric_raw",
+        "threshold",
+        "threshold_desired",
+        "reward",
+        "reward_rate",
+        "raw_reward",
+        "artifact",
+        "artifact_ready",
+        "bad_channels",
+        "phase",
+        "feedback_raw",
+        "reward_value",
+        "metric_z",
+        "threshold_z",
+        "metric_z_ref",
+        "threshold_z_ref",
+    )
+}
+
+_PHASE_KEYS: Tuple[str, ...] = ("baseline", "train", "rest", "other")
+_BUCKET_FIELDS: Tuple[str, ...] = (
+    "frames",
+    "seconds",
+    "reward_sum",
+    "artifact_sum",
+    "metric_sum",
+    "metric_n",
+    "thr_sum",
+    "thr_n",
+)
+# Column indices into a _phase_bucket_sums row (same order as _BUCKET_FIELDS).
+(
+    _B_FRAMES,
+    _B_SECONDS,
+    _B_REWARD_SUM,
+    _B_ARTIFACT_SUM,
+    _B_METRIC_SUM,
+    _B_METRIC_N,
+    _B_THR_SUM,
+    _B_THR_N,
+) = range(len(_BUCKET_FIELDS))
+
+
+def _norm_phase(p: str) -> str:
+    s = (p or "").strip().lower()
+    if not s:
+        return "other"
+    if s in ("baseline", "train", "rest"):
+        return s
+    # common aliases
+    if s.startswith("base"):
+        return "baseline"
+    if s.startswith("tr"):
+        return "train"
+    if s.startswith("re"):
+        return "rest"
+    return "other"
+
+
+def _phase_bucket_sums(
+    codes: Sequence[int],
+    dts: Sequence[float],
+    reward: Sequence[int],
+    artifact: Optional[Sequence[int]],
+    metric: Sequence[float],
+    thr: Sequence[float],
+) -> List[List[float]]:
+    """Sum per-frame values by phase code (an index into _PHASE_KEYS).
+
+    dts must already be finite and >= 0 (see the dt_est fallback in main()).
+
+    Returns one row per phase with the columns listed in _BUCKET_FIELDS. Frames
+    are accumulated in input order, so sums match a frame-by-frame loop exactly.
+    The loop only touches flat sequences and a small list matrix (no dicts or
+    attribute lookups), which keeps the per-frame bytecode short.
+    """
+    out = [[0.0] * len(_BUCKET_FIELDS) for _ in _PHASE_KEYS]
+    isfinite = math.isfinite
+    arts = artifact if artifact is not None else itertools.repeat(0)
+    for c, dt, rw, art, mv, tv in zip(codes, dts, reward, arts, metric, thr):
+        b = out[c]
+        b[_B_FRAMES] += 1.0
+        b[_B_SECONDS] += dt
+        b[_B_REWARD_SUM] += rw
+        b[_B_ARTIFACT_SUM] += art
+        if isfinite(mv):
+            b[_B_METRIC_SUM] += mv
+            b[_B_METRIC_N] += 1.0
+        if isfinite(tv):
+            b[_B_THR_SUM] += tv
+            b[_B_THR_N] += 1.0
+    return out
+
+
+def _phase_bucket_stats(
+    sums: Sequence[Sequence[float]], *, has_artifact: bool
+) -> List[Tuple[str, int, float, float, float, float, float]]:
+    """Derive per-phase ratios from _phase_bucket_sums rows.
+
+    Returns (phase, frames, seconds, reward_frac, artifact_frac, metric_mean,
+    threshold_mean) for each phase with at least one frame; undefined ratios
+    are NaN. Computing all numbers up front keeps the table loop to formatting.
+    """
+    nan = math.nan
+    out: List[Tuple[str, int, float, float, float, float, float]] = []
+    for key, b in zip(_PHASE_KEYS, sums):
+        frames = int(b[_B_FRAMES])
+        if frames <= 0:
+            continue
+        m_n = b[_B_METRIC_N]
+        t_n = b[_B_THR_N]
+        out.append(
+            (
+                key,
+                frames,
+                b[_B_SECONDS],
+                b[_B_REWARD_SUM] / frames,
+                (b[_B_ARTIFACT_SUM] / frames) if has_artifact else nan,
+                (b[_B_METRIC_SUM] / m_n) if m_n > 0.0 else nan,
+                (b[_B_THR_SUM] / t_n) if t_n > 0.0 else nan,
+            )
+        )
+    return out
+
+
+_SvgSpec = Tuple[Callable[..., str], Tuple[Any, ...], Dict[str, Any]]
+
+
+def _render_svgs(specs: Dict[str, _SvgSpec], *, jobs: int) -> Dict[str, str]:
+    """Render independent SVG charts, optionally in worker processes.
+
+    specs maps a chart name to (function, args, kwargs). The chart builders are
+    pure string formatting over already-downsampled inputs, so they can run
+    concurrently. Falls back to in-process rendering when jobs <= 1 or when a
+    process pool cannot be created (e.g., restricted sandboxes). Errors raised
+    while rendering (including a broken pool) propagate.
+    """
+    jobs = int(jobs)
+    if jobs <= 0:
+        jobs = min(4, os.cpu_count() or 1)
+    if jobs > 1 and len(specs) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            ex = ProcessPoolExecutor(max_workers=min(jobs, len(specs)))
+        except (ImportError, OSError, NotImplementedError):
+            pass
+        else:
+            with ex:
+                futures = {name: ex.submit(fn, *a, **kw) for name, (fn, a, kw) in specs.items()}
+                return {name: fut.result() for name, fut in futures.items()}
+    return {name: fn(*a, **kw) for name, (fn, a, kw) in specs.items()}
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     ap = argparse.ArgumentParser(
         description="Render nf_feedback.csv to a self-contained HTML report (stdlib only)."
@@ -515,6 +775,17 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         default=500,
         help="Max rows of nf_derived_events.* to include in the report (default: 500; 0 disables).",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Render SVG charts in N worker processes (default: 1 = in-process; 0 = auto).",
+    )
+    ap.add_argument(
+        "--no-svg",
+        action="store_true",
+        help="Skip the SVG charts (stats and tables only; faster for very long runs).",
+    )
     ap.add_argument(
         "--open",
         action="store_true",
@@ -567,7 +838,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     parsed.sort(key=lambda d: d["t"])
 
-    # Full-resolution stats (before downsampling)
+    # Full-resolution columns (before downsampling). Only the columns that feed
+    # quick stats or phase stats are materialized; the optional plot-only series
+    # are read from the downsampled frames below.
     t_all = [d["t"] for d in parsed]
     metric_all = [d["metric"] for d in parsed]
     thr_all = [d["threshold"] for d in parsed]
@@ -578,15 +851,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     reward_rate_all = [d["reward_rate"] for d in parsed] if cols.reward_rate else None
     phase_all = [d["phase"] for d in parsed] if cols.phase else None
 
-    metric_raw_all = [d["metric_raw"] for d in parsed] if cols.metric_raw else None
-    thr_desired_all = [d["threshold_desired"] for d in parsed] if cols.threshold_desired else None
-    feedback_raw_all = [d["feedback_raw"] for d in parsed] if cols.feedback_raw else None
-    reward_value_all = [d["reward_value"] for d in parsed] if cols.reward_value else None
-    metric_z_all = [d["metric_z"] for d in parsed] if cols.metric_z else None
-    threshold_z_all = [d["threshold_z"] for d in parsed] if cols.threshold_z else None
-
-    t_end = max(t_all) if t_all else 0.0
-    duration = max(t_all) - min(t_all) if t_all else 0.0
+    # parsed is sorted by t, so the extremes are the endpoints.
+    t_end = t_all[-1] if t_all else 0.0
+    duration = t_all[-1] - t_all[0] if t_all else 0.0
 
     reward_frames = sum(reward_all)
     reward_frac = reward_frames / max(1, len(reward_all))
@@ -620,67 +887,59 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if thr_desired is not None and any(math.isfinite(v) for v in thr_desired):
         series_metric.append(("threshold_desired", thr_desired, "line-thrdes"))
 
-    chart_metric = _svg_timeseries(
-        t,
-        series_metric,
-        shade_reward=reward if cols.reward else None,
-        shade_artifact=artifact,
-        phase=phase,
-        title="Metric & threshold over time (reward/artifact shaded)",
-        y_label="metric / threshold",
+    # Chart inputs are collected here and rendered together (see --jobs).
+    shade_kw: Dict[str, Any] = {
+        "shade_reward": reward if cols.reward else None,
+        "shade_artifact": artifact,
+        "phase": phase,
+    }
+    chart_specs: Dict[str, _SvgSpec] = {}
+    chart_specs["metric"] = (
+        _svg_timeseries,
+        (t, series_metric),
+        dict(
+            shade_kw,
+            title="Metric & threshold over time (reward/artifact shaded)",
+            y_label="metric / threshold",
+        ),
     )
 
-    chart_rr = ""
     if reward_rate_all is not None:
         rr = [parsed[i]["reward_rate"] for i in idx]
-        chart_rr = _svg_timeseries(
-            t,
-            [("reward_rate", rr, "line-rr")],
-            shade_reward=reward if cols.reward else None,
-            shade_artifact=artifact,
-            phase=phase,
-            title="Reward rate over time (downsampled)",
-            y_label="reward_rate",
+        chart_specs["rr"] = (
+            _svg_timeseries,
+            (t, [("reward_rate", rr, "line-rr")]),
+            dict(shade_kw, title="Reward rate over time (downsampled)", y_label="reward_rate"),
         )
 
-    chart_z = ""
-    if (metric_z_all is not None) or (threshold_z_all is not None):
-        mz = [parsed[i]["metric_z"] for i in idx] if metric_z_all is not None else []
-        tz = [parsed[i]["threshold_z"] for i in idx] if threshold_z_all is not None else []
+    if cols.metric_z or cols.threshold_z:
+        mz = [parsed[i]["metric_z"] for i in idx] if cols.metric_z else []
+        tz = [parsed[i]["threshold_z"] for i in idx] if cols.threshold_z else []
         if any(math.isfinite(v) for v in mz) or any(math.isfinite(v) for v in tz):
             series_z: List[Tuple[str, Sequence[float], str]] = []
-            if metric_z_all is not None:
+            if cols.metric_z:
                 series_z.append(("metric_z", mz, "line-metricz"))
-            if threshold_z_all is not None:
+            if cols.threshold_z:
                 series_z.append(("threshold_z", tz, "line-thrz"))
-            chart_z = _svg_timeseries(
-                t,
-                series_z,
-                shade_reward=reward if cols.reward else None,
-                shade_artifact=artifact,
-                phase=phase,
-                title="Z-scores over time (downsampled)",
-                y_label="z",
+            chart_specs["z"] = (
+                _svg_timeseries,
+                (t, series_z),
+                dict(shade_kw, title="Z-scores over time (downsampled)", y_label="z"),
             )
 
-    chart_feedback = ""
-    if (feedback_raw_all is not None) or (reward_value_all is not None):
-        fb = [parsed[i]["feedback_raw"] for i in idx] if feedback_raw_all is not None else []
-        rv = [parsed[i]["reward_value"] for i in idx] if reward_value_all is not None else []
+    if cols.feedback_raw or cols.reward_value:
+        fb = [parsed[i]["feedback_raw"] for i in idx] if cols.feedback_raw else []
+        rv = [parsed[i]["reward_value"] for i in idx] if cols.reward_value else []
         if any(math.isfinite(v) for v in fb) or any(math.isfinite(v) for v in rv):
             series_fb: List[Tuple[str, Sequence[float], str]] = []
-            if feedback_raw_all is not None:
+            if cols.feedback_raw:
                 series_fb.append(("feedback_raw", fb, "line-feedback"))
-            if reward_value_all is not None:
+            if cols.reward_value:
                 series_fb.append(("reward_value", rv, "line-rewardvalue"))
-            chart_feedback = _svg_timeseries(
-                t,
-                series_fb,
-                shade_reward=reward if cols.reward else None,
-                shade_artifact=artifact,
-                phase=phase,
-                title="Continuous feedback (downsampled)",
-                y_label="feedback",
+            chart_specs["feedback"] = (
+                _svg_timeseries,
+                (t, series_fb),
+                dict(shade_kw, title="Continuous feedback (downsampled)", y_label="feedback"),
             )
 
     summary = _read_json_if_exists(summary_path) if summary_path else None
@@ -699,7 +958,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     events_table_rel = os.path.relpath(os.path.abspath(events_table_path), out_dir) if events_table_path else ""
     events_json_rel = os.path.relpath(os.path.abspath(events_json_path), out_dir) if events_json_path else ""
 
-    derived_events_block = ""
+    ev_table_html = ""
+    ev_summary_html = ""
+    ev_sidecar_block = ""
+    parse_error = ""
     if events_table_path:
         ev_headers, ev_rows = _read_csv(events_table_path)
         ev_table_html = _build_table(ev_headers, ev_rows, max_rows=args.events_table_rows) if ev_headers else ""
@@ -717,7 +979,6 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
         # Parse into onset/duration/label for summary + timeline (best-effort).
         parsed_events: List[Dict[str, Any]] = []
-        parse_error = ""
         try:
             col_onset, col_dur, col_label = _detect_event_cols(ev_headers)
             for r in ev_rows:
@@ -733,8 +994,6 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         except Exception as e:
             parse_error = str(e)
 
-        ev_svg = ""
-        ev_summary_html = ""
         if parsed_events and not parse_error:
             # Summary per label
             by_label: Dict[str, Dict[str, float]] = {}
@@ -754,23 +1013,23 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 st["dur"] += max(0.0, dur)
             total = (t1 - t0) if (math.isfinite(t0) and math.isfinite(t1) and t1 > t0) else float(t_end)
 
-            summary_rows: List[Dict[str, str]] = []
+            summary_rows: List[Tuple[str, str, str, str, str]] = []
             for lab, st in by_label.items():
                 d = st.get("dur", 0.0)
                 frac = (d / total) if (total and total > 0.0 and math.isfinite(d)) else math.nan
                 desc = desc_map.get(lab, "")
                 summary_rows.append(
-                    {
-                        "trial_type": lab,
-                        "count": str(int(st.get("count", 0.0))),
-                        "total_duration_sec": f"{d:.6g}",
-                        "fraction": (f"{frac:.3%}" if math.isfinite(frac) else ""),
-                        "description": desc,
-                    }
+                    (
+                        lab,
+                        str(int(st.get("count", 0.0))),
+                        f"{d:.6g}",
+                        (f"{frac:.3%}" if math.isfinite(frac) else ""),
+                        desc,
+                    )
                 )
             # Sort by known categories then by duration desc.
             summary_rows.sort(
-                key=lambda r: (_evt_sort_key(r.get("trial_type", "")), -_try_float(r.get("total_duration_sec", "")))
+                key=lambda r: (_evt_sort_key(r[0]), -_try_float(r[2]))
             )
             ev_summary_html = _build_table(
                 ["trial_type", "count", "total_duration_sec", "fraction", "description"],
@@ -778,12 +1037,25 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 max_rows=len(summary_rows) if summary_rows else 0,
             )
 
-            ev_svg = _svg_events_timeline(parsed_events, title="Derived events timeline (BIDS-style)")
+            if not args.no_svg:
+                chart_specs["events"] = (
+                    _svg_events_timeline,
+                    ([{"onset": ev["onset"], "duration": ev["duration"], "label": ev["label"]} for ev in parsed_events],),
+                    {"title": "Derived events timeline (BIDS-style)"},
+                )
 
-        ev_sidecar_block = ""
         if isinstance(ev_sidecar, dict):
             ev_sidecar_block = _pretty_json_snippet(ev_sidecar, pick=["onset", "duration", "trial_type", "sample", "value"]) or ""
 
+    charts = _render_svgs(chart_specs, jobs=args.jobs) if not args.no_svg else {}
+    chart_metric = charts.get("metric", "")
+    chart_rr = charts.get("rr", "")
+    chart_z = charts.get("z", "")
+    chart_feedback = charts.get("feedback", "")
+    ev_svg = charts.get("events", "")
+
+    derived_events_block = ""
+    if events_table_path:
         err_html = f'<div class="note warn">Could not parse derived events for summary/timeline: {_e(parse_error)}</div>' if parse_error else ""
 
         derived_events_block = f"""<div class="card">
@@ -881,7 +1153,11 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         if c and c in headers and c not in table_cols:
             table_cols.append(c)
 
-    table_html = _build_table(table_cols, [d["_row"] for d in parsed], max_rows=args.table_rows) if table_cols else ""
+    # Pick the sampled rows up front so only those rows are ever touched while
+    # writing the table (they are passed to _write_table as-is).
+    table_rows: List[Dict[str, str]] = []
+    if table_cols:
+        table_rows = [parsed[i]["_row"] for i in _downsample_indices(len(parsed), args.table_rows)]
 
     # Helpful "columns used" summary.
     used = {
@@ -904,83 +1180,29 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         "metric_z_ref": cols.metric_z_ref or "(missing)",
         "threshold_z_ref": cols.threshold_z_ref or "(missing)",
     }
-
+    used_html = "".join(_USED_ROW_TMPL.format(k=_USED_LABELS_ESC[k], v=_e(v)) for k, v in used.items())
 
     # Optional phase stats table (requires a non-empty phase column).
     phase_stats_block = ""
-    if phase_all is not None and any((p or "").strip() for p in phase_all):
+    # Phase columns hold a handful of distinct labels; check and normalize those
+    # instead of walking every frame.
+    phase_labels = set(phase_all) if phase_all is not None else set()
+    if any((p or "").strip() for p in phase_labels):
         # Estimate dt from the median positive delta of t_end_sec (robust to a few outliers).
-        diffs: List[float] = []
-        for i in range(1, len(t_all)):
-            a = float(t_all[i - 1])
-            b = float(t_all[i])
-            d = b - a
-            if math.isfinite(d) and d > 0.0:
-                diffs.append(d)
-        diffs.sort()
-        dt_est = diffs[len(diffs) // 2] if diffs else (duration / max(1, len(t_all)))
+        # The deltas are computed once and reused as per-frame dt weights below.
+        deltas = [float(b) - float(a) for a, b in zip(t_all, t_all[1:])]
+        positive = [d for d in deltas if math.isfinite(d) and d > 0.0]
+        dt_est = statistics.median_high(positive) if positive else (duration / max(1, len(t_all)))
         if not (math.isfinite(dt_est) and dt_est > 0.0):
             dt_est = 0.0
 
-        buckets: Dict[str, Dict[str, float]] = {}
-
-        def _norm_phase(p: str) -> str:
-            s = (p or "").strip().lower()
-            if not s:
-                return "other"
-            if s in ("baseline", "train", "rest"):
-                return s
-            # common aliases
-            if s.startswith("base"):
-                return "baseline"
-            if s.startswith("tr"):
-                return "train"
-            if s.startswith("re"):
-                return "rest"
-            return "other"
-
-        for i, p in enumerate(phase_all):
-            key = _norm_phase(str(p))
-            b = buckets.get(key)
-            if b is None:
-                b = {
-                    "frames": 0.0,
-                    "seconds": 0.0,
-                    "reward_sum": 0.0,
-                    "artifact_sum": 0.0,
-                    "metric_sum": 0.0,
-                    "metric_n": 0.0,
-                    "thr_sum": 0.0,
-                    "thr_n": 0.0,
-                }
-                buckets[key] = b
-
-            b["frames"] += 1.0
-
-            # dt weight (best-effort): use delta to previous frame, fallback to dt_est.
-            dt = dt_est
-            if i > 0:
-                d = float(t_all[i]) - float(t_all[i - 1])
-                if math.isfinite(d) and d > 0.0:
-                    dt = d
-            if math.isfinite(dt) and dt > 0.0:
-                b["seconds"] += dt
-
-            if i < len(reward_all):
-                b["reward_sum"] += float(reward_all[i])
-
-            if artifact_all is not None and i < len(artifact_all):
-                b["artifact_sum"] += float(artifact_all[i])
-
-            mv = metric_all[i] if i < len(metric_all) else math.nan
-            if math.isfinite(mv):
-                b["metric_sum"] += float(mv)
-                b["metric_n"] += 1.0
-
-            tv = thr_all[i] if i < len(thr_all) else math.nan
-            if math.isfinite(tv):
-                b["thr_sum"] += float(tv)
-                b["thr_n"] += 1.0
+        # Group frames by phase code (see _PHASE_KEYS) in one columnar pass.
+        code_of = {p: _PHASE_KEYS.index(_norm_phase(str(p))) for p in phase_labels}
+        codes = [code_of[p] for p in phase_all]
+        # dt weight (best-effort): use delta to previous frame, fallback to dt_est.
+        dts = [dt_est]
+        dts.extend(d if (math.isfinite(d) and d > 0.0) else dt_est for d in deltas)
+        sums = _phase_bucket_sums(codes, dts, reward_all, artifact_all, metric_all, thr_all)
 
         headers_phase = [
             "phase",
@@ -991,42 +1213,25 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             "metric_mean",
             "threshold_mean",
         ]
-        rows_phase: List[Dict[str, str]] = []
-        for key in ["baseline", "train", "rest", "other"]:
-            b = buckets.get(key)
-            if not b:
-                continue
-            frames = int(b.get("frames", 0.0) or 0)
-            sec = float(b.get("seconds", 0.0) or 0.0)
-            reward_frac_p = (float(b.get("reward_sum", 0.0) or 0.0) / frames) if frames > 0 else math.nan
-            artifact_frac_p = (
-                (float(b.get("artifact_sum", 0.0) or 0.0) / frames) if (artifact_all is not None and frames > 0) else math.nan
-            )
-            m_mean = (
-                (float(b.get("metric_sum", 0.0) or 0.0) / float(b.get("metric_n", 0.0) or 0.0))
-                if float(b.get("metric_n", 0.0) or 0.0) > 0.0
-                else math.nan
-            )
-            t_mean = (
-                (float(b.get("thr_sum", 0.0) or 0.0) / float(b.get("thr_n", 0.0) or 0.0))
-                if float(b.get("thr_n", 0.0) or 0.0) > 0.0
-                else math.nan
-            )
-
+        rows_phase: List[Tuple[str, ...]] = []
+        for key, frames, sec, reward_frac_p, artifact_frac_p, m_mean, t_mean in _phase_bucket_stats(
+            sums, has_artifact=artifact_all is not None
+        ):
+            # Cells in headers_phase order.
             rows_phase.append(
-                {
-                    "phase": key,
-                    "frames": str(frames),
-                    "seconds": f"{sec:.3f}" if math.isfinite(sec) else "N/A",
-                    "reward_frac": f"{reward_frac_p:.3%}" if math.isfinite(reward_frac_p) else "N/A",
-                    "artifact_frac": (
+                (
+                    key,
+                    str(frames),
+                    f"{sec:.3f}" if math.isfinite(sec) else "N/A",
+                    f"{reward_frac_p:.3%}" if math.isfinite(reward_frac_p) else "N/A",
+                    (
                         f"{artifact_frac_p:.3%}"
                         if math.isfinite(artifact_frac_p)
                         else ("(n/a)" if artifact_all is None else "N/A")
                     ),
-                    "metric_mean": f"{m_mean:.6g}" if math.isfinite(m_mean) else "N/A",
-                    "threshold_mean": f"{t_mean:.6g}" if math.isfinite(t_mean) else "N/A",
-                }
+                    f"{m_mean:.6g}" if math.isfinite(m_mean) else "N/A",
+                    f"{t_mean:.6g}" if math.isfinite(t_mean) else "N/A",
+                )
             )
 
         if rows_phase:
@@ -1038,67 +1243,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 f'<div class="table-wrap">{phase_table_html}</div></div>'
             )
 
-    css = BASE_CSS + r"""
-
-/* NF report specifics */
-.kv { display: grid; grid-template-columns: 260px 1fr; gap: 6px 12px; font-size: 13px; }
-.kv div:nth-child(odd) { color: var(--muted); }
-
-.ts { width: 100%; height: auto; }
-.evt-ts { width: 100%; height: auto; }
-.frame { fill: #0c131f; stroke: #20324a; stroke-width: 1; }
-.grid { stroke: rgba(255,255,255,0.06); stroke-width: 1; }
-.evt-grid { stroke: rgba(255,255,255,0.04); stroke-width: 1; }
-
-.ts-title { fill: #dce7ff; font-weight: 700; font-size: 13px; }
-.axis-label { fill: var(--muted); font-size: 12px; }
-.evt-label { fill: #dce7ff; font-size: 12px; opacity: 0.9; }
-
-.line-metric { fill: none; stroke: var(--accent); stroke-width: 2; opacity: 0.95; }
-.line-metricraw { fill: none; stroke: rgba(143,183,255,0.45); stroke-width: 1.5; opacity: 0.85; stroke-dasharray: 4 4; }
-.line-thr { fill: none; stroke: #ffd37f; stroke-width: 2; opacity: 0.9; stroke-dasharray: 6 4; }
-.line-thrdes { fill: none; stroke: rgba(255,211,127,0.55); stroke-width: 1.5; opacity: 0.85; stroke-dasharray: 2 6; }
-.line-rr { fill: none; stroke: #8cffaa; stroke-width: 2; opacity: 0.95; }
-.line-metricz { fill: none; stroke: #c6a8ff; stroke-width: 2; opacity: 0.95; }
-.line-thrz { fill: none; stroke: #ffd37f; stroke-width: 2; opacity: 0.85; stroke-dasharray: 6 4; }
-.line-feedback { fill: none; stroke: #8fb7ff; stroke-width: 2; opacity: 0.95; }
-.line-rewardvalue { fill: none; stroke: #ffb86b; stroke-width: 2; opacity: 0.95; }
-
-.line-metric-legend { fill: var(--accent); }
-.line-metricraw-legend { fill: rgba(143,183,255,0.45); }
-.line-thr-legend { fill: #ffd37f; }
-.line-thrdes-legend { fill: rgba(255,211,127,0.55); }
-.line-rr-legend { fill: #8cffaa; }
-.line-metricz-legend { fill: #c6a8ff; }
-.line-thrz-legend { fill: #ffd37f; }
-.line-feedback-legend { fill: #8fb7ff; }
-.line-rewardvalue-legend { fill: #ffb86b; }
-
-.shade-reward { fill: rgba(127, 179, 255, 0.14); }
-.shade-artifact { fill: rgba(255, 120, 150, 0.14); }
-
-.phase-baseline { fill: rgba(200, 200, 200, 0.12); }
-.phase-train { fill: rgba(127, 179, 255, 0.22); }
-.phase-rest { fill: rgba(255, 211, 127, 0.18); }
-.phase-other { fill: rgba(155, 176, 208, 0.14); }
-
-.legend-text { fill: #dce7ff; font-size: 12px; }
-.legend-reward { fill: rgba(127, 179, 255, 0.55); }
-.legend-artifact { fill: rgba(255, 120, 150, 0.6); }
-
-/* Derived events timeline */
-.evt { stroke: rgba(255,255,255,0.10); stroke-width: 1; }
-.evt-baseline { fill: rgba(200,200,200,0.22); }
-.evt-train { fill: rgba(127, 179, 255, 0.30); }
-.evt-rest { fill: rgba(255, 211, 127, 0.26); }
-.evt-reward { fill: rgba(127, 179, 255, 0.45); }
-.evt-artifact { fill: rgba(255, 120, 150, 0.42); }
-.evt-nf { fill: rgba(155, 176, 208, 0.28); }
-.evt-other { fill: rgba(155, 176, 208, 0.20); }
-
-.warn { color: var(--warn); }
-"""
-
+    css = _REPORT_CSS
     js = JS_SORT_TABLE
 
     links: List[str] = [f'<a href="{_e(src_rel)}"><code>{_e(src_rel)}</code></a>']
@@ -1111,13 +1256,23 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if events_json_rel:
         links.append(f'<a href="{_e(events_json_rel)}"><code>{_e(events_json_rel)}</code></a>')
 
-    html_doc = f"""<!doctype html>
+    os.makedirs(os.path.dirname(os.path.abspath(html_path)) or ".", exist_ok=True)
+    # Stream the document section by section so the sampled table (the
+    # largest fragment) is never materialized as one string. The file is only
+    # put in place once complete (a failed render leaves no partial report).
+    with _atomic_output(html_path) as tmp_path, open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        w = f.write
+        w(f"""<!doctype html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>{_e(args.title)}</title>
-<style>{css}</style>
+<style>""")
+        # Static stylesheet/script go straight to the buffered writer rather
+        # than being copied into the surrounding f-strings.
+        w(css)
+        w(f"""</style>
 </head>
 <body>
 <header>
@@ -1133,7 +1288,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     </div>
   </div>
 
-  <div class="card">
+""")
+        w(f"""  <div class="card">
     <h2>Quick stats</h2>
     <div class="kv">
       <div>Frames (rows)</div><div>{len(parsed)}</div>
@@ -1151,15 +1307,18 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
   {phase_stats_block}
 
-  <div class="card">
+""")
+        w(f"""  <div class="card">
     <h2>Columns used</h2>
     <div class="note">This renderer is flexible; it will use these columns when present.</div>
     <div class="kv">
-      {''.join(f'<div>{_e(k)}</div><div><code>{_e(v)}</code></div>' for k, v in used.items())}
+      {used_html}
     </div>
   </div>
 
-  <div class="card">
+""")
+        if chart_metric:
+            w(f"""  <div class="card">
     <h2>Timeline</h2>
     {chart_metric}
     <div class="note">
@@ -1168,13 +1327,15 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     </div>
   </div>
 
-  {f'<div class="card"><h2>Reward rate</h2>{chart_rr}</div>' if chart_rr else ''}
+""")
+        w(f"""  {f'<div class="card"><h2>Reward rate</h2>{chart_rr}</div>' if chart_rr else ''}
   {f'<div class="card"><h2>Z-scores</h2>{chart_z}</div>' if chart_z else ''}
   {f'<div class="card"><h2>Continuous feedback</h2>{chart_feedback}</div>' if chart_feedback else ''}
 
   {derived_events_block}
 
-  <div class="card">
+""")
+        w("""  <div class="card">
     <h2>Sampled rows (sortable)</h2>
     <div class="note">Downsampled view of the CSV to keep the report lightweight. Click any header to sort.</div>
     <div class="table-filter">
@@ -1183,7 +1344,14 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         <button type="button" onclick="downloadTableCSV(this, 'nf_feedback_table_filtered.csv', true)">Download CSV</button>
         <span class="filter-count muted"></span>
       </div>
-      <div class="table-wrap">{table_html or '<div class="note">No table columns detected.</div>'}</div>
+      <div class="table-wrap">""")
+        if table_cols:
+            # downsample_indices may keep max_rows + 1 rows (it always keeps the
+            # last one); don't thin the sample a second time.
+            _write_table(w, table_cols, table_rows, max_rows=len(table_rows) if args.table_rows > 0 else 0)
+        else:
+            w('<div class="note">No table columns detected.</div>')
+        w(f"""</div>
     </div>
   </div>
 
@@ -1203,14 +1371,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     Tip: open this file in a browser. It is self-contained (no network requests).
   </div>
 </main>
-<script>{js}</script>
+<script>""")
+        w(js)
+        w("""</script>
 </body>
 </html>
-"""
-
-    os.makedirs(os.path.dirname(os.path.abspath(html_path)) or ".", exist_ok=True)
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html_doc)
+""")
 
     print(f"Wrote: {html_path}")
 
@@ -17,6 +17,10 @@ Inputs (per session folder):
 Outputs:
   - nf_sessions_dashboard.html (default output name; configurable via --out)
   - nf_sessions_dashboard_index.json (optional; when --json-index is provided)
+  - <session>/.nf_stats_cache.json (summary cache keyed on nf_feedback.csv
+    mtime/size; disable with --no-cache)
+  - <session>/nf_feedback_report.html (rendered when missing or older than the
+    session inputs; all re-rendered with --force; none with --no-generate-reports)
 
 Typical usage:
 
@@ -38,26 +42,32 @@ from __future__ import annotations
 import argparse
 import csv
 import datetime as _dt
+import functools
 import json
 import math
+import operator
 import os
+import statistics
 import sys
-import webbrowser
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import asdict, dataclass
+from itertools import compress, islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 # Reuse the shared theme + table JS.
 try:
     from report_common import (
         BASE_CSS,
         JS_SORT_TABLE,
+        atomic_output,
+        cell_float as _cell_float,
         e as _e,
         finite_minmax,
         posix_relpath,
         read_json_if_exists,
+        report_is_fresh,
         try_bool_int,
-        try_float,
         utc_now_iso,
     )
 except Exception as _exc:  # pragma: no cover
@@ -69,8 +79,12 @@ except Exception as _exc:  # pragma: no cover
 _JSON_INDEX_SCHEMA = "https://raw.githubusercontent.com/masterblaster1999/qeeg-neurofeedback-opensoftware/main/schemas/qeeg_nf_sessions_dashboard_index.schema.json"
 _JSON_INDEX_SCHEMA_VERSION = 1
 
+# Per-session cache of _summarize_nf_feedback() results (see --no-cache).
+_STATS_CACHE_NAME = ".nf_stats_cache.json"
+_STATS_CACHE_VERSION = 1
 
-@dataclass
+
+@dataclass(frozen=True)
 class _Cols:
     t: str
     metric: str
@@ -125,6 +139,10 @@ class _Session:
     metric_spec: str
     report_html: Optional[Path]
     note: str
+    # report_html exists but is older than one of its inputs.
+    report_stale: bool = False
+    # timestamp_utc as epoch seconds (None when unparseable); parsed once at load.
+    epoch: Optional[float] = None
 
 
 def _mtime_iso_utc(path: Path) -> str:
@@ -135,8 +153,12 @@ def _mtime_iso_utc(path: Path) -> str:
         return ""
 
 
-def _pick_col(headers: Sequence[str], candidates: Sequence[str], *, required: bool = False) -> Optional[str]:
-    hset = {str(h).strip().lower(): str(h).strip() for h in headers if str(h).strip() != ""}
+def _header_map(headers: Sequence[str]) -> Dict[str, str]:
+    """Map lowercased header names to the header as written (built once per file)."""
+    return {str(h).strip().lower(): str(h).strip() for h in headers if str(h).strip() != ""}
+
+
+def _pick_from(hset: Dict[str, str], candidates: Sequence[str], *, required: bool = False) -> Optional[str]:
     for cand in candidates:
         c = str(cand).strip().lower()
         if c in hset:
@@ -146,16 +168,20 @@ def _pick_col(headers: Sequence[str], candidates: Sequence[str], *, required: bo
     return None
 
 
-def _detect_cols(headers: Sequence[str]) -> _Cols:
-    t = _pick_col(headers, ["t_end_sec", "t_sec", "t", "time_sec", "time_s", "time"], required=True) or "t_end_sec"
-    metric = _pick_col(headers, ["metric", "value", "score"], required=True) or "metric"
-    threshold = _pick_col(headers, ["threshold", "thr"], required=True) or "threshold"
-    reward = _pick_col(headers, ["reward", "reward_on", "reward_state", "reinforce"])
-    reward_rate = _pick_col(headers, ["reward_rate", "rr", "reinforcement_rate"])
-    artifact = _pick_col(headers, ["artifact", "artifact_on", "artifact_state"])
-    artifact_ready = _pick_col(headers, ["artifact_ready", "artifact_gate_ready", "gate_ready"])
-    bad_channels = _pick_col(headers, ["bad_channels", "bad_channels_count", "n_bad_channels", "n_bad_channel"])
-    phase = _pick_col(headers, ["phase", "block", "state"])
+@functools.lru_cache(maxsize=256)
+def _detect_cols(headers: Tuple[str, ...]) -> _Cols:
+    # Memoized per header row: sessions recorded by the same tool share it, so
+    # column detection runs once per dashboard instead of once per session.
+    h = _header_map(headers)
+    t = _pick_from(h, ["t_end_sec", "t_sec", "t", "time_sec", "time_s", "time"], required=True) or "t_end_sec"
+    metric = _pick_from(h, ["metric", "value", "score"], required=True) or "metric"
+    threshold = _pick_from(h, ["threshold", "thr"], required=True) or "threshold"
+    reward = _pick_from(h, ["reward", "reward_on", "reward_state", "reinforce"])
+    reward_rate = _pick_from(h, ["reward_rate", "rr", "reinforcement_rate"])
+    artifact = _pick_from(h, ["artifact", "artifact_on", "artifact_state"])
+    artifact_ready = _pick_from(h, ["artifact_ready", "artifact_gate_ready", "gate_ready"])
+    bad_channels = _pick_from(h, ["bad_channels", "bad_channels_count", "n_bad_channels", "n_bad_channel"])
+    phase = _pick_from(h, ["phase", "block", "state"])
     return _Cols(
         t=t,
         metric=metric,
@@ -175,171 +201,170 @@ def _safe_mean(sum_v: float, n: int) -> float:
     return sum_v / float(n)
 
 
-def _median(vals: List[float]) -> float:
-    vv = [v for v in vals if math.isfinite(v)]
-    if not vv:
-        return math.nan
-    vv.sort()
-    m = len(vv) // 2
-    if len(vv) % 2 == 1:
-        return float(vv[m])
-    return 0.5 * (float(vv[m - 1]) + float(vv[m]))
+def _col_stats(vals: Sequence[float]) -> Tuple[float, float, float, float]:
+    """Return (mean, min, max, last) of already-finite values (NaN when empty)."""
+    if not vals:
+        return math.nan, math.nan, math.nan, math.nan
+    return _safe_mean(sum(vals), len(vals)), min(vals), max(vals), vals[-1]
+
+
+def _column(rows: Sequence[Sequence[str]], i: int) -> List[str]:
+    """Return column i of csv.reader rows ("" where a row is short, like DictReader's restval)."""
+    try:
+        return [row[i] for row in rows]
+    except IndexError:
+        return [row[i] if i < len(row) else "" for row in rows]
+
+
+def _floats(values: Sequence[str]) -> List[float]:
+    """try_float() over a column, converting in one bulk map(float) when every cell parses."""
+    try:
+        return list(map(float, values))
+    except ValueError:
+        return list(map(_cell_float, values))
+
+
+def _count_true(values: List[str]) -> int:
+    """Sum of try_bool_int() over a column, parsing each distinct cell value once.
+
+    Flag columns hold a handful of distinct spellings ("0"/"1"), so the truthy
+    ones are tallied with list.count() (a C-level scan, no hashing); columns
+    with many distinct cells fall back to one Counter pass.
+    """
+    distinct = set(values)
+    if len(distinct) <= 8:
+        return sum(values.count(v) for v in distinct if try_bool_int(v))
+    return sum(c for v, c in Counter(values).items() if try_bool_int(v))
 
 
 def _summarize_nf_feedback(csv_path: Path) -> Tuple[_SessionStats, str]:
-    """Return (_SessionStats, note)."""
+    """Return (_SessionStats, note).
+
+    Only the detected columns are extracted (by index, without a dict per row),
+    converted in bulk (see _floats), and each statistic is a columnar reduction
+    using C-level builtins (sum/min/max) over the finite values of that column.
+    """
 
-    with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f, restkey="__extra__", restval="")
-        if not r.fieldnames:
+    with csv_path.open("r", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+        if not fieldnames:
             raise RuntimeError("missing header row")
-        headers = [str(h or "").strip() for h in r.fieldnames if str(h or "").strip() != ""]
-        cols = _detect_cols(headers)
-
-        # Streaming stats.
-        n = 0
-        t_first = math.nan
-        t_last = math.nan
-        prev_t = math.nan
-        dt_samples: List[float] = []
-
-        reward_sum = 0
-        artifact_sum = 0
-        artifact_ready_sum = 0
-
-        metric_sum = 0.0
-        metric_n = 0
-        metric_min = math.inf
-        metric_max = -math.inf
-        metric_last = math.nan
-
-        thr_sum = 0.0
-        thr_n = 0
-        thr_min = math.inf
-        thr_max = -math.inf
-        thr_last = math.nan
-
-        rr_sum = 0.0
-        rr_n = 0
-        rr_last = math.nan
-
-        bad_sum = 0.0
-        bad_n = 0
-
-        phase_counts: Dict[str, int] = {}
-
-        for row in r:
-            tt = try_float(row.get(cols.t, ""))
-            if not math.isfinite(tt):
-                continue
+        names = [str(h or "").strip() for h in fieldnames]
+        headers = [h for h in names if h != ""]
+        cols = _detect_cols(tuple(headers))
+        # Later duplicates win, matching csv.DictReader.
+        col_idx = {h: i for i, h in enumerate(names) if h != ""}
+        rows = list(filter(None, reader))  # drop blank lines
+
+    isfinite = math.isfinite
+
+    # Frames without a finite time value are skipped entirely (one boolean mask,
+    # applied with itertools.compress only when something must be dropped).
+    t_vals = _floats(_column(rows, col_idx[cols.t]))
+    t_ok = list(map(isfinite, t_vals))
+    if not all(t_ok):
+        rows = list(compress(rows, t_ok))
+        t_vals = list(compress(t_vals, t_ok))
+    n = len(t_vals)
+    if n <= 0:
+        raise RuntimeError("no valid rows (time column missing/NaN?)")
 
-            if not math.isfinite(t_first):
-                t_first = tt
-            t_last = tt
-
-            if math.isfinite(prev_t):
-                dt = tt - prev_t
-                if math.isfinite(dt) and dt > 0 and dt < 60 and len(dt_samples) < 600:
-                    dt_samples.append(float(dt))
-            prev_t = tt
-
-            n += 1
-
-            mv = try_float(row.get(cols.metric, ""))
-            if math.isfinite(mv):
-                metric_sum += mv
-                metric_n += 1
-                metric_min = min(metric_min, mv)
-                metric_max = max(metric_max, mv)
-                metric_last = mv
-
-            tv = try_float(row.get(cols.threshold, ""))
-            if math.isfinite(tv):
-                thr_sum += tv
-                thr_n += 1
-                thr_min = min(thr_min, tv)
-                thr_max = max(thr_max, tv)
-                thr_last = tv
-
-            if cols.reward:
-                reward_sum += int(try_bool_int(row.get(cols.reward, ""), default=0))
-            if cols.artifact:
-                artifact_sum += int(try_bool_int(row.get(cols.artifact, ""), default=0))
-            if cols.artifact_ready:
-                artifact_ready_sum += int(try_bool_int(row.get(cols.artifact_ready, ""), default=0))
-
-            if cols.reward_rate:
-                rv = try_float(row.get(cols.reward_rate, ""))
-                if math.isfinite(rv):
-                    rr_sum += rv
-                    rr_n += 1
-                    rr_last = rv
-
-            if cols.bad_channels:
-                bv = try_float(row.get(cols.bad_channels, ""))
-                if math.isfinite(bv):
-                    bad_sum += bv
-                    bad_n += 1
-
-            if cols.phase:
-                ph = str(row.get(cols.phase, "") or "").strip()
-                if ph:
-                    phase_counts[ph] = phase_counts.get(ph, 0) + 1
-
-        if n <= 0:
-            raise RuntimeError("no valid rows (time column missing/NaN?)")
-
-        duration = float(t_last) if math.isfinite(t_last) else math.nan
-        dt_med = _median(dt_samples)
-
-        reward_frac = (reward_sum / float(n)) if (n > 0 and cols.reward) else math.nan
-        artifact_frac = (artifact_sum / float(n)) if (n > 0 and cols.artifact) else math.nan
-        artifact_ready_frac = (artifact_ready_sum / float(n)) if (n > 0 and cols.artifact_ready) else math.nan
-
-        metric_mean = _safe_mean(metric_sum, metric_n)
-        thr_mean = _safe_mean(thr_sum, thr_n)
-        rr_mean = _safe_mean(rr_sum, rr_n)
-        bad_mean = _safe_mean(bad_sum, bad_n)
-
-        # Normalize min/max when missing.
-        if metric_n <= 0:
-            metric_min, metric_max = math.nan, math.nan
-        if thr_n <= 0:
-            thr_min, thr_max = math.nan, math.nan
-
-        note_parts: List[str] = []
-        if cols.reward is None:
-            note_parts.append("no reward column")
-        if cols.artifact is None:
-            note_parts.append("no artifact column")
-        if cols.phase is None:
-            note_parts.append("no phase column")
-        note = "; ".join(note_parts)
-
-        return (
-            _SessionStats(
-                n_frames=n,
-                duration_sec=duration,
-                dt_median_sec=dt_med,
-                reward_frac=reward_frac,
-                artifact_frac=artifact_frac,
-                artifact_ready_frac=artifact_ready_frac,
-                metric_mean=metric_mean,
-                metric_min=float(metric_min) if math.isfinite(metric_min) else math.nan,
-                metric_max=float(metric_max) if math.isfinite(metric_max) else math.nan,
-                metric_last=metric_last,
-                threshold_mean=thr_mean,
-                threshold_min=float(thr_min) if math.isfinite(thr_min) else math.nan,
-                threshold_max=float(thr_max) if math.isfinite(thr_max) else math.nan,
-                threshold_last=thr_last,
-                reward_rate_mean=rr_mean,
-                reward_rate_last=rr_last,
-                bad_channels_mean=bad_mean,
-                phase_counts=phase_counts,
-                derived_durations={},
-            ),
-            note,
-        )
+    def finite(col: str) -> List[float]:
+        return list(filter(isfinite, _floats(_column(rows, col_idx[col]))))
+
+    def count_true(col: Optional[str]) -> int:
+        return _count_true(_column(rows, col_idx[col])) if col else 0
+
+    t_last = t_vals[-1]
+    # Median frame interval from the first 600 plausible deltas (0 < dt < 60 s).
+    deltas = map(operator.sub, islice(t_vals, 1, None), t_vals)
+    dt_samples = list(islice((dt for dt in deltas if 0 < dt < 60), 600))
+
+    metric_mean, metric_min, metric_max, metric_last = _col_stats(finite(cols.metric))
+    thr_mean, thr_min, thr_max, thr_last = _col_stats(finite(cols.threshold))
+    rr_mean, _, _, rr_last = _col_stats(finite(cols.reward_rate) if cols.reward_rate else [])
+    bad_mean = _col_stats(finite(cols.bad_channels) if cols.bad_channels else [])[0]
+
+    reward_sum = count_true(cols.reward)
+    artifact_sum = count_true(cols.artifact)
+    artifact_ready_sum = count_true(cols.artifact_ready)
+
+    # Counter keeps first-seen order and counts in C.
+    phase_counts: Dict[str, int] = (
+        dict(Counter(filter(None, map(str.strip, _column(rows, col_idx[cols.phase]))))) if cols.phase else {}
+    )
+
+    duration = float(t_last)
+    dt_med = statistics.median(dt_samples) if dt_samples else math.nan
+
+    reward_frac = (reward_sum / float(n)) if cols.reward else math.nan
+    artifact_frac = (artifact_sum / float(n)) if cols.artifact else math.nan
+    artifact_ready_frac = (artifact_ready_sum / float(n)) if cols.artifact_ready else math.nan
+
+    note_parts: List[str] = []
+    if cols.reward is None:
+        note_parts.append("no reward column")
+    if cols.artifact is None:
+        note_parts.append("no artifact column")
+    if cols.phase is None:
+        note_parts.append("no phase column")
+    note = "; ".join(note_parts)
+
+    return (
+        _SessionStats(
+            n_frames=n,
+            duration_sec=duration,
+            dt_median_sec=dt_med,
+            reward_frac=reward_frac,
+            artifact_frac=artifact_frac,
+            artifact_ready_frac=artifact_ready_frac,
+            metric_mean=metric_mean,
+            metric_min=metric_min,
+            metric_max=metric_max,
+            metric_last=metric_last,
+            threshold_mean=thr_mean,
+            threshold_min=thr_min,
+            threshold_max=thr_max,
+            threshold_last=thr_last,
+            reward_rate_mean=rr_mean,
+            reward_rate_last=rr_last,
+            bad_channels_mean=bad_mean,
+            phase_counts=phase_counts,
+            derived_durations={},
+        ),
+        note,
+    )
+
+
+def _summarize_nf_feedback_cached(csv_path: Path, *, use_cache: bool) -> Tuple[_SessionStats, str]:
+    """_summarize_nf_feedback() backed by a sidecar cache in the session folder.
+
+    The cache is keyed on the CSV's mtime and size, so unchanged sessions are not
+    re-parsed on the next render. Cache problems (e.g., read-only folders) are
+    ignored and only fall back to parsing.
+    """
+    if not use_cache:
+        return _summarize_nf_feedback(csv_path)
+
+    st = csv_path.stat()
+    key: Dict[str, Any] = {"version": _STATS_CACHE_VERSION, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    cache_path = csv_path.parent / _STATS_CACHE_NAME
+    cached = read_json_if_exists(str(cache_path))
+    if cached is not None and all(cached.get(k) == v for k, v in key.items()):
+        try:
+            return _SessionStats(**cached["stats"]), str(cached.get("note") or "")
+        except Exception:
+            pass
+
+    stats, note = _summarize_nf_feedback(csv_path)
+    try:
+        tmp = cache_path.with_name(f"{_STATS_CACHE_NAME}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(dict(key, stats=asdict(stats), note=note)), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except Exception:
+        pass
+    return stats, note
 
 
 def _find_derived_events(outdir: Path) -> Optional[Path]:
@@ -357,30 +382,42 @@ def _find_derived_events(outdir: Path) -> Optional[Path]:
 
 
 def _summarize_derived_events(path: Path) -> Dict[str, float]:
-    """Return total duration per trial_type (or legacy text column)."""
+    """Return total duration per trial_type (or legacy text column).
 
-    try:
-        # TSV/CSV handled by the shared reader.
-        from report_common import read_csv_dict  # local import to keep top-level small
+    Only the label and duration columns are extracted (by index, without a dict
+    per row); durations are converted in bulk (see _floats).
+    """
 
-        headers, rows = read_csv_dict(str(path))
+    # BIDS-ish derived events are usually TSV; same dialect rule as read_csv_dict.
+    dialect = csv.excel_tab if path.suffix.lower() == ".tsv" else csv.excel
+    try:
+        with path.open("r", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+            reader = csv.reader(f, dialect=dialect)
+            fieldnames = next(reader, None)
+            if not fieldnames:
+                return {}
+            names = [str(h).strip() for h in fieldnames]
+            headers = [h for h in names if h != ""]
+
+            # BIDS columns: onset, duration, trial_type
+            hmap = _header_map(headers)
+            trial = _pick_from(hmap, ["trial_type", "trial", "type", "text"])
+            dur = _pick_from(hmap, ["duration", "duration_sec", "dur", "len_sec"])
+            if not trial or not dur:
+                return {}
+
+            col_idx = {h: i for i, h in enumerate(names) if h != ""}
+            rows = list(filter(None, reader))  # drop blank lines
     except Exception:
         return {}
 
-    # BIDS columns: onset, duration, trial_type
-    trial = _pick_col(headers, ["trial_type", "trial", "type", "text"], required=False)
-    dur = _pick_col(headers, ["duration", "duration_sec", "dur", "len_sec"], required=False)
-
-    if not trial or not dur:
-        return {}
-
+    isfinite = math.isfinite
     out: Dict[str, float] = {}
-    for row in rows:
-        label = str(row.get(trial, "") or "").strip()
-        dv = try_float(row.get(dur, ""))
-        if not (label and math.isfinite(dv) and dv >= 0):
-            continue
-        out[label] = out.get(label, 0.0) + float(dv)
+    out_get = out.get
+    labels = map(str.strip, _column(rows, col_idx[trial]))
+    for label, dv in zip(labels, _floats(_column(rows, col_idx[dur]))):
+        if label and isfinite(dv) and dv >= 0:
+            out[label] = out_get(label, 0.0) + dv
     return out
 
 
@@ -470,44 +507,67 @@ def _parse_iso_to_epoch(ts: str) -> Optional[float]:
         return None
 
 
+# Common noisy folders that are never descended into while scanning.
+_SCAN_SKIP_DIRS = frozenset({".git", "__pycache__", "build", "dist"})
+
+
 def _scan_sessions(roots: Sequence[str]) -> List[Path]:
-    out: List[Path] = []
+    # Session folders keyed by their resolved path (each found folder is
+    # resolved once; duplicates from overlapping roots collapse here).
+    found: Dict[str, Path] = {}
+    walked_roots: Set[str] = set()
 
-    def _add_dir(d: Path) -> None:
+    def _add_dir(d: str) -> None:
         try:
-            d = d.resolve()
+            key = os.path.realpath(d)
         except Exception:
-            d = Path(d)
-        if (d / "nf_feedback.csv").is_file():
-            out.append(d)
+            key = d
+        if key not in found:
+            found[key] = Path(key)
 
     for r in roots:
         p = Path(r)
         if p.is_file():
             if p.name == "nf_feedback.csv":
-                _add_dir(p.parent)
+                _add_dir(str(p.parent))
             continue
         if not p.is_dir():
             continue
+        root_key = os.path.realpath(str(p))
+        if root_key in walked_roots:
+            continue
+        walked_roots.add(root_key)
+
+        # Iterative os.scandir walk: one pass over each directory's entries, no
+        # per-directory filename lists. Like os.walk, symlinked folders are not
+        # followed and unreadable folders are skipped.
+        stack = [str(p)]
+        while stack:
+            dirpath = stack.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            if entry.name == "nf_feedback.csv":
+                                _add_dir(dirpath)
+                        elif entry.name not in _SCAN_SKIP_DIRS and not entry.is_symlink():
+                            stack.append(entry.path)
+            except OSError:
+                continue
 
-        for dirpath, dirnames, filenames in os.walk(str(p)):
-            # Skip common noisy folders.
-            dn = [d for d in dirnames if d not in (".git", "__pycache__", "build", "dist")]
-            dirnames[:] = dn
-
-            if "nf_feedback.csv" in set(filenames):
-                out.append(Path(dirpath).resolve())
-
-    # De-duplicate deterministically.
-    out = sorted(set(out), key=lambda q: str(q))
-    return out
+    # Deterministic order.
+    return [found[k] for k in sorted(found)]
 
 
-def _try_generate_nf_report(outdir: Path) -> Optional[Path]:
-    """Best-effort ensure nf_feedback_report.html exists for this session."""
+def _try_generate_nf_report(outdir: Path, force: bool = False) -> Optional[Path]:
+    """Best-effort ensure nf_feedback_report.html exists for this session (re-rendered when force)."""
 
     rep = outdir / "nf_feedback_report.html"
-    if rep.is_file():
+    if rep.is_file() and not force:
         return rep
 
     # Try in-process import (fast; no subprocess).
@@ -547,61 +607,63 @@ def _fmt_num(v: float) -> str:
     return f"{v:.6g}"
 
 
-def _svg_spark(values: Sequence[float], labels: Sequence[str], *, title: str, yfmt: str) -> str:
-    vals = [float(v) for v in values]
-    if not any(math.isfinite(v) for v in vals):
-        return ""
+_SPARK_PT_TMPL = '<circle class="spark-pt" cx="%.2f" cy="%.2f" r="4"><title>%s: %s</title></circle>'
+
+
+def _svg_sparks(series: Sequence[Tuple[str, Sequence[float], str]], labels: Sequence[str]) -> List[str]:
+    """Render one sparkline per (title, values, yfmt), all over the same x-axis.
 
+    Every series is indexed like labels (one point per session), so the x
+    positions and the escaped point labels are computed once for all charts.
+    Series with nothing to plot render as "".
+    """
     W, H = 1000, 220
     pad_l, pad_r, pad_t, pad_b = 60, 24, 26, 44
     x0, x1 = pad_l, W - pad_r
     y0, y1 = pad_t, H - pad_b
-    n = len(vals)
-    if n <= 1:
-        return ""
 
-    mn, mx = finite_minmax(vals)
-    # Slight padding so a flat line is still visible.
-    if mx - mn <= 0:
-        mx = mn + 1.0
-
-    def x(i: int) -> float:
-        return x0 + (x1 - x0) * (i / float(n - 1))
-
-    def y(v: float) -> float:
-        if not math.isfinite(v):
-            return float(y1)
-        t = (v - mn) / (mx - mn)
-        t = min(1.0, max(0.0, t))
-        return y1 - t * (y1 - y0)
-
-    # Build polyline points (skip NaNs).
-    pts: List[str] = []
-    for i, v in enumerate(vals):
-        if not math.isfinite(v):
+    isfinite = math.isfinite
+    esc_labels = [_e(lab) for lab in labels]
+    n_labels = len(esc_labels)
+    xs_by_n: Dict[int, List[float]] = {}
+
+    out: List[str] = []
+    for title, values, yfmt in series:
+        vals = [float(v) for v in values]
+        n = len(vals)
+        if n <= 1 or not any(isfinite(v) for v in vals):
+            out.append("")
             continue
-        pts.append(f"{x(i):.2f},{y(v):.2f}")
-
-    if not pts:
-        return ""
-
-    # Labels for min/max.
-    mn_lbl = yfmt.format(mn)
-    mx_lbl = yfmt.format(mx)
 
-    # Points with tooltips.
-    circles: List[str] = []
-    for i, v in enumerate(vals):
-        if not math.isfinite(v):
-            continue
-        lab = labels[i] if i < len(labels) else str(i + 1)
-        circles.append(
-            f'<circle class="spark-pt" cx="{x(i):.2f}" cy="{y(v):.2f}" r="4">'
-            f"<title>{_e(lab)}: {yfmt.format(v)}</title>"
-            "</circle>"
-        )
-
-    return f"""
+        xs = xs_by_n.get(n)
+        if xs is None:
+            xs = xs_by_n[n] = [x0 + (x1 - x0) * (i / float(n - 1)) for i in range(n)]
+
+        mn, mx = finite_minmax(vals)
+        # Slight padding so a flat line is still visible.
+        if mx - mn <= 0:
+            mx = mn + 1.0
+
+        # Polyline points and tooltip circles (skip NaNs); coordinates are
+        # computed once per point and shared by both.
+        pts: List[str] = []
+        circles: List[str] = []
+        for i, v in enumerate(vals):
+            if not isfinite(v):
+                continue
+            t = (v - mn) / (mx - mn)
+            t = min(1.0, max(0.0, t))
+            xy = (xs[i], y1 - t * (y1 - y0))
+            pts.append("%.2f,%.2f" % xy)
+            lab = esc_labels[i] if i < n_labels else str(i + 1)
+            circles.append(_SPARK_PT_TMPL % (xy[0], xy[1], lab, yfmt.format(v)))
+
+        # Labels for min/max.
+        mn_lbl = yfmt.format(mn)
+        mx_lbl = yfmt.format(mx)
+
+        out.append(
+            f"""
 <svg class=\"spark\" viewBox=\"0 0 {W} {H}\" role=\"img\" aria-label=\"{_e(title)}\">
   <rect class=\"spark-frame\" x=\"0\" y=\"0\" width=\"{W}\" height=\"{H}\" />
   <text class=\"spark-title\" x=\"{pad_l}\" y=\"18\">{_e(title)}</text>
@@ -616,84 +678,77 @@ def _svg_spark(values: Sequence[float], labels: Sequence[str], *, title: str, yf
   {''.join(circles)}
 </svg>
 """.strip()
+        )
+    return out
+
 
+# One sessions-table row. Text fields are HTML-escaped once by the caller and
+# reused for both the data-csv attribute and the visible cell; numeric fields
+# come from _fmt_num/_fmt_frac, which never emit HTML metacharacters.
+_SESSION_ROW_TMPL = (
+    "<tr>"
+    '<td data-csv="{n}"><code>{n}</code></td>'
+    '<td data-csv="{rel_dir}">{folder_link}</td>'
+    '<td data-csv="{ts}"><code>{ts}</code></td>'
+    '<td data-csv="{protocol}"><code>{protocol}</code></td>'
+    '<td data-csv="{metric_spec}"><code>{metric_spec}</code></td>'
+    '<td data-csv="{duration}"><code>{duration}</code></td>'
+    '<td data-csv="{reward}"><code>{reward}</code></td>'
+    '<td data-csv="{artifact}"><code>{artifact}</code></td>'
+    '<td data-csv="{baseline}"><code>{baseline}</code></td>'
+    '<td data-csv="{train}"><code>{train}</code></td>'
+    '<td data-csv="{rest}"><code>{rest}</code></td>'
+    '<td data-csv="{thr_mean}"><code>{thr_mean}</code></td>'
+    '<td data-csv="{metric_mean}"><code>{metric_mean}</code></td>'
+    '<td data-csv="{report_state}">{report_link}</td>'
+    '<td class="muted" data-csv="{note}">{note}</td>'
+    "</tr>"
+)
+
+
+def _write_dashboard(
+    write: Callable[[str], Any], sessions: Sequence[_Session], out_path: Path, roots: Sequence[str]
+) -> None:
+    """Stream the dashboard HTML to write() section by section.
 
-def _build_dashboard(sessions: Sequence[_Session], out_path: Path, roots: Sequence[str]) -> str:
+    Session rows are written one at a time, so the document is never assembled
+    as one string.
+    """
     now = utc_now_iso()
     out_dir = out_path.resolve().parent
 
+    # Per-session columns, extracted once and shared by the summary stats and
+    # the trend charts.
+    durations = [s.stats.duration_sec for s in sessions]
+    reward_fracs = [s.stats.reward_frac for s in sessions]
+    artifact_fracs = [s.stats.artifact_frac for s in sessions]
+    thr_means = [s.stats.threshold_mean for s in sessions]
+
     # Summary stats.
     n_sess = len(sessions)
-    tot_dur = sum(s.stats.duration_sec for s in sessions if math.isfinite(s.stats.duration_sec))
-    reward_vals = [s.stats.reward_frac for s in sessions if math.isfinite(s.stats.reward_frac)]
-    art_vals = [s.stats.artifact_frac for s in sessions if math.isfinite(s.stats.artifact_frac)]
+    tot_dur = sum(filter(math.isfinite, durations))
+    reward_vals = list(filter(math.isfinite, reward_fracs))
+    art_vals = list(filter(math.isfinite, artifact_fracs))
 
     avg_reward = sum(reward_vals) / len(reward_vals) if reward_vals else math.nan
     avg_art = sum(art_vals) / len(art_vals) if art_vals else math.nan
 
+    # Session folders relative to the dashboard; shared by chart labels and table rows.
+    rel_dirs = [posix_relpath(str(s.outdir), str(out_dir)) for s in sessions]
+
     # Trend charts (use session order).
-    labels = [f"{i+1} · {posix_relpath(str(s.outdir), str(out_dir))}" for i, s in enumerate(sessions)]
-    reward_chart = _svg_spark(
-        [s.stats.reward_frac for s in sessions],
-        labels,
-        title="Reward fraction by session",
-        yfmt="{:.1%}",
-    )
-    artifact_chart = _svg_spark(
-        [s.stats.artifact_frac for s in sessions],
-        labels,
-        title="Artifact fraction by session",
-        yfmt="{:.1%}",
-    )
-    thr_chart = _svg_spark(
-        [s.stats.threshold_mean for s in sessions],
+    labels = [f"{i+1} · {rel}" for i, rel in enumerate(rel_dirs)]
+    reward_chart, artifact_chart, thr_chart = _svg_sparks(
+        [
+            ("Reward fraction by session", reward_fracs, "{:.1%}"),
+            ("Artifact fraction by session", artifact_fracs, "{:.1%}"),
+            ("Mean threshold by session", thr_means, "{:.6g}"),
+        ],
         labels,
-        title="Mean threshold by session",
-        yfmt="{:.6g}",
     )
 
     roots_html = "".join(f"<li><code>{_e(str(Path(r).resolve()))}</code></li>" for r in roots)
 
-    # Sessions table.
-    rows: List[str] = []
-    for i, s in enumerate(sessions):
-        rel_dir = posix_relpath(str(s.outdir), str(out_dir))
-        folder_href = rel_dir
-        if folder_href and not folder_href.endswith("/"):
-            folder_href += "/"
-        folder_link = f'<a href="{_e(folder_href)}"><code>{_e(rel_dir)}</code></a>' if rel_dir else '<code>.</code>'
-
-        rep_link = '<span class="muted">missing</span>'
-        if s.report_html and s.report_html.is_file():
-            rep_href = posix_relpath(str(s.report_html), str(out_dir))
-            rep_link = f'<a href="{_e(rep_href)}">open</a>'
-
-        # Derived durations (best-effort; omit when missing).
-        dd = s.stats.derived_durations
-        base_s = dd.get("NF:Baseline", math.nan)
-        train_s = dd.get("NF:Train", math.nan)
-        rest_s = dd.get("NF:Rest", math.nan)
-
-        rows.append(
-            "<tr>"
-            f"<td data-csv=\"{i+1}\"><code>{i+1}</code></td>"
-            f"<td data-csv=\"{_e(rel_dir)}\">{folder_link}</td>"
-            f"<td data-csv=\"{_e(s.timestamp_utc)}\"><code>{_e(s.timestamp_utc)}</code></td>"
-            f"<td data-csv=\"{_e(s.protocol)}\"><code>{_e(s.protocol)}</code></td>"
-            f"<td data-csv=\"{_e(s.metric_spec)}\"><code>{_e(s.metric_spec)}</code></td>"
-            f"<td data-csv=\"{_fmt_num(s.stats.duration_sec)}\"><code>{_e(_fmt_num(s.stats.duration_sec))}</code></td>"
-            f"<td data-csv=\"{_fmt_frac(s.stats.reward_frac)}\"><code>{_e(_fmt_frac(s.stats.reward_frac))}</code></td>"
-            f"<td data-csv=\"{_fmt_frac(s.stats.artifact_frac)}\"><code>{_e(_fmt_frac(s.stats.artifact_frac))}</code></td>"
-            f"<td data-csv=\"{_fmt_num(base_s)}\"><code>{_e(_fmt_num(base_s))}</code></td>"
-            f"<td data-csv=\"{_fmt_num(train_s)}\"><code>{_e(_fmt_num(train_s))}</code></td>"
-            f"<td data-csv=\"{_fmt_num(rest_s)}\"><code>{_e(_fmt_num(rest_s))}</code></td>"
-            f"<td data-csv=\"{_fmt_num(s.stats.threshold_mean)}\"><code>{_e(_fmt_num(s.stats.threshold_mean))}</code></td>"
-            f"<td data-csv=\"{_fmt_num(s.stats.metric_mean)}\"><code>{_e(_fmt_num(s.stats.metric_mean))}</code></td>"
-            f"<td data-csv=\"{_e('ok' if s.report_html else 'missing')}\">{rep_link}</td>"
-            f"<td class=\"muted\" data-csv=\"{_e(s.note)}\">{_e(s.note)}</td>"
-            "</tr>"
-        )
-
     ths = (
         '<th onclick="sortTable(this)" aria-sort="none">#</th>'
         '<th onclick="sortTable(this)" aria-sort="none">Session folder</th>'
@@ -740,7 +795,7 @@ def _build_dashboard(sessions: Sequence[_Session], out_path: Path, roots: Sequen
 .spark-pt { fill: rgba(127,179,255,0.65); stroke: rgba(255,255,255,0.22); stroke-width: 1; }
 """
 
-    return f"""<!doctype html>
+    write(f"""<!doctype html>
 <html lang=\"en\">
 <head>
 <meta charset=\"utf-8\">
@@ -793,7 +848,51 @@ def _build_dashboard(sessions: Sequence[_Session], out_path: Path, roots: Sequen
       <div class=\"table-wrap\">
         <table class=\"data-table sticky\">
           <thead><tr>{ths}</tr></thead>
-          <tbody>{''.join(rows)}</tbody>
+          <tbody>""")
+    # Sessions table rows go straight to the writer.
+    for i, (s, rel_dir) in enumerate(zip(sessions, rel_dirs)):
+        rel_dir_esc = _e(rel_dir)
+        folder_href = rel_dir_esc
+        if folder_href and not folder_href.endswith("/"):
+            folder_href += "/"
+        folder_link = f'<a href="{folder_href}"><code>{rel_dir_esc}</code></a>' if rel_dir else '<code>.</code>'
+
+        rep_link = '<span class="muted">missing</span>'
+        if s.report_html and s.report_html.is_file():
+            # report_html is always <outdir>/<name> (see _try_generate_nf_report).
+            rep_name = s.report_html.name
+            rep_href = rep_name if rel_dir == "." else f"{rel_dir}/{rep_name}"
+            rep_link = f'<a href="{_e(rep_href)}">open</a>'
+
+        # Derived durations (best-effort; omit when missing).
+        dd = s.stats.derived_durations
+        base_s = dd.get("NF:Baseline", math.nan)
+        train_s = dd.get("NF:Train", math.nan)
+        rest_s = dd.get("NF:Rest", math.nan)
+
+        write(
+            _SESSION_ROW_TMPL.format(
+                n=i + 1,
+                rel_dir=rel_dir_esc,
+                folder_link=folder_link,
+                ts=_e(s.timestamp_utc),
+                protocol=_e(s.protocol),
+                metric_spec=_e(s.metric_spec),
+                duration=_fmt_num(s.stats.duration_sec),
+                reward=_fmt_frac(s.stats.reward_frac),
+                artifact=_fmt_frac(s.stats.artifact_frac),
+                baseline=_fmt_num(base_s),
+                train=_fmt_num(train_s),
+                rest=_fmt_num(rest_s),
+                thr_mean=_fmt_num(s.stats.threshold_mean),
+                metric_mean=_fmt_num(s.stats.metric_mean),
+                report_state="ok" if s.report_html else "missing",
+                report_link=rep_link,
+                note=_e(s.note),
+            )
+        )
+
+    write(f"""</tbody>
         </table>
       </div>
     </div>
@@ -804,7 +903,7 @@ def _build_dashboard(sessions: Sequence[_Session], out_path: Path, roots: Sequen
 <script>{JS_SORT_TABLE}</script>
 </body>
 </html>
-"""
+""")
 
 
 def _num_or_none(x: float) -> Optional[float]:
@@ -941,6 +1040,155 @@ def _write_json_index(
         f.write("\n")
 
 
+def _load_session(d: Path, use_cache: bool = True) -> Optional[_Session]:
+    """Read and summarize one session folder (None when nf_feedback.csv is missing).
+
+    Module-level (and returning plain dataclasses) so it can run in a worker process.
+    """
+    csv_path = d / "nf_feedback.csv"
+    if not csv_path.is_file():
+        return None
+
+    summary = read_json_if_exists(str(d / "nf_summary.json"))
+    run_meta = read_json_if_exists(str(d / "nf_run_meta.json"))
+    derived = _find_derived_events(d)
+
+    try:
+        stats, note = _summarize_nf_feedback_cached(csv_path, use_cache=use_cache)
+    except Exception as e:
+        # If this session is unreadable, include a placeholder row.
+        stats = _SessionStats(
+            n_frames=0,
+            duration_sec=math.nan,
+            dt_median_sec=math.nan,
+            reward_frac=math.nan,
+            artifact_frac=math.nan,
+            artifact_ready_frac=math.nan,
+            metric_mean=math.nan,
+            metric_min=math.nan,
+            metric_max=math.nan,
+            metric_last=math.nan,
+            threshold_mean=math.nan,
+            threshold_min=math.nan,
+            threshold_max=math.nan,
+            threshold_last=math.nan,
+            reward_rate_mean=math.nan,
+            reward_rate_last=math.nan,
+            bad_channels_mean=math.nan,
+            phase_counts={},
+            derived_durations={},
+        )
+        note = f"ERROR reading nf_feedback.csv: {e}"
+
+    # Derived events summary (best-effort).
+    if derived and derived.is_file():
+        try:
+            stats.derived_durations = _summarize_derived_events(derived)
+        except Exception:
+            stats.derived_durations = {}
+
+    ts = _timestamp_utc(run_meta, csv_path)
+    protocol = str((summary or {}).get("protocol") or "").strip() if summary else ""
+    metric_spec = _metric_spec_string(summary)
+
+    # Missing (or stale) reports are generated later, only for the sessions that
+    # are kept (see _generate_missing_reports). An existing report is reused
+    # while it is newer than everything it is rendered from.
+    cand = d / "nf_feedback_report.html"
+    report_html = cand if cand.is_file() else None
+    report_stale = report_html is not None and not report_is_fresh(
+        cand, [csv_path, derived, d / "nf_summary.json", d / "nf_run_meta.json"]
+    )
+
+    return _Session(
+        outdir=d,
+        csv_path=csv_path,
+        summary=summary,
+        run_meta=run_meta,
+        derived_events_path=derived,
+        stats=stats,
+        timestamp_utc=ts,
+        protocol=protocol,
+        metric_spec=metric_spec,
+        report_html=report_html,
+        note=note,
+        report_stale=report_stale,
+        epoch=_parse_iso_to_epoch(ts),
+    )
+
+
+def _resolve_jobs(jobs: int) -> int:
+    jobs = int(jobs)
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def _load_sessions(sess_dirs: Sequence[Path], *, jobs: int, use_cache: bool = True) -> List[_Session]:
+    """Load sessions in scan order, optionally across worker processes.
+
+    Sessions share no state, so they can be summarized concurrently. Falls back to
+    in-process loading when jobs <= 1 or when a process pool cannot be created
+    (e.g., restricted sandboxes). Errors raised while loading (including a
+    broken pool) propagate; sessions are not reloaded in-process.
+    """
+    jobs = _resolve_jobs(jobs)
+    loaded: Optional[List[Optional[_Session]]] = None
+    if jobs > 1 and len(sess_dirs) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            ex = ProcessPoolExecutor(max_workers=min(jobs, len(sess_dirs)))
+        except (ImportError, OSError, NotImplementedError):
+            pass
+        else:
+            with ex:
+                loaded = list(ex.map(_load_session, sess_dirs, [use_cache] * len(sess_dirs), chunksize=4))
+    if loaded is None:
+        loaded = [_load_session(d, use_cache) for d in sess_dirs]
+    return [s for s in loaded if s is not None]
+
+
+def _generate_missing_reports(sessions: Sequence[_Session], *, jobs: int, force: bool = False) -> None:
+    """(Re)render nf_feedback_report.html for sessions where it is missing or stale.
+
+    Fresh reports are reused, so a dashboard refresh only renders sessions whose
+    inputs changed (or every session with force). Each report is written into its
+    own session folder, so they can be rendered concurrently (one session per
+    task; report rendering dominates). Falls back to in-process rendering like
+    _load_sessions. A task that fails in the pool (e.g., a broken pool) counts
+    as a failed render for its session. A stale report that fails to re-render
+    stays linked.
+    """
+    todo = [s for s in sessions if force or s.report_html is None or s.report_stale]
+    if not todo:
+        return
+    dirs = [s.outdir for s in todo]
+    rerender = [s.report_html is not None for s in todo]
+    jobs = _resolve_jobs(jobs)
+    reports: Optional[List[Optional[Path]]] = None
+    if jobs > 1 and len(todo) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            ex = ProcessPoolExecutor(max_workers=min(jobs, len(todo)))
+        except (ImportError, OSError, NotImplementedError):
+            pass
+        else:
+            with ex:
+                futures = [ex.submit(_try_generate_nf_report, d, r) for d, r in zip(dirs, rerender)]
+                reports = []
+                for fut in futures:
+                    try:
+                        reports.append(fut.result())
+                    except Exception:
+                        reports.append(None)
+    if reports is None:
+        reports = [_try_generate_nf_report(d, r) for d, r in zip(dirs, rerender)]
+    for s, rep in zip(todo, reports):
+        if rep is not None:
+            s.report_html = rep
+            s.report_stale = False
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Build an aggregated dashboard of multiple neurofeedback sessions.")
     ap.add_argument(
@@ -970,7 +1218,26 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     ap.add_argument(
         "--no-generate-reports",
         action="store_true",
-        help="Do not try to generate missing nf_feedback_report.html files.",
+        help="Do not try to generate missing (or refresh stale) nf_feedback_report.html files.",
+    )
+    ap.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every per-session nf_feedback_report.html, even when it is up to date.",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help=(
+            "Summarize sessions and render missing per-session reports in N worker processes "
+            "(default: 0 = one per CPU; 1 = in-process, e.g. for debugging)."
+        ),
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse nf_feedback.csv (ignore and do not write the per-session {_STATS_CACHE_NAME}).",
     )
     ap.add_argument(
         "--open",
@@ -989,91 +1256,24 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     sess_dirs = _scan_sessions(roots)
 
-    sessions: List[_Session] = []
-    for d in sess_dirs:
-        csv_path = d / "nf_feedback.csv"
-        if not csv_path.is_file():
-            continue
-
-        summary = read_json_if_exists(str(d / "nf_summary.json"))
-        run_meta = read_json_if_exists(str(d / "nf_run_meta.json"))
-        derived = _find_derived_events(d)
-
-        try:
-            stats, note = _summarize_nf_feedback(csv_path)
-        except Exception as e:
-            # If this session is unreadable, include a placeholder row.
-            stats = _SessionStats(
-                n_frames=0,
-                duration_sec=math.nan,
-                dt_median_sec=math.nan,
-                reward_frac=math.nan,
-                artifact_frac=math.nan,
-                artifact_ready_frac=math.nan,
-                metric_mean=math.nan,
-                metric_min=math.nan,
-                metric_max=math.nan,
-                metric_last=math.nan,
-                threshold_mean=math.nan,
-                threshold_min=math.nan,
-                threshold_max=math.nan,
-                threshold_last=math.nan,
-                reward_rate_mean=math.nan,
-                reward_rate_last=math.nan,
-                bad_channels_mean=math.nan,
-                phase_counts={},
-                derived_durations={},
-            )
-            note = f"ERROR reading nf_feedback.csv: {e}"
-
-        # Derived events summary (best-effort).
-        if derived and derived.is_file():
-            try:
-                stats.derived_durations = _summarize_derived_events(derived)
-            except Exception:
-                stats.derived_durations = {}
-
-        ts = _timestamp_utc(run_meta, csv_path)
-        protocol = str((summary or {}).get("protocol") or "").strip() if summary else ""
-        metric_spec = _metric_spec_string(summary)
-
-        report_html: Optional[Path] = None
-        if not args.no_generate_reports:
-            report_html = _try_generate_nf_report(d)
-        else:
-            cand = d / "nf_feedback_report.html"
-            report_html = cand if cand.is_file() else None
-
-        sessions.append(
-            _Session(
-                outdir=d,
-                csv_path=csv_path,
-                summary=summary,
-                run_meta=run_meta,
-                derived_events_path=derived,
-                stats=stats,
-                timestamp_utc=ts,
-                protocol=protocol,
-                metric_spec=metric_spec,
-                report_html=report_html,
-                note=note,
-            )
-        )
+    sessions = _load_sessions(sess_dirs, jobs=args.jobs, use_cache=not args.no_cache)
 
     # Sort sessions by timestamp (if parseable) then path.
     def _key(s: _Session) -> Tuple[int, float, str]:
-        ep = _parse_iso_to_epoch(s.timestamp_utc)
-        have = 1 if ep is not None else 0
+        ep = s.epoch
         # Sort unknown timestamps last.
-        return (0 if have else 1, float(ep) if ep is not None else 0.0, str(s.outdir))
+        return (0 if ep is not None else 1, float(ep) if ep is not None else 0.0, str(s.outdir))
 
     sessions.sort(key=_key)
 
     if args.max_sessions and len(sessions) > int(args.max_sessions):
         sessions = sessions[-int(args.max_sessions) :]
 
-    html_doc = _build_dashboard(sessions, out_p, roots)
-    out_p.write_text(html_doc, encoding="utf-8")
+    if not args.no_generate_reports:
+        _generate_missing_reports(sessions, jobs=args.jobs, force=bool(args.force))
+
+    with atomic_output(str(out_p)) as tmp_path, open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        _write_dashboard(f.write, sessions, out_p, roots)
     print(f"Wrote: {out_p}")
 
     if args.json_index:
@@ -1084,6 +1284,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     if args.open:
         try:
+            import webbrowser  # only needed for --open
+
             webbrowser.open(f"file://{out_p}")
         except Exception:
             pass
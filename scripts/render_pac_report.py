@@ -18,6 +18,9 @@ Typical usage:
   # Or pass pac_timeseries.csv directly
   python3 scripts/render_pac_report.py --input out_pac/pac_timeseries.csv --out report.html
 
+  # Smaller artifact for long runs: writes out_pac/pac_report.html.gz
+  python3 scripts/render_pac_report.py --input out_pac --gzip
+
 The generated HTML is self-contained (inline CSS + SVG) and safe to open locally.
 
 Notes:
@@ -28,18 +31,27 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import csv
+import functools
+import gzip
 import math
+import operator
 import os
 import pathlib
-import statistics
 import webbrowser
+from array import array
+from dataclasses import dataclass, field
+from itertools import chain, compress, islice
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from report_common import (
     BASE_CSS,
     JS_SORT_TABLE,
+    atomic_output as _atomic_output,
+    cell_float as _cell_float,
     downsample_indices as _downsample_indices,
     e as _e,
+    e_many as _e_many,
     finite_minmax as _finite_minmax,
     is_dir as _is_dir,
     read_csv_dict as _read_csv,
@@ -80,7 +92,10 @@ def _guess_paths(inp: str, out: Optional[str]) -> Tuple[str, str, Optional[str],
     return csv_path, out or "pac_report.html", dist, summ, meta
 
 
-def _pick_col(headers: Sequence[str], candidates: Sequence[str]) -> str:
+@functools.lru_cache(maxsize=256)
+def _pick_col(headers: Tuple[str, ...], candidates: Tuple[str, ...]) -> str:
+    # Memoized (hence tuple arguments): the reports dashboard renders many runs
+    # in one process, and they nearly always share the same header row.
     for c in candidates:
         if c in headers:
             return c
@@ -92,64 +107,290 @@ def _pick_col(headers: Sequence[str], candidates: Sequence[str]) -> str:
     return candidates[0] if candidates else (headers[0] if headers else "")
 
 
+# Rows parsed per block while streaming pac_timeseries.csv.
+_STREAM_BLOCK_ROWS = 65536
+
+
+@dataclass
+class _PacSeries:
+    headers: List[str]
+    t_col: str
+    v_col: str
+    # Rows where both columns are finite.
+    t: "array[float]" = field(default_factory=lambda: array("d"))
+    y: "array[float]" = field(default_factory=lambda: array("d"))
+    # Downsampled table rows (dicts, like read_csv_dict rows).
+    table_rows: List[Dict[str, str]] = field(default_factory=list)
+    n_rows: int = 0  # all non-blank data rows
+    t_min: float = math.nan
+    t_max: float = math.nan
+
+
+def _count_lines(path: str) -> int:
+    """Count text lines in a file with a raw byte scan (no decoding or CSV parsing)."""
+    n = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            n += chunk.count(b"\n")
+            last = chunk[-1:]
+    return n + (last != b"\n")
+
+
+def _stream_pac_csv(
+    path: str,
+    t_candidates: Sequence[str],
+    v_candidates: Sequence[str],
+    *,
+    max_table_rows: int,
+) -> _PacSeries:
+    """Stream pac_timeseries.csv once, keeping only what the report needs.
+
+    Rows are parsed in blocks with csv.reader; the two columns of each block are
+    converted in bulk, so no per-row dict is built except for the table sample.
+    The time range is tracked per block while the values are still hot, so no
+    later pass over t is needed.
+
+    The table sample is taken during the same pass: a raw line count gives the
+    row count up front, so the downsample_indices() stride can be applied per
+    block and only the sampled rows are kept. If the count was off (blank lines,
+    quoted newlines), the sample is re-read in a second pass.
+
+    Header/cell handling matches read_csv_dict (BOM, TSV by extension, stripped
+    names and values, short rows padded with "", extra cells ignored).
+    """
+    dialect: Any = csv.excel_tab if path.lower().endswith(".tsv") else csv.excel
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f, dialect=dialect)
+        fieldnames = next(reader, None)
+        if not fieldnames:
+            raise RuntimeError(f"Expected header row in CSV: {path}")
+
+        names = [str(h).strip() for h in fieldnames]
+        headers = [h for h in names if h != ""]
+        # Later duplicates win, matching csv.DictReader.
+        col_idx = {h: i for i, h in enumerate(names) if h != "" and h != "__extra__"}
+        out = _PacSeries(headers, _pick_col(tuple(headers), tuple(t_candidates)), _pick_col(tuple(headers), tuple(v_candidates)))
+        ti = col_idx.get(out.t_col)
+        vi = col_idx.get(out.v_col)
+
+        def column(block: List[List[str]], i: Optional[int]) -> List[float]:
+            if i is None:
+                return [math.nan] * len(block)
+            try:
+                cells = [row[i] for row in block]
+            except IndexError:
+                cells = [row[i] if i < len(row) else "" for row in block]
+            try:
+                return list(map(float, cells))
+            except ValueError:
+                return list(map(_cell_float, cells))
+
+        max_table_rows = max(1, int(max_table_rows))
+        n_est = _count_lines(path) - 1
+        step = math.ceil(n_est / max_table_rows) if n_est > max_table_rows else 1
+
+        isfinite = math.isfinite
+        t, y = out.t, out.y
+        t_lo, t_hi = math.inf, -math.inf
+        sampled: List[List[str]] = []
+        n_rows = 0
+        last_row: List[str] = []
+        while True:
+            block = list(islice(reader, _STREAM_BLOCK_ROWS))
+            if not block:
+                break
+            block = list(filter(None, block))  # drop blank lines
+            if not block:
+                continue
+            sampled += block[-n_rows % step :: step]
+            n_rows += len(block)
+            last_row = block[-1]
+            tv = column(block, ti)
+            yv = column(block, vi)
+            ok = list(map(operator.and_, map(isfinite, tv), map(isfinite, yv)))
+            bt = list(compress(tv, ok))
+            if bt:
+                t_lo = min(t_lo, min(bt))
+                t_hi = max(t_hi, max(bt))
+            t.extend(bt)
+            y.extend(compress(yv, ok))
+
+    if t:
+        out.t_min, out.t_max = t_lo, t_hi
+    out.n_rows = n_rows
+    if step != (math.ceil(n_rows / max_table_rows) if n_rows > max_table_rows else 1):
+        # The line count did not match the parsed rows; pick the sample exactly.
+        keep = set(_downsample_indices(n_rows, max_table_rows))
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            rows = filter(None, csv.reader(f, dialect=dialect))
+            next(rows, None)
+            sampled = [row for k, row in enumerate(rows) if k in keep]
+    elif (n_rows - 1) % step:
+        sampled.append(last_row)  # downsample_indices() always keeps the last row
+    items = list(col_idx.items())
+    out.table_rows = [{h: (row[i].strip() if i < len(row) else "") for h, i in items} for row in sampled]
+    return out
+
+
+def _value_stats(y: Sequence[float]) -> Tuple[float, float, float, float]:
+    """Return (mean, median, min, max) of finite values (all NaN when empty).
+
+    One C-level sort yields the median and both extremes; the mean is
+    math.fsum()/n, exactly what statistics.fmean() computes.
+    """
+    n = len(y)
+    if n == 0:
+        return math.nan, math.nan, math.nan, math.nan
+    ys = sorted(y)
+    half = n // 2
+    med = ys[half] if n % 2 else (ys[half - 1] + ys[half]) / 2
+    return math.fsum(y) / n, med, ys[0], ys[-1]
+
+
+def _lttb_indices(t: Sequence[float], y: Sequence[float], n_out: int) -> List[int]:
+    """Pick n_out indices with Largest-Triangle-Three-Buckets (Steinarsson, 2013).
+
+    Unlike uniform decimation, this keeps the peaks and troughs that define the
+    visual shape of the series. The first and last points are always kept; the
+    interior is split into n_out - 2 buckets and each bucket contributes the
+    point forming the largest triangle with the previously kept point and the
+    mean of the next bucket. t and y must be finite and of equal length.
+    """
+    n = len(t)
+    n_out = int(n_out)
+    if n_out >= n:
+        return list(range(n))
+    if n_out < 3:
+        return _downsample_indices(n, n_out)
+
+    every = (n - 2) / (n_out - 2)
+    out = [0]
+    a = 0
+    start = 1
+    for i in range(n_out - 2):
+        end = int((i + 1) * every) + 1
+        # Mean of the next bucket (the last point for the final bucket).
+        nxt_end = min(int((i + 2) * every) + 1, n)
+        cnt = nxt_end - end
+        avg_t = sum(t[end:nxt_end]) / cnt
+        avg_y = sum(y[end:nxt_end]) / cnt
+
+        ax, ay = t[a], y[a]
+        dx = ax - avg_t
+        dy = avg_y - ay
+        # Twice the triangle area; the constant factor does not change the argmax.
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs(dx * (y[j] - ay) - (ax - t[j]) * dy)
+            if area > best_area:
+                best_area = area
+                best = j
+        out.append(best)
+        a = best
+        start = end
+    out.append(n - 1)
+    return out
+
+
+def _minmax_indices(y: Sequence[float], n_buckets: int) -> List[int]:
+    """Return the indices of the min and max of y in each of n_buckets equal buckets.
+
+    Used as a cheap prefilter before LTTB (MinMax-LTTB): the per-bucket scans
+    run in C (slice + min/max + index), and the extrema LTTB would favour are
+    kept. The first and last indices are always included; the result is sorted.
+    """
+    n = len(y)
+    # Integer bucket edges, computed once; bucket b is y[edges[b]:edges[b + 1]].
+    edges = [b * n // n_buckets for b in range(n_buckets + 1)]
+    out = {0, n - 1}
+    add = out.add
+    for lo, hi in zip(edges, islice(edges, 1, None)):
+        if hi <= lo:
+            continue
+        seg = y[lo:hi]
+        add(lo + seg.index(min(seg)))
+        add(lo + seg.index(max(seg)))
+    return sorted(out)
+
+
+def _chart_indices(t: Sequence[float], y: Sequence[float], n_out: int) -> List[int]:
+    """Indices of the points to plot (at most n_out), preserving the series shape.
+
+    Very long series (more than 8 * n_out points) are first reduced to about
+    4 * n_out points with _minmax_indices, so LTTB only revisits that shortlist.
+    """
+    n = len(t)
+    if n > 8 * n_out:
+        pre = _minmax_indices(y, 2 * n_out)
+        sel = _lttb_indices([t[i] for i in pre], [y[i] for i in pre], n_out)
+        return [pre[i] for i in sel]
+    return _lttb_indices(t, y, n_out)
+
+
 def _polyline(points: Sequence[Tuple[float, float]]) -> str:
-    return " ".join(f"{x:.2f},{y:.2f}" for x, y in points)
+    # One %-format over the flattened coordinates instead of an f-string per point.
+    return " ".join(["%.2f,%.2f"] * len(points)) % tuple(chain.from_iterable(points))
+
+
+# Timeseries chart geometry. The frame and grid lines do not depend on the
+# data, so they are rendered once at import.
+_TS_W, _TS_H = 980, 380
+_TS_PAD_L, _TS_PAD_R, _TS_PAD_T, _TS_PAD_B = 60, 18, 38, 44
+_TS_INNER_W = _TS_W - _TS_PAD_L - _TS_PAD_R
+_TS_INNER_H = _TS_H - _TS_PAD_T - _TS_PAD_B
+_TS_FRAME = f'<rect x="{_TS_PAD_L}" y="{_TS_PAD_T}" width="{_TS_INNER_W}" height="{_TS_INNER_H}" class="frame" />' + "".join(
+    f'<line x1="{_TS_PAD_L}" y1="{yy:.2f}" x2="{_TS_PAD_L + _TS_INNER_W}" y2="{yy:.2f}" class="grid" />'
+    for yy in (_TS_PAD_T + k / 4.0 * _TS_INNER_H for k in range(5))
+)
 
 
 def _svg_line_chart(t: Sequence[float], y: Sequence[float], *, title: str, y_label: str) -> str:
     if not t or not y or len(t) != len(y):
         return ""
 
-    w, h = 980, 380
-    pad_l, pad_r, pad_t, pad_b = 60, 18, 38, 44
-    inner_w = w - pad_l - pad_r
-    inner_h = h - pad_t - pad_b
+    w, h = _TS_W, _TS_H
+    pad_l, pad_t = _TS_PAD_L, _TS_PAD_T
+    inner_w, inner_h = _TS_INNER_W, _TS_INNER_H
 
     t_min = min(t)
     t_max = max(t)
     if not (math.isfinite(t_min) and math.isfinite(t_max)) or t_max <= t_min:
         t_min, t_max = 0.0, 1.0
 
-    y_min, y_max = _finite_minmax([v for v in y if math.isfinite(v)])
+    isfinite = math.isfinite
+    y_min, y_max = _finite_minmax([v for v in y if isfinite(v)])
 
-    def x_of(tt: float) -> float:
-        return pad_l + (tt - t_min) / (t_max - t_min) * inner_w
-
-    def y_of(vv: float) -> float:
-        return pad_t + (1.0 - (vv - y_min) / (y_max - y_min)) * inner_h
-
-    pts: List[Tuple[float, float]] = []
-    for tt, vv in zip(t, y):
-        if math.isfinite(tt) and math.isfinite(vv):
-            pts.append((x_of(tt), y_of(vv)))
-
-    parts: List[str] = []
-    parts.append(f'<svg viewBox="0 0 {w} {h}" class="ts">')
-    parts.append(f'<text x="{pad_l}" y="22" class="ts-title">{_e(title)}</text>')
-    parts.append(f'<rect x="{pad_l}" y="{pad_t}" width="{inner_w}" height="{inner_h}" class="frame" />')
-
-    # Grid lines
-    for k in range(5):
-        yy = pad_t + k / 4.0 * inner_h
-        parts.append(f'<line x1="{pad_l}" y1="{yy:.2f}" x2="{pad_l+inner_w}" y2="{yy:.2f}" class="grid" />')
+    # Point mapping inlined with locals (no per-point closure calls or global lookups).
+    t_span = t_max - t_min
+    y_span = y_max - y_min
+    pts: List[Tuple[float, float]] = [
+        (pad_l + (tt - t_min) / t_span * inner_w, pad_t + (1.0 - (vv - y_min) / y_span) * inner_h)
+        for tt, vv in zip(t, y)
+        if isfinite(tt) and isfinite(vv)
+    ]
 
     if pts:
-        parts.append(f'<polyline points="{_polyline(pts)}" class="line" />')
+        body = f'<polyline points="{_polyline(pts)}" class="line" />'
     else:
-        parts.append(f'<text x="{pad_l + 12}" y="{pad_t + 18}" class="warn">No finite samples</text>')
-
-    # Axis labels
-    parts.append(f'<text x="{pad_l}" y="{pad_t+inner_h+30}" class="axis-label">time (s)</text>')
-    parts.append(
-        f'<text x="{pad_l}" y="{pad_t-10}" class="axis-label">{_e(f"{y_label} (min={y_min:.4g}, max={y_max:.4g})")}</text>'
-    )
-    parts.append(
-        f'<text x="{pad_l+inner_w}" y="{pad_t+inner_h+30}" text-anchor="end" class="axis-label">{_e(f"{t_max:.2f}s")}</text>'
+        body = f'<text x="{pad_l + 12}" y="{pad_t + 18}" class="warn">No finite samples</text>'
+
+    # Fixed number of pieces: one list literal, one join.
+    return "".join(
+        [
+            f'<svg viewBox="0 0 {w} {h}" class="ts">',
+            f'<text x="{pad_l}" y="22" class="ts-title">{_e(title)}</text>',
+            _TS_FRAME,
+            body,
+            # Axis labels
+            f'<text x="{pad_l}" y="{pad_t+inner_h+30}" class="axis-label">time (s)</text>',
+            f'<text x="{pad_l}" y="{pad_t-10}" class="axis-label">{_e(f"{y_label} (min={y_min:.4g}, max={y_max:.4g})")}</text>',
+            f'<text x="{pad_l+inner_w}" y="{pad_t+inner_h+30}" text-anchor="end" class="axis-label">{_e(f"{t_max:.2f}s")}</text>',
+            "</svg>",
+        ]
     )
 
-    parts.append("</svg>")
-    return "".join(parts)
-
 
 def _svg_distribution(bins: Sequence[int], probs: Sequence[float], *, title: str) -> str:
     if not bins or not probs or len(bins) != len(probs):
@@ -167,31 +408,38 @@ def _svg_distribution(bins: Sequence[int], probs: Sequence[float], *, title: str
     n = max(1, len(bins))
     bar_w = inner_w / n
 
-    parts: List[str] = []
-    parts.append(f'<svg viewBox="0 0 {w} {h}" class="dist">')
-    parts.append(f'<text x="{pad_l}" y="22" class="ts-title">{_e(title)}</text>')
-    parts.append(f'<rect x="{pad_l}" y="{pad_t}" width="{inner_w}" height="{inner_h}" class="frame" />')
-
-    # Bars
+    # Bars: collect one template per element and fill them all with a single %-format.
+    rect_t = f'<rect x="%.2f" y="%.2f" width="{max(1.0, bar_w-1):.2f}" height="%.2f" class="bar" />'
+    label_t = f'<text x="%.2f" y="{pad_t+inner_h+18}" text-anchor="middle" class="axis-label">%d</text>'
+    label_every = max(1, n // 8)
+    tmpl: List[str] = []
+    vals: List[float] = []
     for i, (b, p) in enumerate(zip(bins, probs)):
         if not math.isfinite(p) or p < 0:
             continue
         x = pad_l + i * bar_w
         bh = (p / pmax) * inner_h
         y = pad_t + (inner_h - bh)
-        parts.append(f'<rect x="{x:.2f}" y="{y:.2f}" width="{max(1.0, bar_w-1):.2f}" height="{bh:.2f}" class="bar" />')
-        # Sparse bin labels
-        if n <= 16 or (i % max(1, n // 8) == 0) or (i == n - 1):
-            parts.append(
-                f'<text x="{x + bar_w/2:.2f}" y="{pad_t+inner_h+18}" text-anchor="middle" class="axis-label">{_e(str(b))}</text>'
-            )
-
-    # y-axis label
-    parts.append(f'<text x="{pad_l}" y="{pad_t-10}" class="axis-label">probability (max={pmax:.4g})</text>')
-    parts.append(f'<text x="{pad_l}" y="{pad_t+inner_h+34}" class="axis-label">phase bin index</text>')
-
-    parts.append("</svg>")
-    return "".join(parts)
+        tmpl.append(rect_t)
+        vals += (x, y, bh)
+        # Sparse bin labels (bins are ints, so nothing to escape)
+        if n <= 16 or (i % label_every == 0) or (i == n - 1):
+            tmpl.append(label_t)
+            vals += (x + bar_w / 2, b)
+
+    # Fixed number of pieces around the bars: one list literal, one join.
+    return "".join(
+        [
+            f'<svg viewBox="0 0 {w} {h}" class="dist">',
+            f'<text x="{pad_l}" y="22" class="ts-title">{_e(title)}</text>',
+            f'<rect x="{pad_l}" y="{pad_t}" width="{inner_w}" height="{inner_h}" class="frame" />',
+            "".join(tmpl) % tuple(vals),
+            # y-axis label
+            f'<text x="{pad_l}" y="{pad_t-10}" class="axis-label">probability (max={pmax:.4g})</text>',
+            f'<text x="{pad_l}" y="{pad_t+inner_h+34}" class="axis-label">phase bin index</text>',
+            "</svg>",
+        ]
+    )
 
 
 def _render_run_meta(run_meta: Optional[Dict[str, Any]]) -> str:
@@ -243,30 +491,55 @@ def _render_run_meta(run_meta: Optional[Dict[str, Any]]) -> str:
     )
 
 
-def _build_table(headers: Sequence[str], rows: Sequence[Dict[str, str]], *, max_rows: int) -> str:
+def _build_table(headers: Sequence[str], rows: Sequence[Dict[str, str]]) -> str:
+    """Render the (already downsampled, see _stream_pac_csv) rows as a sortable table."""
     if not headers:
         return ""
 
-    n = len(rows)
-    max_rows = max(1, int(max_rows))
-    idx = _downsample_indices(n, max_rows)
-
     ths = "".join(f'<th onclick="sortTable(this)">{_e(h)}</th>' for h in headers)
-    body_rows: List[str] = []
-    for i in idx:
-        r = rows[i]
-        tds = "".join(f"<td>{_e(r.get(h, ''))}</td>" for h in headers)
-        body_rows.append(f"<tr>{tds}</tr>")
+    # One row template repeated for all rows and filled with every cell in a
+    # single %-format (no per-cell f-string or per-row join); the cells are
+    # escaped in one batch.
+    row_fmt = "<tr>" + "<td>%s</td>" * len(headers) + "</tr>"
+    blanks = [""] * len(headers)
+    cells = chain.from_iterable([map(r.get, headers, blanks) for r in rows])
+    body = (row_fmt * len(rows)) % tuple(_e_many(cells))
 
     return (
         '<table class="data-table sticky">'
         f"<thead><tr>{ths}</tr></thead>"
         "<tbody>"
-        + "".join(body_rows)
+        + body
         + "</tbody></table>"
     )
 
 
+# Report stylesheet, assembled once per process (batch callers such as the
+# sessions dashboard render many reports).
+_PAC_CSS = BASE_CSS + r"""
+
+main { max-width: 1280px; }
+
+/* Key/value table */
+table.kv { width: 100%; border-collapse: collapse; margin-top: 10px; font-size: 13px; }
+table.kv th, table.kv td { border-bottom: 1px solid var(--grid); padding: 8px; text-align: left; vertical-align: top; }
+table.kv th { width: 220px; color: #cfe0ff; font-weight: 600; }
+
+/* Charts */
+.ts, .dist { width: 100%; height: auto; overflow: visible; margin-top: 8px; }
+.frame { fill: rgba(15, 23, 37, 0.20); stroke: #2b3d58; stroke-width: 1; }
+.grid { stroke: rgba(255,255,255,0.08); stroke-width: 1; }
+.line { fill: none; stroke: var(--accent); stroke-width: 2; opacity: 0.95; }
+.bar { fill: var(--ok); opacity: 0.9; }
+.ts-title { fill: #dce7ff; font-size: 13px; font-weight: 600; }
+.axis-label { fill: var(--muted); font-size: 12px; }
+.warn { fill: var(--warn); font-size: 12px; }
+
+.kvgrid { display: grid; grid-template-columns: 240px 1fr; gap: 6px 12px; font-size: 13px; }
+.kvgrid div:nth-child(odd) { color: var(--muted); }
+"""
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Render qeeg_pac_cli outputs to a self-contained HTML report (stdlib only).")
     ap.add_argument("--input", required=True, help="Path to pac_timeseries.csv (or pac_phase_distribution.csv), or the outdir containing it.")
@@ -284,33 +557,35 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         help="Max rows to include in the sampled table (default: 600).",
     )
     ap.add_argument("--title", default="PAC report", help="Report title.")
+    ap.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Write gzip-compressed HTML (<out>.gz) instead of plain HTML (not combinable with --open).",
+    )
     ap.add_argument("--open", action="store_true", help="Open the generated HTML in your default browser.")
     args = ap.parse_args(list(argv) if argv is not None else None)
+    if args.gzip and args.open:
+        # A browser would download the .gz instead of displaying it.
+        ap.error("--open cannot be used with --gzip")
 
     ts_csv, html_path, dist_csv, summary_txt, meta_json = _guess_paths(args.input, args.out)
     if not os.path.exists(ts_csv):
         raise SystemExit(f"Could not find pac_timeseries.csv at: {ts_csv}")
 
-    headers, rows = _read_csv(ts_csv)
-    if not rows:
+    series = _stream_pac_csv(
+        ts_csv,
+        ["t_end_sec", "t_sec", "time_sec", "time", "t"],
+        ["pac", "value", "Pac", "PAC"],
+        max_table_rows=int(args.max_table_rows),
+    )
+    if not series.n_rows:
         raise SystemExit(f"No rows found in: {ts_csv}")
+    headers, v_col, t, y = series.headers, series.v_col, series.t, series.y
 
-    t_col = _pick_col(headers, ["t_end_sec", "t_sec", "time_sec", "time", "t"])
-    v_col = _pick_col(headers, ["pac", "value", "Pac", "PAC"])
-
-    t: List[float] = []
-    y: List[float] = []
-    for r in rows:
-        tt = _try_float(r.get(t_col, ""))
-        vv = _try_float(r.get(v_col, ""))
-        if math.isfinite(tt) and math.isfinite(vv):
-            t.append(tt)
-            y.append(vv)
-
-    duration = (max(t) - min(t)) if t else math.nan
+    duration = series.t_max - series.t_min  # NaN when no finite rows
 
-    # Chart downsampling
-    plot_idx = _downsample_indices(len(t), max(10, int(args.max_chart_points)))
+    # Chart downsampling (shape-preserving; see _chart_indices)
+    plot_idx = _chart_indices(t, y, max(10, int(args.max_chart_points)))
     t_plot = [t[i] for i in plot_idx] if t else []
     y_plot = [y[i] for i in plot_idx] if y else []
 
@@ -322,16 +597,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if dist_csv and os.path.exists(dist_csv):
         dh, dr = _read_csv(dist_csv)
         if dr:
-            b_col = _pick_col(dh, ["bin_index", "bin", "index"])
-            p_col = _pick_col(dh, ["prob", "p", "probability"])
+            dh_key = tuple(dh)
+            b_col = _pick_col(dh_key, ("bin_index", "bin", "index"))
+            p_col = _pick_col(dh_key, ("prob", "p", "probability"))
             bins: List[int] = []
             probs: List[float] = []
+            tf, isfinite = _try_float, math.isfinite
+            add_bin, add_prob = bins.append, probs.append
             for rr in dr:
-                bi = _try_float(rr.get(b_col, ""))
-                pr = _try_float(rr.get(p_col, ""))
-                if math.isfinite(bi) and math.isfinite(pr):
-                    bins.append(int(bi))
-                    probs.append(float(pr))
+                bi = tf(rr.get(b_col, ""))
+                pr = tf(rr.get(p_col, ""))
+                if isfinite(bi) and isfinite(pr):
+                    add_bin(int(bi))
+                    add_prob(float(pr))
 
             if probs:
                 s = sum(probs)
@@ -355,10 +633,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     def fmt(x: float) -> str:
         return "N/A" if not math.isfinite(x) else f"{x:.6g}"
 
-    mean = statistics.fmean(y) if y else math.nan
-    med = statistics.median(y) if y else math.nan
-    mn = min(y) if y else math.nan
-    mx = max(y) if y else math.nan
+    mean, med, mn, mx = _value_stats(y)
 
     # Links
     out_dir = os.path.dirname(os.path.abspath(html_path)) or "."
@@ -375,30 +650,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if meta_rel:
         links.append(f"<code>{_e(meta_rel)}</code>")
 
-    table_html = _build_table(headers, rows, max_rows=int(args.max_table_rows))
-
-    css = BASE_CSS + r"""
-
-main { max-width: 1280px; }
-
-/* Key/value table */
-table.kv { width: 100%; border-collapse: collapse; margin-top: 10px; font-size: 13px; }
-table.kv th, table.kv td { border-bottom: 1px solid var(--grid); padding: 8px; text-align: left; vertical-align: top; }
-table.kv th { width: 220px; color: #cfe0ff; font-weight: 600; }
-
-/* Charts */
-.ts, .dist { width: 100%; height: auto; overflow: visible; margin-top: 8px; }
-.frame { fill: rgba(15, 23, 37, 0.20); stroke: #2b3d58; stroke-width: 1; }
-.grid { stroke: rgba(255,255,255,0.08); stroke-width: 1; }
-.line { fill: none; stroke: var(--accent); stroke-width: 2; opacity: 0.95; }
-.bar { fill: var(--ok); opacity: 0.9; }
-.ts-title { fill: #dce7ff; font-size: 13px; font-weight: 600; }
-.axis-label { fill: var(--muted); font-size: 12px; }
-.warn { fill: var(--warn); font-size: 12px; }
-
-.kvgrid { display: grid; grid-template-columns: 240px 1fr; gap: 6px 12px; font-size: 13px; }
-.kvgrid div:nth-child(odd) { color: var(--muted); }
-"""
+    table_html = _build_table(headers, series.table_rows)
 
     now = utc_now_iso()
 
@@ -428,13 +680,28 @@ table.kv th { width: 220px; color: #cfe0ff; font-weight: 600; }
             "</div>"
         )
 
-    html_doc = f"""<!doctype html>
+    os.makedirs(os.path.dirname(os.path.abspath(html_path)) or ".", exist_ok=True)
+    if args.gzip and not html_path.endswith(".gz"):
+        html_path += ".gz"
+    # Stream the document section by section: the stylesheet, chart, table and
+    # script go straight to the buffered writer instead of being copied into
+    # one document string first. The file is only put in place once complete
+    # (a failed render leaves no partial report).
+    with _atomic_output(html_path) as tmp_path, (
+        gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6)
+        if args.gzip
+        else open(tmp_path, "w", encoding="utf-8", buffering=1 << 20)
+    ) as f:
+        w = f.write
+        w(f"""<!doctype html>
 <html lang=\"en\">
 <head>
 <meta charset=\"utf-8\">
 <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">
 <title>{_e(args.title)}</title>
-<style>{css}</style>
+<style>""")
+        w(_PAC_CSS)
+        w(f"""</style>
 </head>
 <body>
 <header>
@@ -462,13 +729,15 @@ table.kv th { width: 220px; color: #cfe0ff; font-weight: 600; }
       <div>Median</div><div>{_e(fmt(med))}</div>
       <div>Min / Max</div><div>{_e(fmt(mn))} / {_e(fmt(mx))}</div>
       <div>Chart points</div><div>{len(t_plot)} (max {int(args.max_chart_points)})</div>
-      <div>Table rows</div><div>{min(len(rows), int(args.max_table_rows))} (downsampled)</div>
+      <div>Table rows</div><div>{min(series.n_rows, int(args.max_table_rows))} (downsampled)</div>
     </div>
   </div>
 
   <div class=\"card\">
     <h2>Timeseries</h2>
-    {chart_html or '<div class="note">No finite samples to plot.</div>'}
+    """)
+        w(chart_html or '<div class="note">No finite samples to plot.</div>')
+        w(f"""
     <div class=\"note\">The chart is downsampled to keep the HTML lightweight.</div>
   </div>
 
@@ -483,7 +752,9 @@ table.kv th { width: 220px; color: #cfe0ff; font-weight: 600; }
         <button type=\"button\" onclick=\"downloadTableCSV(this, 'pac_timeseries_table_filtered.csv', true)\">Download CSV</button>
         <span class=\"filter-count muted\"></span>
       </div>
-      <div class=\"table-wrap\">{table_html or '<div class="note">No columns detected.</div>'}</div>
+      <div class=\"table-wrap\">""")
+        w(table_html or '<div class="note">No columns detected.</div>')
+        w(f"""</div>
     </div>
   </div>
 
@@ -493,14 +764,12 @@ table.kv th { width: 220px; color: #cfe0ff; font-weight: 600; }
     Tip: open this file in a browser. It is self-contained (no network requests).
   </div>
 </main>
-<script>{JS_SORT_TABLE}</script>
+<script>""")
+        w(JS_SORT_TABLE)
+        w("""</script>
 </body>
 </html>
-"""
-
-    os.makedirs(os.path.dirname(os.path.abspath(html_path)) or ".", exist_ok=True)
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html_doc)
+""")
 
     print(f"Wrote: {html_path}")
 
@@ -18,6 +18,9 @@ Typical usage:
   # Or pass the per-channel CSV directly
   python3 scripts/render_quality_report.py --input out_quality/line_noise_per_channel.csv --out report.html
 
+  # Render a batch of outdirs (one worker process per CPU by default)
+  python3 scripts/render_quality_report.py --input runs/*/out_quality
+
 The generated HTML is self-contained (inline CSS + SVG) and safe to open locally.
 
 Notes:
@@ -28,19 +31,24 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import csv
+import functools
+import heapq
 import math
 import os
 import pathlib
-import statistics
 import webbrowser
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from report_common import (
     BASE_CSS,
     JS_SORT_TABLE,
+    atomic_output as _atomic_output,
+    cell_float as _cell_float,
     e as _e,
+    e_many as _e_many,
     is_dir as _is_dir,
-    read_csv_dict as _read_csv,
     read_json_if_exists as _read_json_if_exists,
     read_text_if_exists as _read_text_if_exists,
     try_float as _try_float,
@@ -50,11 +58,11 @@ from report_common import (
 
 def _guess_paths(inp: str, out: Optional[str]) -> Tuple[str, str, str, Optional[str], Optional[str], Optional[str]]:
     """Return (outdir, csv_path, html_path, report_json_path, summary_txt_path, run_meta_json_path)."""
-    if _is_dir(inp):
-        outdir = os.path.abspath(inp)
+    p = os.path.abspath(inp)
+    if _is_dir(p):
+        outdir = p
         csv_path = os.path.join(outdir, "line_noise_per_channel.csv")
     else:
-        p = os.path.abspath(inp)
         outdir = os.path.dirname(p) or "."
         # Allow passing any of the sidecar files; default to the CSV in that folder.
         if os.path.basename(p).lower().endswith(".csv"):
@@ -65,42 +73,107 @@ def _guess_paths(inp: str, out: Optional[str]) -> Tuple[str, str, str, Optional[
     if out is None:
         out = os.path.join(outdir, "quality_report.html")
 
-    report_json = os.path.join(outdir, "quality_report.json")
-    summary_txt = os.path.join(outdir, "quality_summary.txt")
-    run_meta = os.path.join(outdir, "quality_run_meta.json")
+    # One directory listing answers all three sidecar lookups (instead of a
+    # stat() per file); fall back to os.path.exists if it cannot be listed.
+    try:
+        names: Optional[Set[str]] = set(os.listdir(outdir))
+    except OSError:
+        names = None
+
+    def sidecar(name: str) -> Optional[str]:
+        path = os.path.join(outdir, name)
+        found = (name in names) if names is not None else os.path.exists(path)
+        return path if found else None
 
     return (
         outdir,
-        os.path.abspath(csv_path),
+        csv_path,
         os.path.abspath(out),
-        report_json if os.path.exists(report_json) else None,
-        summary_txt if os.path.exists(summary_txt) else None,
-        run_meta if os.path.exists(run_meta) else None,
+        sidecar("quality_report.json"),
+        sidecar("quality_summary.txt"),
+        sidecar("quality_run_meta.json"),
     )
 
 
-def _finite(values: Iterable[float]) -> List[float]:
-    out: List[float] = []
-    for v in values:
-        if math.isfinite(v):
-            out.append(v)
-    return out
+@dataclass
+class _QualityTable:
+    """line_noise_per_channel.csv held column-wise (one list of cells per column)."""
+
+    headers: List[str]
+    columns: Dict[str, List[str]]  # header -> stripped cells, one per row
+    n_rows: int
+    # Float conversion of each column, filled on first use (NaN for non-numeric cells).
+    _floats: Dict[str, List[float]] = field(default_factory=dict, repr=False)
+
+    def column(self, name: str) -> List[str]:
+        """Cells of a column; all "" if the CSV does not have it."""
+        return self.columns.get(name) or [""] * self.n_rows
+
+    def floats(self, name: str) -> List[float]:
+        """The column as floats, converted once and shared by the charts and the table.
+
+        A fully numeric column is converted with one map(float, ...); otherwise
+        the cells that do not parse become NaN (same values as _try_float).
+        """
+        vals = self._floats.get(name)
+        if vals is None:
+            cells = self.column(name)
+            try:
+                vals = list(map(float, cells))
+            except ValueError:
+                vals = list(map(_cell_float, cells))
+            self._floats[name] = vals
+        return vals
+
+    def finite_pairs(self, col: str) -> List[Tuple[str, float]]:
+        """(channel or "?", value) for every row where col is a finite number."""
+        if col not in self.columns:
+            return []
+        isfinite = math.isfinite
+        return [(ch or "?", v) for ch, v in zip(self.column("channel"), self.floats(col)) if isfinite(v)]
+
+
+def _read_quality_csv(path: str) -> _QualityTable:
+    """Read the per-channel CSV column-wise.
+
+    Header/cell handling matches read_csv_dict (BOM, TSV by extension, stripped
+    names and values, short rows padded with "", extra cells ignored, blank
+    lines skipped), but each column is one list instead of a dict per row.
+    """
+    dialect: Any = csv.excel_tab if path.lower().endswith(".tsv") else csv.excel
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f, dialect=dialect)
+        fieldnames = next(reader, None)
+        if not fieldnames:
+            raise RuntimeError(f"Expected header row in CSV: {path}")
+        rows = list(filter(None, reader))  # drop blank lines
+
+    names = [h.strip() for h in fieldnames]
+    headers = [h for h in names if h != ""]
+    # Later duplicates win, matching csv.DictReader.
+    col_idx = {h: i for i, h in enumerate(names) if h != "" and h != "__extra__"}
+
+    width = len(names)
+    if any(len(row) < width for row in rows):
+        rows = [row + [""] * (width - len(row)) if len(row) < width else row for row in rows]
+    columns = {h: [row[i].strip() for row in rows] for h, i in col_idx.items()}
+    return _QualityTable(headers, columns, len(rows))
+
+
+def _vmax(values: Iterable[float]) -> float:
+    """Chart scale: the largest finite value, but at least 1.0."""
+    return max(max(filter(math.isfinite, values), default=1.0), 1.0)
 
 
 def _median(values: Iterable[float]) -> float:
-    vals = _finite(values)
-    if not vals:
+    """Median of the finite values (NaN if there are none); same result as statistics.median."""
+    vals = sorted(filter(math.isfinite, values))
+    n = len(vals)
+    if n == 0:
         return math.nan
-    try:
-        return float(statistics.median(vals))
-    except Exception:
-        vals.sort()
-        n = len(vals)
-        if n == 0:
-            return math.nan
-        if n % 2 == 1:
-            return float(vals[n // 2])
-        return float(0.5 * (vals[n // 2 - 1] + vals[n // 2]))
+    if n % 2 == 1:
+        return float(vals[n // 2])
+    return float((vals[n // 2 - 1] + vals[n // 2]) / 2)
 
 
 def _svg_two_bars(a_label: str, a_val: float, b_label: str, b_val: float, *, title: str, highlight: str = "") -> str:
@@ -110,9 +183,7 @@ def _svg_two_bars(a_label: str, a_val: float, b_label: str, b_val: float, *, tit
     inner_w = w - pad_l - pad_r
     inner_h = h - pad_t - pad_b
 
-    vmax = max(_finite([a_val, b_val]) + [1.0])
-    if vmax <= 0:
-        vmax = 1.0
+    vmax = _vmax((a_val, b_val))
 
     def bar_x(i: int) -> float:
         # Two bars centered
@@ -144,7 +215,7 @@ def _svg_two_bars(a_label: str, a_val: float, b_label: str, b_val: float, *, tit
         parts.append(f'<rect x="{x}" y="{y}" width="{bar_w}" height="{bh}" class="{cls}"/>')
         parts.append(f'<text x="{x + bar_w/2.0}" y="{y0 + 18}" text-anchor="middle" class="label">{_e(lab)}</text>')
         if math.isfinite(v):
-            parts.append(f'<text x="{x + bar_w/2.0}" y="{y - 6}" text-anchor="middle" class="value">{_e(f"{v:.3g}")}</text>')
+            parts.append(f'<text x="{x + bar_w/2.0}" y="{y - 6}" text-anchor="middle" class="value">{v:.3g}</text>')
         else:
             parts.append(f'<text x="{x + bar_w/2.0}" y="{y - 6}" text-anchor="middle" class="nan">NaN</text>')
 
@@ -159,31 +230,31 @@ def _svg_hbar(labels: Sequence[str], values: Sequence[float], *, title: str) ->
     inner_w = w - pad_l - pad_r
     inner_h = h - pad_t - pad_b
 
-    vmax = max(_finite(values) + [1.0])
-    vmax = vmax if vmax > 0 else 1.0
+    vmax = _vmax(values)
 
     n = max(1, len(labels))
     row_h = inner_h / n
 
     parts: List[str] = []
-    parts.append(f'<svg viewBox="0 0 {w} {h}" class="chart">')
-    parts.append(f'<text x="{pad_l}" y="22" class="chart-title">{_e(title)}</text>')
+    append = parts.append
+    e = _e
+    isfinite = math.isfinite
+    append(f'<svg viewBox="0 0 {w} {h}" class="chart">')
+    append(f'<text x="{pad_l}" y="22" class="chart-title">{e(title)}</text>')
 
     for i, (lab, v) in enumerate(zip(labels, values)):
         y = pad_t + i * row_h
         cy = y + row_h * 0.65
-        parts.append(f'<text x="{pad_l - 8}" y="{cy}" text-anchor="end" class="label">{_e(lab)}</text>')
-        if not math.isfinite(v):
-            parts.append(f'<text x="{pad_l}" y="{cy}" class="nan">NaN</text>')
+        append(f'<text x="{pad_l - 8}" y="{cy}" text-anchor="end" class="label">{e(lab)}</text>')
+        if not isfinite(v):
+            append(f'<text x="{pad_l}" y="{cy}" class="nan">NaN</text>')
             continue
 
         bw = (v / vmax) * inner_w
         bar_y = y + row_h * 0.18
         bar_h = max(2.0, row_h * 0.55)
-        parts.append(f'<rect x="{pad_l}" y="{bar_y}" width="{bw}" height="{bar_h}" class="bar"/>')
-        parts.append(
-            f'<text x="{pad_l + inner_w - 2}" y="{cy}" text-anchor="end" class="value">{_e(f"{v:.6g}")}</text>'
-        )
+        append(f'<rect x="{pad_l}" y="{bar_y}" width="{bw}" height="{bar_h}" class="bar"/>')
+        append(f'<text x="{pad_l + inner_w - 2}" y="{cy}" text-anchor="end" class="value">{v:.6g}</text>')
 
     parts.append('</svg>')
     return ''.join(parts)
@@ -237,48 +308,93 @@ def _render_run_meta(run_meta: Optional[Dict[str, Any]]) -> str:
     )
 
 
-def _build_table(headers: Sequence[str], rows: Sequence[Dict[str, str]]) -> str:
+def _num_keys(values: Sequence[float]) -> List[str]:
+    """data-num sort key per cell: "%.12g" of the value if finite, else "".
+
+    Formatted once per column. The keys only contain digits, ".", "e", "+"
+    and "-", so they need no HTML escaping.
+    """
+    isfinite = math.isfinite
+    return ["%.12g" % v if isfinite(v) else "" for v in values]
+
+
+def _write_table(w: Callable[[str], Any], headers: Sequence[str], table: _QualityTable) -> None:
+    """Write the per-channel table with w (e.g. file.write), one row per call."""
     ths = ''.join(f'<th onclick="sortTable(this)">{_e(h)}</th>' for h in headers)
 
-    body: List[str] = []
-    for r in rows:
-        tds: List[str] = []
-        for h in headers:
-            v = r.get(h, "")
-            if h.lower() != "channel":
-                fv = _try_float(v)
-                if math.isfinite(fv):
-                    tds.append(f'<td data-num="{_e(f"{fv:.12g}")}">{_e(v)}</td>')
-                else:
-                    tds.append(f'<td>{_e(v)}</td>')
-            else:
-                tds.append(f'<td><code>{_e(v)}</code></td>')
-        body.append('<tr>' + ''.join(tds) + '</tr>')
+    w('<table class="data-table sticky">'
+      '<thead><tr>' + ths + '</tr></thead>'
+      '<tbody>')
+    # Each column is rendered to its <td> cells in one pass with a formatter
+    # chosen once per column (channel label / numeric with sort key / text);
+    # the rows are then just the columns zipped together. Cells are escaped
+    # per column in one batch.
+    td_cols: List[List[str]] = []
+    for h in headers:
+        cells = _e_many(table.column(h))
+        if h.lower() == "channel":
+            td_cols.append([f'<td><code>{v}</code></td>' for v in cells])
+        else:
+            keys = _num_keys(table.floats(h))
+            td_cols.append([f'<td data-num="{k}">{v}</td>' if k else f'<td>{v}</td>' for v, k in zip(cells, keys)])
+    if not td_cols:
+        w('<tr></tr>' * table.n_rows)
+    for tds in zip(*td_cols):
+        w('<tr>' + ''.join(tds) + '</tr>')
+    w('</tbody></table>')
 
-    return (
-        '<table class="data-table sticky">'
-        '<thead><tr>' + ths + '</tr></thead>'
-        '<tbody>' + ''.join(body) + '</tbody>'
-        '</table>'
-    )
 
+# quality_summary.txt is read capped (read_text_if_exists, 256 KB) and escaped
+# into the report in slices of this many characters.
+_SUMMARY_SLICE_CHARS = 65536
 
-def main(argv: Optional[Sequence[str]] = None) -> int:
-    ap = argparse.ArgumentParser(description="Render qeeg_quality_cli outputs to a self-contained HTML report (stdlib only).")
-    ap.add_argument("--input", required=True, help="Path to an outdir containing line_noise_per_channel.csv, or that CSV file itself.")
-    ap.add_argument("--out", default=None, help="Output HTML path (default: <outdir>/quality_report.html)")
-    ap.add_argument("--top-n", type=int, default=12, help="Top-N channels to show in charts (default: 12)")
-    ap.add_argument("--title", default="Quality report (line noise)", help="Report title")
-    ap.add_argument("--open", action="store_true", help="Open the generated HTML in your default browser.")
-    args = ap.parse_args(list(argv) if argv is not None else None)
 
-    outdir, csv_path, html_path, report_json_path, summary_txt_path, run_meta_path = _guess_paths(args.input, args.out)
+# Report stylesheet, assembled once per process (batch callers such as the
+# reports dashboard render many reports).
+_QUALITY_CSS = BASE_CSS + r"""
+.kv { width: 100%; border-collapse: collapse; font-size: 13px; }
+.kv th, .kv td { border-bottom: 1px solid rgba(255,255,255,0.08); padding: 8px; text-align: left; vertical-align: top; }
+.kv th { width: 220px; color: #d7e4ff; background: #0f1725; }
+
+.grid2 { display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 12px; }
+@media (max-width: 900px) { .grid2 { grid-template-columns: 1fr; } }
+
+.rec { display:flex; gap:12px; align-items:center; margin-top:10px; }
+.badge { display:inline-block; padding: 6px 10px; border-radius: 999px; font-size: 13px; border: 1px solid rgba(255,255,255,0.14); }
+.badge-50 { color: var(--warn); border-color: rgba(255,184,107,0.55); background: rgba(255,184,107,0.08); }
+.badge-60 { color: var(--bad); border-color: rgba(255,127,163,0.55); background: rgba(255,127,163,0.08); }
+.badge-none { color: var(--muted); border-color: rgba(255,255,255,0.10); background: rgba(255,255,255,0.04); }
+
+.mini { display:grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 10px; margin-top: 12px; }
+
+.chart { width: 100%; height: auto; margin-top: 8px; }
+.chart-title { font-size: 13px; fill: #d7e4ff; font-family: ui-sans-serif, system-ui; }
+.axis { stroke: rgba(255,255,255,0.20); stroke-width: 1; }
+.bar { fill: rgba(143,183,255,0.70); }
+.bar.hl { fill: rgba(255,184,107,0.80); }
+.label { fill: rgba(255,255,255,0.72); font-size: 12px; font-family: ui-sans-serif, system-ui; }
+.value { fill: rgba(255,255,255,0.85); font-size: 12px; font-family: ui-sans-serif, system-ui; }
+.nan { fill: rgba(255,255,255,0.45); font-size: 12px; }
+"""
+
+
+def _render_one(
+    inp: str,
+    out: Optional[str] = None,
+    *,
+    top_n: int = 12,
+    title: str = "Quality report (line noise)",
+    both_charts: bool = False,
+) -> str:
+    """Render one qeeg_quality_cli outdir (or CSV) to HTML; return the HTML path."""
+    outdir, csv_path, html_path, report_json_path, summary_txt_path, run_meta_path = _guess_paths(inp, out)
 
     if not os.path.exists(csv_path):
         raise SystemExit(f"Could not find line_noise_per_channel.csv at: {csv_path}")
 
-    headers, rows = _read_csv(csv_path)
-    if not rows:
+    table = _read_quality_csv(csv_path)
+    headers = table.headers
+    if not table.n_rows:
         raise SystemExit(f"No rows found in: {csv_path}")
 
     report_json = _read_json_if_exists(report_json_path) if report_json_path else None
@@ -287,7 +403,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     # Extract summary info, preferring the JSON report schema written by qeeg_quality_cli.
     fs_hz = _try_float(report_json.get("fs_hz")) if isinstance(report_json, dict) else math.nan
-    n_channels = int(report_json.get("n_channels")) if isinstance(report_json, dict) and isinstance(report_json.get("n_channels"), int) else len(rows)
+    n_channels = int(report_json.get("n_channels")) if isinstance(report_json, dict) and isinstance(report_json.get("n_channels"), int) else table.n_rows
     duration_sec = _try_float(report_json.get("duration_sec")) if isinstance(report_json, dict) else math.nan
 
     params_min_ratio = math.nan
@@ -303,11 +419,16 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     strength_ratio = _try_float(ln.get("strength_ratio")) if isinstance(ln, dict) else math.nan
     channels_used = int(ln.get("channels_used")) if isinstance(ln, dict) and isinstance(ln.get("channels_used"), int) else 0
 
+    # One pass per ratio column: its finite (channel, ratio) pairs feed both
+    # the median fallback and the top-N chart below.
+    pairs50 = table.finite_pairs("ratio_50")
+    pairs60 = table.finite_pairs("ratio_60")
+
     # Fallback summaries from CSV if JSON is missing.
     if not math.isfinite(med50):
-        med50 = _median(_try_float(r.get("ratio_50", "")) for r in rows)
+        med50 = _median(v for _, v in pairs50)
     if not math.isfinite(med60):
-        med60 = _median(_try_float(r.get("ratio_60", "")) for r in rows)
+        med60 = _median(v for _, v in pairs60)
 
     if not math.isfinite(rec_hz) or rec_hz <= 0:
         # If min_ratio is known (JSON), respect it; else just choose the stronger of the two medians.
@@ -327,28 +448,33 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             strength_ratio = max(med50 if math.isfinite(med50) else 0.0, med60 if math.isfinite(med60) else 0.0)
 
     # Charts: top-N channels by ratio_50 and ratio_60.
-    top_n = max(1, int(args.top_n))
-
-    def top_by(col: str) -> Tuple[List[str], List[float]]:
-        vals: List[Tuple[str, float]] = []
-        for r in rows:
-            ch = r.get("channel", "") or "?"
-            v = _try_float(r.get(col, ""))
-            if not math.isfinite(v):
-                continue
-            vals.append((ch, v))
-        vals.sort(key=lambda kv: kv[1], reverse=True)
-        vals = vals[: min(top_n, len(vals))]
+    top_n = max(1, int(top_n))
+
+    def top_by(pairs: List[Tuple[str, float]]) -> Tuple[List[str], List[float]]:
+        # Partial selection (O(N log top_n)); ties keep CSV order like a stable sort.
+        vals = heapq.nlargest(top_n, pairs, key=lambda kv: kv[1])
         return [k for k, _ in vals], [v for _, v in vals]
 
-    top50_labels, top50_vals = top_by("ratio_50")
-    top60_labels, top60_vals = top_by("ratio_60")
+    # When one mains frequency clearly dominates (median ratio over 10x the
+    # other), the weaker chart only shows channels near baseline; skip it.
+    skip: Optional[str] = None
+    if not both_charts and math.isfinite(med50) and math.isfinite(med60):
+        lo, hi = sorted((med50, med60))
+        if hi > 0.0 and hi > 10.0 * max(lo, 0.0):
+            skip = "60 Hz" if med60 < med50 else "50 Hz"
 
     charts_html: List[str] = []
-    if top50_labels:
-        charts_html.append(_svg_hbar(top50_labels, top50_vals, title=f"Top {len(top50_labels)} channels by 50 Hz peak/baseline ratio"))
-    if top60_labels:
-        charts_html.append(_svg_hbar(top60_labels, top60_vals, title=f"Top {len(top60_labels)} channels by 60 Hz peak/baseline ratio"))
+    for freq, pairs in (("50 Hz", pairs50), ("60 Hz", pairs60)):
+        if not pairs:
+            continue
+        if freq == skip:
+            charts_html.append(
+                f'<div class="muted">{freq} chart suppressed (ratios &asymp; baseline next to the other frequency); '
+                'pass <code>--both-charts</code> to draw it.</div>'
+            )
+            continue
+        labels, vals = top_by(pairs)
+        charts_html.append(_svg_hbar(labels, vals, title=f"Top {len(labels)} channels by {freq} peak/baseline ratio"))
 
     # Table
     # Keep a stable header order if the CSV contains the expected columns.
@@ -361,11 +487,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         "peak_mean_60",
         "baseline_mean_60",
     ]
-    if all(h in headers for h in preferred):
+    if set(headers).issuperset(preferred):
         headers = preferred
 
-    table_html = _build_table(headers, rows)
-
     # Summary values for display
     rec_label = "none" if not (rec_hz > 0) else ("60 Hz" if rec_hz >= 59.0 else "50 Hz")
     rec_badge_cls = "badge-none"
@@ -375,13 +499,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         rec_badge_cls = "badge-50"
 
     now = utc_now_iso()
-    src = os.path.abspath(args.input)
+    src = os.path.abspath(inp)
 
     def fmt(x: float, *, digits: int = 4) -> str:
         if not math.isfinite(x):
             return ""
         return f"{x:.{digits}g}"
 
+    if math.isfinite(med50) or math.isfinite(med60):
+        median_chart = _svg_two_bars("50 Hz", med50, "60 Hz", med60, title="Median peak/baseline ratio", highlight=rec_label)
+    else:
+        # Neither the JSON nor the CSV has a usable ratio: two NaN bars say nothing.
+        median_chart = '<div class="muted">No numeric ratios found.</div>'
+
     summary_grid = (
         '<div class="grid2">'
         '<div class="card">'
@@ -398,62 +528,32 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         '<div class="card">'
         '<h2>Median ratio comparison</h2>'
         '<div class="note">A higher ratio suggests stronger narrowband line-noise relative to local baseline.</div>'
-        + _svg_two_bars("50 Hz", med50, "60 Hz", med60, title="Median peak/baseline ratio", highlight=rec_label)
+        + median_chart
         + '</div>'
         '</div>'
     )
 
     run_meta_card = _render_run_meta(run_meta)
 
-    summary_block = ""
-    if summary_txt:
-        summary_block = (
-            '<div class="card">'
-            '<h2>quality_summary.txt</h2>'
-            '<div class="note">Human-readable summary written by <code>qeeg_quality_cli</code>.</div>'
-            f'<pre>{_e(summary_txt)}</pre>'
-            '</div>'
-        )
-
-    css = BASE_CSS + r"""
-.kv { width: 100%; border-collapse: collapse; font-size: 13px; }
-.kv th, .kv td { border-bottom: 1px solid rgba(255,255,255,0.08); padding: 8px; text-align: left; vertical-align: top; }
-.kv th { width: 220px; color: #d7e4ff; background: #0f1725; }
-
-.grid2 { display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 12px; }
-@media (max-width: 900px) { .grid2 { grid-template-columns: 1fr; } }
-
-.rec { display:flex; gap:12px; align-items:center; margin-top:10px; }
-.badge { display:inline-block; padding: 6px 10px; border-radius: 999px; font-size: 13px; border: 1px solid rgba(255,255,255,0.14); }
-.badge-50 { color: var(--warn); border-color: rgba(255,184,107,0.55); background: rgba(255,184,107,0.08); }
-.badge-60 { color: var(--bad); border-color: rgba(255,127,163,0.55); background: rgba(255,127,163,0.08); }
-.badge-none { color: var(--muted); border-color: rgba(255,255,255,0.10); background: rgba(255,255,255,0.04); }
-
-.mini { display:grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 10px; margin-top: 12px; }
-
-.chart { width: 100%; height: auto; margin-top: 8px; }
-.chart-title { font-size: 13px; fill: #d7e4ff; font-family: ui-sans-serif, system-ui; }
-.axis { stroke: rgba(255,255,255,0.20); stroke-width: 1; }
-.bar { fill: rgba(143,183,255,0.70); }
-.bar.hl { fill: rgba(255,184,107,0.80); }
-.label { fill: rgba(255,255,255,0.72); font-size: 12px; font-family: ui-sans-serif, system-ui; }
-.value { fill: rgba(255,255,255,0.85); font-size: 12px; font-family: ui-sans-serif, system-ui; }
-.nan { fill: rgba(255,255,255,0.45); font-size: 12px; }
-"""
-
-    js = JS_SORT_TABLE
-
-    html_doc = f"""<!doctype html>
+    os.makedirs(os.path.dirname(os.path.abspath(html_path)) or ".", exist_ok=True)
+    # Stream the document section by section; the table rows go straight to
+    # the buffered writer and are never joined into one string. The file is
+    # only put in place once complete (a failed render leaves no partial report).
+    with _atomic_output(html_path) as tmp_path, open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        w = f.write
+        w(f"""<!doctype html>
 <html lang=\"en\">
 <head>
 <meta charset=\"utf-8\">
 <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">
-<title>{_e(args.title)}</title>
-<style>{css}</style>
+<title>{_e(title)}</title>
+<style>""")
+        w(_QUALITY_CSS)
+        w(f"""</style>
 </head>
 <body>
 <header>
-  <h1>{_e(args.title)}</h1>
+  <h1>{_e(title)}</h1>
   <div class=\"meta\">Generated {now} — source <code>{_e(src)}</code></div>
 </header>
 <main>
@@ -470,7 +570,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
   {run_meta_card}
 
-  {summary_block}
+  """)
+        if summary_txt:
+            w('<div class="card">'
+              '<h2>quality_summary.txt</h2>'
+              '<div class="note">Human-readable summary written by <code>qeeg_quality_cli</code>.</div>'
+              '<pre>')
+            # Escaped and written in slices, so no second full-size (escaped)
+            # copy of the summary is built. Escaping is per character, so a
+            # slice boundary never splits an entity.
+            for i in range(0, len(summary_txt), _SUMMARY_SLICE_CHARS):
+                w(_e(summary_txt[i : i + _SUMMARY_SLICE_CHARS]))
+            w('</pre></div>')
+        w("""
 
   <div class=\"card\">
     <h2>Per-channel line noise table</h2>
@@ -481,34 +593,98 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         <button type=\"button\" onclick=\"downloadTableCSV(this, 'line_noise_per_channel_filtered.csv', true)\">Download CSV</button>
         <span class=\"filter-count muted\"></span>
       </div>
-      <div class=\"table-wrap\">{table_html}</div>
+      <div class=\"table-wrap\">""")
+        _write_table(w, headers, table)
+        w("""</div>
     </div>
   </div>
 
   <div class=\"card\">
     <h2>Top channels</h2>
     <div class=\"note\">These charts can help localize which channels carry the strongest line-noise peak.</div>
-    {''.join(charts_html) if charts_html else '<div class="muted">No numeric ratios found.</div>'}
+    """)
+        w(''.join(charts_html) if charts_html else '<div class="muted">No numeric ratios found.</div>')
+        w("""
   </div>
 
   <div class=\"footer\">Tip: open this file in a browser. It is self-contained (no network requests).</div>
 </main>
-<script>{js}</script>
+<script>""")
+        w(JS_SORT_TABLE)
+        w("""</script>
 </body>
 </html>
-"""
+""")
+
+    return html_path
 
-    os.makedirs(os.path.dirname(os.path.abspath(html_path)) or ".", exist_ok=True)
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html_doc)
 
-    print(f"Wrote: {html_path}")
+def _render_many(inputs: Sequence[str], *, jobs: int, **opts: Any) -> List[str]:
+    """Render several inputs with _render_one, in worker processes.
 
-    if args.open:
+    Reports share no state, so a batch is rendered concurrently (one input per
+    task). Falls back to in-process rendering when jobs <= 1 or when a process
+    pool cannot be created (e.g., restricted sandboxes). Errors raised while
+    rendering (including a broken pool) propagate; the batch is not re-rendered.
+    """
+    render = functools.partial(_render_one, **opts)
+    jobs = int(jobs)
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    if jobs > 1 and len(inputs) > 1:
         try:
-            webbrowser.open(pathlib.Path(os.path.abspath(html_path)).as_uri())
-        except Exception:
+            from concurrent.futures import ProcessPoolExecutor
+
+            ex = ProcessPoolExecutor(max_workers=min(jobs, len(inputs)))
+        except (ImportError, OSError, NotImplementedError):
             pass
+        else:
+            with ex:
+                return list(ex.map(render, inputs))
+    return [render(inp) for inp in inputs]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Render qeeg_quality_cli outputs to a self-contained HTML report (stdlib only).")
+    ap.add_argument(
+        "--input",
+        required=True,
+        nargs="+",
+        help="Path to an outdir containing line_noise_per_channel.csv, or that CSV file itself. Several may be given to render a batch.",
+    )
+    ap.add_argument("--out", default=None, help="Output HTML path (default: <outdir>/quality_report.html; single --input only)")
+    ap.add_argument("--top-n", type=int, default=12, help="Top-N channels to show in charts (default: 12)")
+    ap.add_argument("--title", default="Quality report (line noise)", help="Report title")
+    ap.add_argument(
+        "--both-charts",
+        action="store_true",
+        help="Always draw both top-N charts. By default the 50/60 Hz chart whose median ratio is under 1/10 of the other is skipped.",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="With several inputs, render them in N worker processes (default: 0 = one per CPU; 1 = in-process).",
+    )
+    ap.add_argument("--open", action="store_true", help="Open the generated HTML in your default browser.")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+
+    if args.out is not None and len(args.input) > 1:
+        ap.error("--out can only be used with a single --input")
+
+    opts = dict(top_n=args.top_n, title=args.title, both_charts=bool(args.both_charts))
+    if len(args.input) == 1:
+        html_paths = [_render_one(args.input[0], args.out, **opts)]
+    else:
+        html_paths = _render_many(args.input, jobs=args.jobs, **opts)
+
+    for html_path in html_paths:
+        print(f"Wrote: {html_path}")
+
+        if args.open:
+            try:
+                webbrowser.open(pathlib.Path(os.path.abspath(html_path)).as_uri())
+            except Exception:
+                pass
 
     return 0
 
@@ -5,7 +5,8 @@ This script scans one or more directories *recursively* looking for well-known
 output files produced by this repo's CLIs, and then generates a single
 dashboard HTML that links to per-run HTML reports.
 
-By default it will also (re)generate any missing reports using:
+By default it will also generate any missing reports, and re-render reports
+that are older than the outputs they were rendered from, using:
 
   - scripts/render_quality_report.py
   - scripts/render_trace_plot_report.py
@@ -61,22 +62,34 @@ Examples:
 
   # Write a machine-readable JSON index for downstream tooling.
   python3 scripts/render_reports_dashboard.py . --json-index qeeg_reports_dashboard_index.json
+
+  # Also scan hidden folders, and skip an extra folder of raw recordings.
+  python3 scripts/render_reports_dashboard.py . --include-hidden --skip raw_edf
 """
 
 from __future__ import annotations
 
 import argparse
-import datetime as _dt
+import importlib
 import json
 import os
 import re
 import sys
+import time
 import webbrowser
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
-
-from report_common import BASE_CSS, JS_SORT_TABLE, e as _e, posix_relpath as _posix_relpath, utc_now_iso
+from typing import AbstractSet, Callable, Collection, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from report_common import (
+    BASE_CSS,
+    JS_SORT_TABLE,
+    atomic_output,
+    e as _e,
+    posix_relpath as _posix_relpath,
+    report_is_fresh,
+    utc_now_iso,
+)
 
 
 # ---- Detection -------------------------------------------------------------
@@ -100,8 +113,9 @@ _KNOWN_CONN_BAND_FILES: Set[str] = {
     "wpli2_debiased_band.csv",
 }
 
+# Matrix-mode connectivity outputs: <measure>_matrix_<band>.csv.
 _CONN_MATRIX_RE = re.compile(
-    r"^.+_matrix_.+\\.csv$",
+    r"^(coherence|imcoh|plv|pli|wpli|wpli2_debiased)_matrix_.+\.csv$",
     re.IGNORECASE,
 )
 
@@ -111,20 +125,6 @@ _ARTIFACT_HINT_FILES: Set[str] = {
     "artifact_run_meta.json",
 }
 
-_BIDS_SCAN_HINT_FILES: Set[str] = {
-    "bids_index.csv",
-    "bids_index.json",
-    "bids_scan_report.txt",
-    "bids_scan_run_meta.json",
-}
-
-_QUALITY_HINT_FILES: Set[str] = {
-    "quality_report.json",
-    "line_noise_per_channel.csv",
-    "quality_summary.txt",
-    "quality_run_meta.json",
-}
-
 _TRACE_PLOT_HINT_FILES: Set[str] = {
     "trace_plot_run_meta.json",
     "trace_plot_meta.txt",
@@ -139,9 +139,13 @@ _SPECTROGRAM_HINT_FILES: Set[str] = {
 _SPECTROGRAM_IMG_RE = re.compile(r"^spectrogram_.+?\.(bmp|png|jpe?g|gif|svg)$", re.IGNORECASE)
 
 
-def _looks_like_spectrogram(filenames: Sequence[str]) -> bool:
-    s = set(filenames)
-    if any(name in s for name in _SPECTROGRAM_HINT_FILES):
+def _name_set(filenames: Collection[str]) -> FrozenSet[str]:
+    """Return filenames as a frozenset (as-is when it already is one)."""
+    return filenames if isinstance(filenames, frozenset) else frozenset(filenames)
+
+
+def _looks_like_spectrogram(filenames: Collection[str]) -> bool:
+    if _name_set(filenames) & _SPECTROGRAM_HINT_FILES:
         return True
     return any(_SPECTROGRAM_IMG_RE.match(name or "") for name in filenames)
 
@@ -153,7 +157,7 @@ _TOPOMAP_HINT_FILES: Set[str] = {
 _TOPOMAP_IMG_RE = re.compile(r"^topomap_.+?\.(bmp|png|jpe?g|gif|svg)$", re.IGNORECASE)
 
 
-def _looks_like_topomap(filenames: Sequence[str]) -> bool:
+def _looks_like_topomap(filenames: Collection[str]) -> bool:
     """Detect directories that primarily contain topomap outputs.
 
     Many tools can emit an auxiliary single map (e.g., IAF may write
@@ -167,8 +171,7 @@ def _looks_like_topomap(filenames: Sequence[str]) -> bool:
     qeeg_topomap_cli while avoiding incidental single-image cases.
     """
 
-    s = set(filenames)
-    if any(name in s for name in _TOPOMAP_HINT_FILES):
+    if _name_set(filenames) & _TOPOMAP_HINT_FILES:
         return True
     n_imgs = 0
     for name in filenames:
@@ -180,29 +183,167 @@ def _looks_like_topomap(filenames: Sequence[str]) -> bool:
 
 
 
-def _walk_dirs(roots: Sequence[str]) -> Iterable[Tuple[str, List[str]]]:
-    """Yield (dirpath, filenames) for every directory under each root."""
-    for root in roots:
-        for dirpath, _dirnames, filenames in os.walk(root):
-            yield dirpath, filenames
+# Directory names that never hold CLI outputs (VCS metadata, caches, virtualenvs,
+# raw BIDS source data). The scan does not descend into them.
+_DEFAULT_SKIP_DIRS: FrozenSet[str] = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "__pycache__",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".mypy_cache",
+        ".pytest_cache",
+        "sourcedata",
+    }
+)
+
 
+def _scan_dir(d: str, skip_names: AbstractSet[str], include_hidden: bool) -> Optional[Tuple[List[str], List[str]]]:
+    """List one directory as (filenames, subdirs to descend into); None if unreadable.
+
+    Entries are classified like os.walk does (symlinked directories are listed
+    but not followed) from a single os.scandir pass using the cached DirEntry
+    type. Subdirectories named in skip_names (and, unless include_hidden, names
+    starting with ".") are pruned.
+    """
+    filenames: List[str] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(d) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    filenames.append(entry.name)
+                    continue
+                name = entry.name
+                if name in skip_names or (not include_hidden and name.startswith(".")):
+                    continue
+                try:
+                    is_link = entry.is_symlink()
+                except OSError:
+                    is_link = False
+                if not is_link:
+                    subdirs.append(entry.path)
+    except OSError:
+        return None
+    return filenames, subdirs
+
+
+def _walk_dirs(
+    roots: Sequence[str],
+    *,
+    skip_names: AbstractSet[str] = frozenset(),
+    include_hidden: bool = True,
+    jobs: int = 1,
+) -> Iterable[Tuple[str, List[str]]]:
+    """Yield (dirpath, filenames) for every directory under each root.
+
+    Like os.walk(root), unreadable directories are skipped silently; see
+    _scan_dir for pruning. The roots themselves are always scanned.
+
+    With jobs > 1 the tree is listed level by level, each level's directories
+    in a thread pool. os.scandir releases the GIL, so this overlaps directory
+    listing latency on network filesystems; on a warm local disk the pool
+    overhead outweighs the gain, hence the single-threaded top-down default.
+    """
+    if jobs > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=jobs) as ex:
+            level: List[str] = list(roots)
+            while level:
+                below: List[str] = []
+                scans = ex.map(lambda d: _scan_dir(d, skip_names, include_hidden), level)
+                for d, res in zip(level, scans):
+                    if res is not None:
+                        yield d, res[0]
+                        below.extend(res[1])
+                level = below
+        return
 
-def _looks_like_connectivity(filenames: Sequence[str]) -> bool:
-    s = set(filenames)
-    if any(name in s for name in _KNOWN_CONN_PAIR_FILES):
+    for root in roots:
+        stack: List[str] = [root]
+        while stack:
+            d = stack.pop()
+            res = _scan_dir(d, skip_names, include_hidden)
+            if res is None:
+                continue
+            yield d, res[0]
+            # Reverse so subdirectories are visited in listing order (as os.walk does).
+            stack.extend(reversed(res[1]))
+
+
+def _looks_like_connectivity(filenames: Collection[str]) -> bool:
+    if _name_set(filenames) & _KNOWN_CONN_PAIR_FILES:
         return True
-    return any(_CONN_MATRIX_RE.match(name or "") for name in filenames)
+    match = _CONN_MATRIX_RE.match
+    return any(match(name) for name in filenames if name)
 
 
-def _looks_like_connectivity_pair(filenames: Sequence[str]) -> bool:
+def _looks_like_connectivity_pair(filenames: Collection[str]) -> bool:
     """Detect pair-mode connectivity outputs.
 
     These are distinct from the edge-list/matrix outputs consumed by
     render_connectivity_report.py.
     """
 
-    s = set(filenames)
-    return any(name in s for name in _KNOWN_CONN_BAND_FILES)
+    return bool(_name_set(filenames) & _KNOWN_CONN_BAND_FILES)
+
+
+# Output filename -> report kind, for files that on their own mark a run folder.
+# Image-based detection (spectrogram/topomap) and matrix-mode connectivity are
+# pattern matches handled in _classify_dir.
+_KIND_BY_FILE: Dict[str, str] = {
+    # quality_report.json is the strongest signal; accept line_noise_per_channel.csv
+    # too (quality_summary.txt / quality_run_meta.json alone are not enough).
+    "quality_report.json": "quality",
+    "line_noise_per_channel.csv": "quality",
+    **{name: "trace_plot" for name in _TRACE_PLOT_HINT_FILES},
+    **{name: "spectrogram" for name in _SPECTROGRAM_HINT_FILES},
+    **{name: "topomap" for name in _TOPOMAP_HINT_FILES},
+    "loreta_metrics.csv": "loreta_metrics",
+    "bandpowers.csv": "bandpowers",
+    "bandratios.csv": "bandratios",
+    "spectral_features.csv": "spectral_features",
+    "nf_feedback.csv": "nf",
+    "pac_timeseries.csv": "pac",
+    "epoch_bandpowers_summary.csv": "epoch",
+    "epoch_bandpowers.csv": "epoch",
+    **{name: "connectivity" for name in _KNOWN_CONN_PAIR_FILES},
+    **{name: "connectivity_pair" for name in _KNOWN_CONN_BAND_FILES},
+    "microstate_state_stats.csv": "microstates",
+    "iaf_by_channel.csv": "iaf",
+    # bids_index.csv is required (bids_index.json / bids_scan_run_meta.json alone are not enough).
+    "bids_index.csv": "bids_scan",
+    "channel_qc.csv": "channel_qc",
+    # artifact_windows.csv is the main signal; allow segments/meta too.
+    **{name: "artifacts" for name in _ARTIFACT_HINT_FILES},
+}
+
+
+def _classify_dir(filenames: Collection[str]) -> Set[str]:
+    """Return the report kinds whose outputs are present among filenames."""
+    names = _name_set(filenames)
+    kinds = {kind for kind in map(_KIND_BY_FILE.get, names) if kind is not None}
+    if "spectrogram" not in kinds and _looks_like_spectrogram(names):
+        kinds.add("spectrogram")
+    if "topomap" not in kinds and _looks_like_topomap(names):
+        kinds.add("topomap")
+    # Connectivity has two report paths:
+    #  - edge-list / matrix mode (render_connectivity_report.py)
+    #  - pair-summary mode (render_connectivity_pair_report.py), only when the
+    #    folder has no edge-list/matrix outputs.
+    if "connectivity" not in kinds and _looks_like_connectivity(names):
+        kinds.add("connectivity")
+    if "connectivity" in kinds:
+        kinds.discard("connectivity_pair")
+    return kinds
 
 
 # ---- Rendering -------------------------------------------------------------
@@ -216,224 +357,160 @@ class ReportItem:
     message: str = ""
 
 
-def _try_import_renderers() -> Dict[str, object]:
-    """Try to import renderer modules from the scripts directory.
-
-    Returns a dict of {kind -> module} for the kinds it could load.
-    """
-    mods: Dict[str, object] = {}
-
-    try:
-        import render_quality_report as _qr  # type: ignore
-        mods["quality"] = _qr
-    except Exception:
-        pass
-
-    try:
-        import render_trace_plot_report as _tr  # type: ignore
-        mods["trace_plot"] = _tr
-    except Exception:
-        pass
-
-
-    try:
-        import render_spectrogram_report as _sp  # type: ignore
-        mods["spectrogram"] = _sp
-    except Exception:
-        pass
-
-    try:
-        import render_topomap_report as _tm  # type: ignore
-        mods["topomap"] = _tm
-    except Exception:
-        pass
-
-    try:
-        import render_loreta_metrics_report as _lm  # type: ignore
-        mods["loreta_metrics"] = _lm
-    except Exception:
-        pass
-
-    try:
-        import render_bandpowers_report as _bp  # type: ignore
-        mods["bandpowers"] = _bp
-    except Exception:
-        pass
-
-    try:
-        import render_bandratios_report as _br  # type: ignore
-        mods["bandratios"] = _br
-    except Exception:
-        pass
-
-    try:
-        import render_nf_feedback_report as _nf  # type: ignore
-        mods["nf"] = _nf
-    except Exception:
-        pass
-
-    try:
-        import render_pac_report as _pac  # type: ignore
-        mods["pac"] = _pac
-    except Exception:
-        pass
+# Files each report is rendered from, besides its detection files in
+# _KIND_BY_FILE (sidecars and run metadata the renderers read). An existing
+# report older than any of them is considered stale.
+_REPORT_EXTRA_SOURCES: Dict[str, Tuple[str, ...]] = {
+    "quality": ("quality_summary.txt", "quality_run_meta.json"),
+    "topomap": ("topomap_index.json",),
+    "loreta_metrics": ("loreta_metrics_index.json", "loreta_protocol.json"),
+    "bandpowers": ("bandpowers.json", "bandpower_run_meta.json"),
+    "bandratios": ("bandratios.json", "bandratios_run_meta.json"),
+    "spectral_features": ("spectral_features.json", "spectral_features_run_meta.json"),
+    "nf": (
+        "nf_summary.json",
+        "nf_run_meta.json",
+        "nf_derived_events.tsv",
+        "nf_derived_events.csv",
+        "nf_derived_events.json",
+    ),
+    "pac": ("pac_run_meta.json",),
+    "epoch": ("epoch_run_meta.json",),
+    "connectivity": ("coherence_run_meta.json", "plv_run_meta.json"),
+    "connectivity_pair": ("coherence_run_meta.json", "plv_run_meta.json"),
+    "microstates": (
+        "microstate_transition_probs.csv",
+        "microstate_transition_counts.csv",
+        "microstate_timeseries.csv",
+        "microstate_segments.csv",
+    ),
+    "iaf": ("iaf_run_meta.json",),
+    "bids_scan": ("bids_index.json", "bids_scan_run_meta.json", "bids_scan_report.txt"),
+    "channel_qc": ("qc_run_meta.json",),
+}
 
-    try:
-        import render_epoch_report as _ep  # type: ignore
-        mods["epoch"] = _ep
-    except Exception:
-        pass
+# Pattern-detected source files (see _classify_dir).
+_REPORT_SOURCE_RE: Dict[str, re.Pattern[str]] = {
+    "spectrogram": _SPECTROGRAM_IMG_RE,
+    "topomap": _TOPOMAP_IMG_RE,
+    "connectivity": _CONN_MATRIX_RE,
+}
 
-    try:
-        import render_connectivity_report as _conn  # type: ignore
-        mods["connectivity"] = _conn
-    except Exception:
-        pass
 
-    try:
-        import render_connectivity_pair_report as _connp  # type: ignore
-        mods["connectivity_pair"] = _connp
-    except Exception:
-        pass
-
-    try:
-        import render_microstates_report as _ms  # type: ignore
-        mods["microstates"] = _ms
-    except Exception:
-        pass
+def _report_sources(kind: str, names: Collection[str]) -> List[str]:
+    """Return the names (among a run folder's files) that kind's report is rendered from."""
+    extra = _REPORT_EXTRA_SOURCES.get(kind, ())
+    pattern = _REPORT_SOURCE_RE.get(kind)
+    return [
+        n
+        for n in names
+        if _KIND_BY_FILE.get(n) == kind or n in extra or (pattern is not None and pattern.match(n))
+    ]
 
-    try:
-        import render_iaf_report as _iaf  # type: ignore
-        mods["iaf"] = _iaf
-    except Exception:
-        pass
 
-    try:
-        import render_bids_scan_report as _bids  # type: ignore
-        mods["bids_scan"] = _bids
-    except Exception:
-        pass
+# Renderer module (in scripts/) for every per-run report kind.
+_RENDERER_MODULES: Dict[str, str] = {
+    "quality": "render_quality_report",
+    "trace_plot": "render_trace_plot_report",
+    "spectrogram": "render_spectrogram_report",
+    "topomap": "render_topomap_report",
+    "loreta_metrics": "render_loreta_metrics_report",
+    "bandpowers": "render_bandpowers_report",
+    "bandratios": "render_bandratios_report",
+    "nf": "render_nf_feedback_report",
+    "pac": "render_pac_report",
+    "epoch": "render_epoch_report",
+    "connectivity": "render_connectivity_report",
+    "connectivity_pair": "render_connectivity_pair_report",
+    "microstates": "render_microstates_report",
+    "iaf": "render_iaf_report",
+    "bids_scan": "render_bids_scan_report",
+    "channel_qc": "render_channel_qc_report",
+    "artifacts": "render_artifacts_report",
+    "spectral_features": "render_spectral_features_report",
+}
 
-    try:
-        import render_channel_qc_report as _qc  # type: ignore
-        mods["channel_qc"] = _qc
-    except Exception:
-        pass
+# kind -> imported renderer module (None if it could not be imported). Filled on
+# first use per kind, so runs that render nothing (or a single kind) do not pay
+# for importing every renderer; worker processes fill their own copy.
+_RENDERER_MODS: Dict[str, Optional[object]] = {}
 
-    try:
-        import render_artifacts_report as _ar  # type: ignore
-        mods["artifacts"] = _ar
-    except Exception:
-        pass
 
+def _get_renderer(kind: str) -> Optional[object]:
+    """Import (once per process) and return the renderer module for kind, or None."""
     try:
-        import render_spectral_features_report as _sf  # type: ignore
-        mods["spectral_features"] = _sf
-    except Exception:
+        return _RENDERER_MODS[kind]
+    except KeyError:
         pass
+    mod: Optional[object] = None
+    modname = _RENDERER_MODULES.get(kind)
+    if modname is not None:
+        try:
+            mod = importlib.import_module(modname)
+        except Exception:
+            mod = None
+    _RENDERER_MODS[kind] = mod
+    return mod
+
+
+# Per-run report filename for each kind (written into the run's output folder).
+_REPORT_NAMES: Dict[str, str] = {
+    "quality": "quality_report.html",
+    "trace_plot": "trace_plot_report.html",
+    "spectrogram": "spectrogram_report.html",
+    "topomap": "topomap_report.html",
+    "loreta_metrics": "loreta_metrics_report.html",
+    "bandpowers": "bandpowers_report.html",
+    "bandratios": "bandratios_report.html",
+    "spectral_features": "spectral_features_report.html",
+    "nf": "nf_feedback_report.html",
+    "pac": "pac_report.html",
+    "epoch": "epoch_report.html",
+    "connectivity": "connectivity_report.html",
+    "connectivity_pair": "connectivity_pair_report.html",
+    "microstates": "microstates_report.html",
+    "iaf": "iaf_report.html",
+    "bids_scan": "bids_scan_report.html",
+    "channel_qc": "channel_qc_report.html",
+    "artifacts": "artifacts_report.html",
+}
 
-    return mods
+# Order in which per-run items are listed (and rendered).
+_RUN_KIND_ORDER: Tuple[str, ...] = (
+    "quality",
+    "trace_plot",
+    "spectrogram",
+    "topomap",
+    "loreta_metrics",
+    "nf",
+    "pac",
+    "epoch",
+    "iaf",
+    "bids_scan",
+    "bandpowers",
+    "bandratios",
+    "spectral_features",
+    "connectivity",
+    "connectivity_pair",
+    "microstates",
+    "channel_qc",
+    "artifacts",
+)
 
 
-def _render_report(kind: str, outdir: str, *, force: bool, renderer_mods: Dict[str, object]) -> ReportItem:
+def _render_report(kind: str, outdir: str, *, force: bool) -> ReportItem:
     """Generate one report (or skip if already present)."""
 
-    if kind == "quality":
-        report = os.path.join(outdir, "quality_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("quality")
-
-    elif kind == "trace_plot":
-        report = os.path.join(outdir, "trace_plot_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("trace_plot")
-
-    elif kind == "spectrogram":
-        report = os.path.join(outdir, "spectrogram_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("spectrogram")
-
-    elif kind == "topomap":
-        report = os.path.join(outdir, "topomap_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("topomap")
-
-    elif kind == "loreta_metrics":
-        report = os.path.join(outdir, "loreta_metrics_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("loreta_metrics")
-
-    elif kind == "bandpowers":
-        report = os.path.join(outdir, "bandpowers_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("bandpowers")
-
-    elif kind == "bandratios":
-        report = os.path.join(outdir, "bandratios_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("bandratios")
-
-    elif kind == "spectral_features":
-        report = os.path.join(outdir, "spectral_features_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("spectral_features")
-
-    elif kind == "nf":
-        report = os.path.join(outdir, "nf_feedback_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("nf")
-
-    elif kind == "pac":
-        report = os.path.join(outdir, "pac_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("pac")
-
-
-    elif kind == "epoch":
-        report = os.path.join(outdir, "epoch_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("epoch")
-    elif kind == "connectivity":
-        report = os.path.join(outdir, "connectivity_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("connectivity")
-
-    elif kind == "connectivity_pair":
-        report = os.path.join(outdir, "connectivity_pair_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("connectivity_pair")
-
-    elif kind == "microstates":
-        report = os.path.join(outdir, "microstates_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("microstates")
-
-    elif kind == "iaf":
-        report = os.path.join(outdir, "iaf_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("iaf")
-
-    elif kind == "bids_scan":
-        report = os.path.join(outdir, "bids_scan_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("bids_scan")
-
-    elif kind == "channel_qc":
-        report = os.path.join(outdir, "channel_qc_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("channel_qc")
-
-    elif kind == "artifacts":
-        report = os.path.join(outdir, "artifacts_report.html")
-        argv = ["--input", outdir, "--out", report]
-        mod = renderer_mods.get("artifacts")
-
-    else:
+    report_name = _REPORT_NAMES.get(kind)
+    if report_name is None:
         return ReportItem(kind=kind, outdir=outdir, report_path="", status="error", message="Unknown report kind")
+    report = os.path.join(outdir, report_name)
+    argv = ["--input", outdir, "--out", report]
 
     if (not force) and os.path.exists(report):
         return ReportItem(kind=kind, outdir=outdir, report_path=report, status="skipped", message="exists")
 
+    mod = _get_renderer(kind)
     if mod is None or not hasattr(mod, "main"):
         return ReportItem(
             kind=kind,
@@ -466,147 +543,142 @@ def _render_report(kind: str, outdir: str, *, force: bool, renderer_mods: Dict[s
     return ReportItem(kind=kind, outdir=outdir, report_path=report, status="ok")
 
 
-# ---- Dashboard HTML --------------------------------------------------------
+def _resolve_jobs(jobs: int) -> int:
+    jobs = int(jobs)
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
 
-def _file_mtime_iso(path: str) -> str:
-    try:
-        ts = os.path.getmtime(path)
-    except Exception:
-        return ""
-    return _dt.datetime.utcfromtimestamp(ts).replace(microsecond=0).isoformat() + "Z"
 
+def _render_task(kind: str, outdir: str, force: bool) -> ReportItem:
+    return _render_report(kind, outdir, force=force)
 
-def _build_dashboard(items: Sequence[ReportItem], out_path: str, roots: Sequence[str]) -> str:
-    now = utc_now_iso()
-    out_dir = os.path.dirname(os.path.abspath(out_path)) or "."
 
-    # Group items by kind
-    by_kind: Dict[str, List[ReportItem]] = {}
-    for it in items:
-        by_kind.setdefault(it.kind, []).append(it)
+def _render_reports(
+    tasks: Sequence[Tuple[str, str]],
+    *,
+    force: bool,
+    jobs: int,
+    listed: Optional[Mapping[str, AbstractSet[str]]] = None,
+) -> List[ReportItem]:
+    """Run _render_report for each (kind, outdir) task, returning items in task order.
 
-    kind_order: List[Tuple[str, str]] = [
-        ("quality", "Quality runs"),
-        ("trace_plot", "Trace plot runs"),
-        ("spectrogram", "Spectrogram runs"),
-        ("bids_scan", "BIDS scan runs"),
-        ("nf_sessions_dashboard", "Neurofeedback sessions dashboard"),
-        ("nf", "Neurofeedback runs"),
-        ("pac", "PAC runs"),
-        ("epoch", "Epoch runs"),
-        ("iaf", "IAF runs"),
-        ("bandpowers", "Bandpower runs"),
-        ("bandratios", "Band ratio runs"),
-        ("topomap", "Topomap runs"),
-        ("loreta_metrics", "LORETA ROI metrics runs"),
-        ("spectral_features", "Spectral feature runs"),
-        ("connectivity", "Connectivity runs"),
-        ("connectivity_pair", "Connectivity pair runs"),
-        ("microstates", "Microstate runs"),
-        ("channel_qc", "Channel QC runs"),
-        ("artifacts", "Artifacts runs"),
+    An existing report is skipped while it is at least as new as every file it
+    is rendered from (make-style); a stale one is re-rendered. listed (run
+    folder -> filenames seen by the scan) saves listing the folder again.
+
+    Reports that need rendering are written into separate run folders, so they
+    are rendered concurrently in worker processes (one run per task). Skips are
+    decided in-process without starting a pool. Falls back to in-process
+    rendering when jobs <= 1 or when a process pool cannot be created (e.g.,
+    restricted sandboxes). A task that fails in the pool (e.g., a broken pool)
+    is reported as an error item for its run rather than re-rendered.
+    """
+    results: List[Optional[ReportItem]] = [None] * len(tasks)
+    todo: List[int] = []
+    rerender: List[bool] = [force] * len(tasks)
+    for i, (kind, outdir) in enumerate(tasks):
+        report_name = _REPORT_NAMES.get(kind)
+        if not force and report_name is not None:
+            names = listed.get(outdir) if listed is not None else None
+            if names is None:
+                try:
+                    names = frozenset(os.listdir(outdir))
+                except OSError:
+                    names = frozenset()
+            if report_name in names:
+                report = os.path.join(outdir, report_name)
+                sources = [os.path.join(outdir, n) for n in _report_sources(kind, names)]
+                if report_is_fresh(report, sources):
+                    results[i] = ReportItem(
+                        kind=kind, outdir=outdir, report_path=report, status="skipped", message="exists"
+                    )
+                    continue
+                rerender[i] = True
+        todo.append(i)
+    jobs = _resolve_jobs(jobs)
+    if jobs > 1 and len(todo) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            ex = ProcessPoolExecutor(max_workers=min(jobs, len(todo)))
+        except (ImportError, OSError, NotImplementedError):
+            pass  # Render serially below.
+        else:
+            with ex:
+                futures = [(i, ex.submit(_render_task, tasks[i][0], tasks[i][1], rerender[i])) for i in todo]
+                for i, fut in futures:
+                    kind, outdir = tasks[i]
+                    try:
+                        results[i] = fut.result()
+                    except Exception as e:
+                        results[i] = ReportItem(
+                            kind=kind,
+                            outdir=outdir,
+                            report_path=os.path.join(outdir, _REPORT_NAMES.get(kind, "")),
+                            status="error",
+                            message=str(e) or type(e).__name__,
+                        )
+    return [
+        it if it is not None else _render_report(kind, outdir, force=rerender[i])
+        for i, (it, (kind, outdir)) in enumerate(zip(results, tasks))
     ]
 
-    def _counts(its: Sequence[ReportItem]) -> Dict[str, int]:
-        out = {"total": 0, "ok": 0, "skipped": 0, "error": 0}
-        out["total"] = len(its)
-        for it in its:
-            if it.status in out:
-                out[it.status] += 1
-        return out
 
-    overall = _counts(items)
+# ---- Dashboard HTML --------------------------------------------------------
 
-    def _badge(status: str) -> str:
-        cls = "ok" if status == "ok" else ("skip" if status == "skipped" else "err")
-        return f'<span class="badge {cls}">{_e(status)}</span>'
+def _status_cell(status: str) -> str:
+    """Status table cell: the status as data-csv plus a colored badge."""
+    cls = "ok" if status == "ok" else ("skip" if status == "skipped" else "err")
+    esc = _e(status)
+    return f'<td data-csv="{esc}"><span class="badge {cls}">{esc}</span></td>'
 
-    def section(kind: str, title: str) -> str:
-        its = by_kind.get(kind, [])
-        c = _counts(its)
-        anchor = f"sec_{kind}"
 
-        if not its:
-            return (
-                f'<div class="card">'
-                f'<h2 id="{_e(anchor)}">{_e(title)} <span class="pill">0</span></h2>'
-                '<div class="note">None found.</div>'
-                '</div>'
-            )
+# Every row has one of these statuses, so their cells are built once.
+_STATUS_CELLS: Dict[str, str] = {status: _status_cell(status) for status in ("ok", "skipped", "error")}
 
-        rows: List[str] = []
-        for it in sorted(its, key=lambda x: (x.status != "ok", x.outdir)):
-            rel_dir = _posix_relpath(it.outdir, out_dir)
-            folder_href = rel_dir
-            if folder_href and not folder_href.endswith("/"):
-                folder_href += "/"
-            folder_link = (
-                f'<a href="{_e(folder_href)}"><code>{_e(rel_dir)}</code></a>' if rel_dir else '<code>.</code>'
-            )
 
-            rel_report = _posix_relpath(it.report_path, out_dir) if it.report_path else ""
-            mtime = _file_mtime_iso(it.report_path) if it.report_path else ""
-            msg = it.message or ""
+def _mtime_iso(ts: float) -> str:
+    # Formatted straight from a struct_time (no datetime object per row; also
+    # avoids the deprecated datetime.utcfromtimestamp).
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
 
-            link = (
-                f'<a href="{_e(rel_report)}">open</a>'
-                if rel_report and it.report_path and os.path.exists(it.report_path)
-                else '<span class="muted">missing</span>'
-            )
 
-            rows.append(
-                "<tr>"
-                f"<td data-csv=\"{_e(it.status)}\">{_badge(it.status)}</td>"
-                f"<td data-csv=\"{_e(rel_dir)}\">{folder_link}</td>"
-                f"<td data-csv=\"{_e(rel_report)}\">{link}</td>"
-                f"<td data-csv=\"{_e(mtime)}\"><code>{_e(mtime)}</code></td>"
-                f"<td class=\"muted\" data-csv=\"{_e(msg)}\">{_e(msg)}</td>"
-                "</tr>"
-            )
+def _file_mtime_iso(path: str) -> str:
+    try:
+        ts = os.path.getmtime(path)
+    except Exception:
+        return ""
+    return _mtime_iso(ts)
 
-        ths = (
-            '<th onclick="sortTable(this)" aria-sort="none">Status</th>'
-            '<th onclick="sortTable(this)" aria-sort="none">Output folder</th>'
-            '<th onclick="sortTable(this)" aria-sort="none">Report</th>'
-            '<th onclick="sortTable(this)" aria-sort="none">Report mtime (UTC)</th>'
-            '<th onclick="sortTable(this)" aria-sort="none">Note</th>'
-        )
 
-        download_name = f"{kind}_runs_filtered.csv"
+_ReportStats = Dict[str, Optional[os.stat_result]]
 
-        return (
-            f'<div class="card">'
-            f'<h2 id="{_e(anchor)}">{_e(title)} <span class="pill">{c["total"]}</span>'
-            f' <span class="muted" style="font-size:12px;">(ok {c["ok"]} · skipped {c["skipped"]} · error {c["error"]})</span>'
-            '</h2>'
-            '<div class="table-filter">'
-            '<div class="table-controls">'
-            '<input class="section-filter" type="search" placeholder="Filter rows…" oninput="filterTable(this)" />'
-            f'<button type="button" onclick="downloadTableCSV(this, \'{_e(download_name)}\', true)">Download CSV</button>'
-            '<span class="filter-count muted"></span>'
-            '</div>'
-            '<div class="table-wrap">'
-            '<table class="data-table sticky">'
-            f'<thead><tr>{ths}</tr></thead>'
-            '<tbody>'
-            + "".join(rows)
-            + '</tbody></table>'
-            '</div>'
-            '</div>'
-            '</div>'
-        )
 
-    # Table of contents with counts.
-    toc_rows: List[str] = []
-    for kind, title in kind_order:
-        c = _counts(by_kind.get(kind, []))
-        pill = f'<span class="pill">{c["total"]}</span>'
-        toc_rows.append(f'<li><a href="#{_e("sec_" + kind)}">{_e(title)}</a> {pill}</li>')
+def _report_stats(items: Sequence[ReportItem]) -> _ReportStats:
+    """Stat each item's report once: {report_path: stat result, or None if missing}.
 
-    toc_html = "".join(toc_rows)
-    roots_html = "".join(f"<li><code>{_e(os.path.abspath(r))}</code></li>" for r in roots)
+    Both the dashboard rows and the JSON index need exists/mtime/size for every
+    report; one os.stat per path answers all three.
+    """
+    stats: _ReportStats = {}
+    for it in items:
+        p = it.report_path
+        if p and p not in stats:
+            try:
+                stats[p] = os.stat(p)
+            except (OSError, ValueError):
+                stats[p] = None
+    return stats
+
+
+_SECTION_THS = (
+    '<th onclick="sortTable(this)" aria-sort="none">Status</th>'
+    '<th onclick="sortTable(this)" aria-sort="none">Output folder</th>'
+    '<th onclick="sortTable(this)" aria-sort="none">Report</th>'
+    '<th onclick="sortTable(this)" aria-sort="none">Report mtime (UTC)</th>'
+    '<th onclick="sortTable(this)" aria-sort="none">Note</th>'
+)
 
-    css = BASE_CSS + r"""
+_DASHBOARD_CSS = BASE_CSS + r"""
 /* Dashboard-specific tweaks */
 .data-table { min-width: 760px; }
 
@@ -653,7 +725,7 @@ def _build_dashboard(items: Sequence[ReportItem], out_path: str, roots: Sequence
 .small { font-size: 12px; }
 """
 
-    extra_js = r"""
+_DASHBOARD_JS = JS_SORT_TABLE + r"""
 function _countVisibleRows() {
   let total = 0;
   let shown = 0;
@@ -702,15 +774,160 @@ document.addEventListener('DOMContentLoaded', () => {
 });
 """
 
-    sections_html = "".join(section(kind, title) for kind, title in kind_order)
 
-    return f"""<!doctype html>
+def _write_dashboard(
+    w: Callable[[str], object],
+    items: Sequence[ReportItem],
+    out_path: str,
+    roots: Sequence[str],
+    *,
+    stats: Optional[_ReportStats] = None,
+) -> None:
+    """Write the dashboard HTML through w (e.g. a buffered file's write).
+
+    Rows are written one at a time, so the document is never held in memory
+    as a whole (dashboards over thousands of runs reach many MB).
+    """
+    now = utc_now_iso()
+    if stats is None:
+        stats = _report_stats(items)
+    out_dir = os.path.dirname(os.path.abspath(out_path)) or "."
+
+    # Group items by kind
+    by_kind: Dict[str, List[ReportItem]] = {}
+    for it in items:
+        by_kind.setdefault(it.kind, []).append(it)
+
+    kind_order: List[Tuple[str, str]] = [
+        ("quality", "Quality runs"),
+        ("trace_plot", "Trace plot runs"),
+        ("spectrogram", "Spectrogram runs"),
+        ("bids_scan", "BIDS scan runs"),
+        ("nf_sessions_dashboard", "Neurofeedback sessions dashboard"),
+        ("nf", "Neurofeedback runs"),
+        ("pac", "PAC runs"),
+        ("epoch", "Epoch runs"),
+        ("iaf", "IAF runs"),
+        ("bandpowers", "Bandpower runs"),
+        ("bandratios", "Band ratio runs"),
+        ("topomap", "Topomap runs"),
+        ("loreta_metrics", "LORETA ROI metrics runs"),
+        ("spectral_features", "Spectral feature runs"),
+        ("connectivity", "Connectivity runs"),
+        ("connectivity_pair", "Connectivity pair runs"),
+        ("microstates", "Microstate runs"),
+        ("channel_qc", "Channel QC runs"),
+        ("artifacts", "Artifacts runs"),
+    ]
+
+    def _counts(its: Sequence[ReportItem]) -> Dict[str, int]:
+        out = {"total": 0, "ok": 0, "skipped": 0, "error": 0}
+        out["total"] = len(its)
+        for it in its:
+            if it.status in out:
+                out[it.status] += 1
+        return out
+
+    overall = _counts(items)
+
+    def section(kind: str, title: str) -> None:
+        its = by_kind.get(kind, [])
+        c = _counts(its)
+        anchor = f"sec_{kind}"
+
+        if not its:
+            w(
+                f'<div class="card">'
+                f'<h2 id="{_e(anchor)}">{_e(title)} <span class="pill">0</span></h2>'
+                '<div class="note">None found.</div>'
+                '</div>'
+            )
+            return
+
+        download_name = f"{kind}_runs_filtered.csv"
+
+        w(
+            f'<div class="card">'
+            f'<h2 id="{_e(anchor)}">{_e(title)} <span class="pill">{c["total"]}</span>'
+            f' <span class="muted" style="font-size:12px;">(ok {c["ok"]} · skipped {c["skipped"]} · error {c["error"]})</span>'
+            '</h2>'
+            '<div class="table-filter">'
+            '<div class="table-controls">'
+            '<input class="section-filter" type="search" placeholder="Filter rows…" oninput="filterTable(this)" />'
+            f'<button type="button" onclick="downloadTableCSV(this, \'{_e(download_name)}\', true)">Download CSV</button>'
+            '<span class="filter-count muted"></span>'
+            '</div>'
+            '<div class="table-wrap">'
+            '<table class="data-table sticky">'
+            f'<thead><tr>{_SECTION_THS}</tr></thead>'
+            '<tbody>'
+        )
+
+        for it in sorted(its, key=lambda x: (x.status != "ok", x.outdir)):
+            rel_dir = _posix_relpath(it.outdir, out_dir)
+            # Each field is escaped once and reused for its data-csv attribute and its cell text.
+            esc_dir = _e(rel_dir)
+            folder_link = (
+                f'<a href="{esc_dir if esc_dir.endswith("/") else esc_dir + "/"}"><code>{esc_dir}</code></a>'
+                if rel_dir
+                else '<code>.</code>'
+            )
+
+            rp = it.report_path
+            if not rp:
+                rel_report = ""
+            elif os.path.dirname(rp) == it.outdir:
+                # Reports live directly in their run folder: reuse rel_dir instead of a second relpath.
+                base = os.path.basename(rp).replace("\\", "/")
+                if rel_dir == ".":
+                    rel_report = base
+                elif rel_dir.endswith("/"):
+                    rel_report = rel_dir + base
+                else:
+                    rel_report = rel_dir + "/" + base
+            else:
+                rel_report = _posix_relpath(rp, out_dir)
+            esc_report = _e(rel_report)
+            st = stats.get(rp) if rp else None
+            # ISO timestamps contain nothing to escape.
+            mtime = _mtime_iso(st.st_mtime) if st is not None else ""
+            esc_msg = _e(it.message or "")
+
+            link = (
+                f'<a href="{esc_report}">open</a>'
+                if rel_report and st is not None
+                else '<span class="muted">missing</span>'
+            )
+
+            w(
+                "<tr>"
+                f"{_STATUS_CELLS.get(it.status) or _status_cell(it.status)}"
+                f"<td data-csv=\"{esc_dir}\">{folder_link}</td>"
+                f"<td data-csv=\"{esc_report}\">{link}</td>"
+                f"<td data-csv=\"{mtime}\"><code>{mtime}</code></td>"
+                f"<td class=\"muted\" data-csv=\"{esc_msg}\">{esc_msg}</td>"
+                "</tr>"
+            )
+
+        w('</tbody></table></div></div></div>')
+
+    # Table of contents with counts.
+    toc_rows: List[str] = []
+    for kind, title in kind_order:
+        c = _counts(by_kind.get(kind, []))
+        pill = f'<span class="pill">{c["total"]}</span>'
+        toc_rows.append(f'<li><a href="#{_e("sec_" + kind)}">{_e(title)}</a> {pill}</li>')
+
+    toc_html = "".join(toc_rows)
+    roots_html = "".join(f"<li><code>{_e(os.path.abspath(r))}</code></li>" for r in roots)
+
+    w(f"""<!doctype html>
 <html lang=\"en\">
 <head>
 <meta charset=\"utf-8\">
 <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">
 <title>QEEG reports dashboard</title>
-<style>{css}</style>
+<style>{_DASHBOARD_CSS}</style>
 </head>
 <body>
 <header>
@@ -753,17 +970,27 @@ document.addEventListener('DOMContentLoaded', () => {
     </div>
   </div>
 
-  {sections_html}
+  """)
+    for kind, title in kind_order:
+        section(kind, title)
+    w(f"""
 
   <div class=\"footer\">Tip: open report links in a browser. These HTML files make no network requests.</div>
 </main>
-<script>{JS_SORT_TABLE + extra_js}</script>
+<script>{_DASHBOARD_JS}</script>
 </body>
 </html>
-"""
+""")
 
 
-def _write_json_index(items: Sequence[ReportItem], roots: Sequence[str], *, out_path: str, json_index_path: str) -> None:
+def _write_json_index(
+    items: Sequence[ReportItem],
+    roots: Sequence[str],
+    *,
+    out_path: str,
+    json_index_path: str,
+    stats: Optional[_ReportStats] = None,
+) -> None:
     """Write a machine-readable JSON index for the generated dashboard.
 
     The HTML dashboard is convenient for humans, but downstream tools (and
@@ -803,11 +1030,15 @@ def _write_json_index(items: Sequence[ReportItem], roots: Sequence[str], *, out_
     dash_mtime = _file_mtime_iso(out_path) if dash_exists else ""
     dash_size = int(os.path.getsize(out_path)) if dash_exists else 0
 
+    if stats is None:
+        stats = _report_stats(items)
+
     reports: List[Dict[str, object]] = []
     for it in items:
-        rep_exists = bool(it.report_path and os.path.exists(it.report_path))
-        rep_mtime = _file_mtime_iso(it.report_path) if rep_exists else ""
-        rep_size = int(os.path.getsize(it.report_path)) if rep_exists else 0
+        st = stats.get(it.report_path) if it.report_path else None
+        rep_exists = st is not None
+        rep_mtime = _mtime_iso(st.st_mtime) if st is not None else ""
+        rep_size = int(st.st_size) if st is not None else 0
 
         obj: Dict[str, object] = {
             "kind": it.kind,
@@ -916,7 +1147,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     ap.add_argument(
         "--force",
         action="store_true",
-        help="Regenerate per-run report HTML even if it already exists.",
+        help="Regenerate per-run report HTML even if it is up to date.",
     )
     ap.add_argument(
         "--no-render",
@@ -928,6 +1159,41 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         action="store_true",
         help="Open the generated dashboard in your default browser.",
     )
+    ap.add_argument(
+        "--skip",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help=(
+            "Directory name to skip while scanning (repeatable; added to the defaults: "
+            + ", ".join(sorted(_DEFAULT_SKIP_DIRS))
+            + ")."
+        ),
+    )
+    ap.add_argument(
+        "--include-hidden",
+        action="store_true",
+        help="Also scan hidden directories (names starting with '.'), which are skipped by default.",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help=(
+            "Render missing per-run reports (and the NF sessions dashboard) in N worker processes "
+            "(default: 0 = one per CPU; 1 = in-process, e.g. for debugging)."
+        ),
+    )
+    ap.add_argument(
+        "--scan-threads",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "List directories in N threads while scanning (default: 1). Helps on network "
+            "filesystems, where each directory listing waits on the server."
+        ),
+    )
     args = ap.parse_args(list(argv) if argv is not None else None)
 
     roots = [os.path.abspath(r) for r in args.roots]
@@ -938,80 +1204,23 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     out_dir = os.path.dirname(out_path) or "."
     os.makedirs(out_dir, exist_ok=True)
 
-    renderer_mods = _try_import_renderers()
-
-    quality_dirs: Set[str] = set()
-    trace_dirs: Set[str] = set()
-    spectrogram_dirs: Set[str] = set()
-    topomap_dirs: Set[str] = set()
-    loreta_dirs: Set[str] = set()
-    band_dirs: Set[str] = set()
-    br_dirs: Set[str] = set()
-    sf_dirs: Set[str] = set()
-    nf_dirs: Set[str] = set()
-    pac_dirs: Set[str] = set()
-    epoch_dirs: Set[str] = set()
-    conn_dirs: Set[str] = set()
-    conn_pair_dirs: Set[str] = set()
-    ms_dirs: Set[str] = set()
-    iaf_dirs: Set[str] = set()
-    bids_dirs: Set[str] = set()
-    qc_dirs: Set[str] = set()
-    art_dirs: Set[str] = set()
-
-    for dirpath, filenames in _walk_dirs(roots):
-        s = set(filenames)
-
-        if any(name in s for name in _QUALITY_HINT_FILES):
-            # quality_report.json is the strongest signal; accept the others too.
-            if ("quality_report.json" in s) or ("line_noise_per_channel.csv" in s):
-                quality_dirs.add(os.path.abspath(dirpath))
-
-        if any(name in s for name in _TRACE_PLOT_HINT_FILES):
-            trace_dirs.add(os.path.abspath(dirpath))
-
-        if _looks_like_spectrogram(filenames):
-            spectrogram_dirs.add(os.path.abspath(dirpath))
-
-        if _looks_like_topomap(filenames):
-            topomap_dirs.add(os.path.abspath(dirpath))
-
-        if "loreta_metrics.csv" in s:
-            loreta_dirs.add(os.path.abspath(dirpath))
-
-        if "bandpowers.csv" in s:
-            band_dirs.add(os.path.abspath(dirpath))
-        if "bandratios.csv" in s:
-            br_dirs.add(os.path.abspath(dirpath))
-        if "spectral_features.csv" in s:
-            sf_dirs.add(os.path.abspath(dirpath))
-        if "nf_feedback.csv" in s:
-            nf_dirs.add(os.path.abspath(dirpath))
-        if "pac_timeseries.csv" in s:
-            pac_dirs.add(os.path.abspath(dirpath))
-        if ("epoch_bandpowers_summary.csv" in s) or ("epoch_bandpowers.csv" in s):
-            epoch_dirs.add(os.path.abspath(dirpath))
-        # Connectivity has two report paths:
-        #  - edge-list / matrix mode (render_connectivity_report.py)
-        #  - pair-summary mode (render_connectivity_pair_report.py)
-        if _looks_like_connectivity(filenames):
-            conn_dirs.add(os.path.abspath(dirpath))
-        elif _looks_like_connectivity_pair(filenames):
-            conn_pair_dirs.add(os.path.abspath(dirpath))
-        if "microstate_state_stats.csv" in s:
-            ms_dirs.add(os.path.abspath(dirpath))
-        if "iaf_by_channel.csv" in s:
-            iaf_dirs.add(os.path.abspath(dirpath))
-
-        if any(name in s for name in _BIDS_SCAN_HINT_FILES):
-            # bids_index.csv is the strongest signal; accept the others too.
-            if "bids_index.csv" in s:
-                bids_dirs.add(os.path.abspath(dirpath))
-        if "channel_qc.csv" in s:
-            qc_dirs.add(os.path.abspath(dirpath))
-        if any(name in s for name in _ARTIFACT_HINT_FILES):
-            # artifact_windows.csv is the main signal; allow segments/meta too.
-            art_dirs.add(os.path.abspath(dirpath))
+    run_dirs: Dict[str, Set[str]] = {kind: set() for kind in _REPORT_NAMES}
+    # Filenames of each run folder as listed by the scan (existing reports are
+    # looked up here instead of stat-ing them again).
+    listed: Dict[str, FrozenSet[str]] = {}
+
+    skip_names = _DEFAULT_SKIP_DIRS.union(str(n) for n in args.skip)
+    for dirpath, filenames in _walk_dirs(
+        roots, skip_names=skip_names, include_hidden=bool(args.include_hidden), jobs=int(args.scan_threads)
+    ):
+        names = frozenset(filenames)
+        kinds = _classify_dir(names)
+        if kinds:
+            # Already absolute and normalized: the scan starts from abspath'd roots.
+            listed[dirpath] = names
+            for kind in kinds:
+                run_dirs[kind].add(dirpath)
+    nf_dirs = run_dirs["nf"]
 
     items: List[ReportItem] = []
 
@@ -1052,7 +1261,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             )
 
         argv2: List[str] = [str(d) for d in sorted(nf_dirs)]
-        argv2 += ["--out", str(sess_out)]
+        argv2 += ["--out", str(sess_out), "--jobs", str(int(args.jobs))]
         if args.no_render:
             # In no-render mode, don't create missing per-run reports.
             argv2.append("--no-generate-reports")
@@ -1103,94 +1312,27 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     def add_existing(kind: str, outdir: str, report_name: str) -> None:
         report_path = os.path.join(outdir, report_name)
-        if os.path.exists(report_path):
+        if report_name in listed[outdir]:
             items.append(ReportItem(kind=kind, outdir=outdir, report_path=report_path, status="ok"))
         else:
             items.append(ReportItem(kind=kind, outdir=outdir, report_path=report_path, status="error", message="missing"))
 
+    tasks = [(kind, d) for kind in _RUN_KIND_ORDER for d in sorted(run_dirs[kind])]
+
     if args.no_render:
-        for d in sorted(quality_dirs):
-            add_existing("quality", d, "quality_report.html")
-        for d in sorted(trace_dirs):
-            add_existing("trace_plot", d, "trace_plot_report.html")
-        for d in sorted(spectrogram_dirs):
-            add_existing("spectrogram", d, "spectrogram_report.html")
-        for d in sorted(topomap_dirs):
-            add_existing("topomap", d, "topomap_report.html")
-        for d in sorted(loreta_dirs):
-            add_existing("loreta_metrics", d, "loreta_metrics_report.html")
-        for d in sorted(nf_dirs):
-            add_existing("nf", d, "nf_feedback_report.html")
-        for d in sorted(pac_dirs):
-            add_existing("pac", d, "pac_report.html")
-        for d in sorted(epoch_dirs):
-            add_existing("epoch", d, "epoch_report.html")
-        for d in sorted(iaf_dirs):
-            add_existing("iaf", d, "iaf_report.html")
-        for d in sorted(bids_dirs):
-            add_existing("bids_scan", d, "bids_scan_report.html")
-        for d in sorted(band_dirs):
-            add_existing("bandpowers", d, "bandpowers_report.html")
-        for d in sorted(br_dirs):
-            add_existing("bandratios", d, "bandratios_report.html")
-        for d in sorted(sf_dirs):
-            add_existing("spectral_features", d, "spectral_features_report.html")
-        for d in sorted(conn_dirs):
-            add_existing("connectivity", d, "connectivity_report.html")
-        for d in sorted(conn_pair_dirs):
-            add_existing("connectivity_pair", d, "connectivity_pair_report.html")
-        for d in sorted(ms_dirs):
-            add_existing("microstates", d, "microstates_report.html")
-        for d in sorted(qc_dirs):
-            add_existing("channel_qc", d, "channel_qc_report.html")
-        for d in sorted(art_dirs):
-            add_existing("artifacts", d, "artifacts_report.html")
+        for kind, d in tasks:
+            add_existing(kind, d, _REPORT_NAMES[kind])
     else:
-        for d in sorted(quality_dirs):
-            items.append(_render_report("quality", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(trace_dirs):
-            items.append(_render_report("trace_plot", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(spectrogram_dirs):
-            items.append(_render_report("spectrogram", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(topomap_dirs):
-            items.append(_render_report("topomap", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(loreta_dirs):
-            items.append(_render_report("loreta_metrics", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(nf_dirs):
-            items.append(_render_report("nf", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(pac_dirs):
-            items.append(_render_report("pac", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(epoch_dirs):
-            items.append(_render_report("epoch", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(iaf_dirs):
-            items.append(_render_report("iaf", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(bids_dirs):
-            items.append(_render_report("bids_scan", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(band_dirs):
-            items.append(_render_report("bandpowers", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(br_dirs):
-            items.append(_render_report("bandratios", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(sf_dirs):
-            items.append(_render_report("spectral_features", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(conn_dirs):
-            items.append(_render_report("connectivity", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(conn_pair_dirs):
-            items.append(_render_report("connectivity_pair", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(ms_dirs):
-            items.append(_render_report("microstates", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(qc_dirs):
-            items.append(_render_report("channel_qc", d, force=bool(args.force), renderer_mods=renderer_mods))
-        for d in sorted(art_dirs):
-            items.append(_render_report("artifacts", d, force=bool(args.force), renderer_mods=renderer_mods))
+        items.extend(_render_reports(tasks, force=bool(args.force), jobs=int(args.jobs), listed=listed))
 
     # Aggregated NF sessions dashboard (if applicable).
     nf_sess = _maybe_build_nf_sessions_dashboard()
     if nf_sess is not None:
         items.append(nf_sess)
 
-    html_doc = _build_dashboard(items, out_path, roots)
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(html_doc)
+    stats = _report_stats(items)
+    with atomic_output(out_path) as tmp_path, open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        _write_dashboard(f.write, items, out_path, roots, stats=stats)
 
     print(f"Wrote: {out_path}")
 
@@ -1206,7 +1348,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         json_index_path = os.path.join(out_dir, "qeeg_reports_dashboard_index.json")
 
     if json_index_path:
-        _write_json_index(items, roots, out_path=out_path, json_index_path=str(json_index_path))
+        _write_json_index(items, roots, out_path=out_path, json_index_path=str(json_index_path), stats=stats)
         print(f"Wrote: {os.path.abspath(str(json_index_path))}")
 
     # Optional: bundle + verify (stdlib only; uses scripts/package_reports_dashboard.py).
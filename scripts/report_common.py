@@ -24,13 +24,14 @@ import sys
 # change the outputs of the report renderers.
 sys.dont_write_bytecode = True
 
+import contextlib
 import csv
 import datetime as _dt
 import html
 import json
 import math
 import os
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 
 def _cleanup_stale_pycache() -> None:
@@ -71,8 +72,37 @@ _cleanup_stale_pycache()
 
 
 def e(x: Any) -> str:
-    """HTML-escape any value for safe embedding in HTML."""
-    return html.escape(str(x), quote=True)
+    """HTML-escape any value for safe embedding in HTML.
+
+    Same result as html.escape(str(x), quote=True). Most values in these
+    reports (numbers, channel labels, file names) contain no special
+    characters, so those are returned as-is after a few cheap substring
+    checks instead of five str.replace passes.
+    """
+    s = x if type(x) is str else str(x)
+    if "&" in s or "<" in s or ">" in s or '"' in s or "'" in s:
+        return html.escape(s, quote=True)
+    return s
+
+
+def e_many(values: Iterable[Any]) -> List[str]:
+    """e() over many values (e.g. every cell of a table) at once.
+
+    The values are joined with NUL, escaped as one string (five C-level
+    replaces in total instead of a Python call per value), and split again.
+    A batch with nothing to escape (e.g. a column of numbers) is returned
+    without the split. Falls back to per-value e() if a value itself
+    contains NUL.
+    """
+    strs = [v if type(v) is str else str(v) for v in values]
+    joined = "\x00".join(strs)
+    esc = e(joined)
+    if esc is joined:  # e() returns its input unchanged when there is nothing to escape
+        return strs
+    out = esc.split("\x00")
+    if len(out) != len(strs):
+        return [e(v) for v in strs]
+    return out
 
 
 def is_dir(path: str) -> bool:
@@ -83,6 +113,49 @@ def is_dir(path: str) -> bool:
         return False
 
 
+def report_is_fresh(
+    report: Union[str, "os.PathLike[str]"], sources: Iterable[Union[str, "os.PathLike[str]", None]]
+) -> bool:
+    """True when report is at least as new as every existing source file.
+
+    A missing report is never fresh; missing (or None) sources are ignored.
+    Never raises.
+    """
+    try:
+        rep_mtime = os.stat(report).st_mtime_ns
+    except OSError:
+        return False
+    for src in sources:
+        if src is None:
+            continue
+        try:
+            if os.stat(src).st_mtime_ns > rep_mtime:
+                return False
+        except OSError:
+            continue
+    return True
+
+
+@contextlib.contextmanager
+def atomic_output(path: str) -> Iterator[str]:
+    """Yield a sibling temp path to write instead of path.
+
+    On a clean exit the temp file replaces path (os.replace), so readers never
+    see a partially written report. If the block raises, the temp file is
+    removed and any existing file at path is left untouched.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def posix_relpath(path: str, start: str) -> str:
     """os.path.relpath with forward slashes (for HTML hrefs).
 
@@ -109,10 +182,14 @@ def utc_now_iso() -> str:
 
 
 def read_json_if_exists(path: str) -> Optional[Dict[str, Any]]:
-    """Load a JSON dict from path, returning None if missing/invalid."""
+    """Load a JSON dict from path, returning None if missing/invalid.
+
+    The file is parsed straight from bytes (json.loads detects UTF-8/16/32 and a
+    UTF-8 BOM), skipping the text-mode decode layer.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            v = json.load(f)
+        with open(path, "rb") as f:
+            v = json.loads(f.read())
         return v if isinstance(v, dict) else None
     except FileNotFoundError:
         return None
@@ -203,6 +280,18 @@ def try_float(x: Any) -> float:
         return math.nan
 
 
+def cell_float(s: str) -> float:
+    """try_float() specialized for csv cells (always str).
+
+    float() already ignores surrounding whitespace and rejects "", so the
+    None/strip checks are skipped. Returns math.nan when s is not numeric.
+    """
+    try:
+        return float(s)
+    except ValueError:
+        return math.nan
+
+
 _TRUE_STRS = {"1", "true", "t", "yes", "y", "on"}
 _FALSE_STRS = {"0", "false", "f", "no", "n", "off"}
 
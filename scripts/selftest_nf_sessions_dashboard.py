@@ -93,6 +93,9 @@ def main() -> int:
                 "--json-index",
                 str(out_json),
                 "--no-generate-reports",
+                # Exercises the process-pool path (falls back to serial if unavailable).
+                "--jobs",
+                "2",
             ],
             cwd=repo_root,
         )
@@ -102,6 +105,47 @@ def main() -> int:
         if not out_json.is_file():
             raise RuntimeError("Expected JSON index was not created")
 
+        # A second render reuses the per-session stats cache and must not change the index.
+        if not (sess_dirs[0] / ".nf_stats_cache.json").is_file():
+            raise RuntimeError("Expected per-session stats cache was not created")
+        out_json2 = root / "nf_sessions_dashboard_index_cached.json"
+        _run(
+            [
+                sys.executable,
+                "-B",
+                str(render),
+                str(root),
+                "--out",
+                str(out_html),
+                "--json-index",
+                str(out_json2),
+                "--no-generate-reports",
+            ],
+            cwd=repo_root,
+        )
+        sessions_a = json.loads(out_json.read_text(encoding="utf-8")).get("sessions")
+        sessions_b = json.loads(out_json2.read_text(encoding="utf-8")).get("sessions")
+        if sessions_a != sessions_b:
+            raise RuntimeError("Cached render produced a different session summary")
+        out_json2.unlink()
+
+        # Per-session reports: rendered once, reused while fresh, re-rendered
+        # when the session CSV is newer than the report.
+        render_with_reports = [sys.executable, "-B", str(render), str(root), "--out", str(out_html)]
+        _run(render_with_reports, cwd=repo_root)
+        reports = [d / "nf_feedback_report.html" for d in sess_dirs]
+        if not all(p.is_file() for p in reports):
+            raise RuntimeError("Expected per-session nf_feedback_report.html files")
+        old = [p.stat().st_mtime_ns for p in reports]
+        st = (sess_dirs[0] / "nf_feedback.csv").stat()
+        os.utime(sess_dirs[0] / "nf_feedback.csv", ns=(st.st_atime_ns, old[0] + 10**9))
+        _run(render_with_reports, cwd=repo_root)
+        new = [p.stat().st_mtime_ns for p in reports]
+        if new[0] == old[0]:
+            raise RuntimeError("Stale nf_feedback_report.html was not re-rendered")
+        if new[1:] != old[1:]:
+            raise RuntimeError("Fresh nf_feedback_report.html files should be reused")
+
         # Validate the JSON index against the published schema.
         validate = scripts_dir / "validate_nf_sessions_dashboard_index.py"
         if not validate.is_file():
@@ -21,10 +21,13 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
 import json
 import math
 import os
 import random
+import re
+import shutil
 import tempfile
 import zipfile
 from pathlib import Path
@@ -2499,8 +2502,9 @@ def _run_renderers(root: Path) -> None:
     _assert_contains(out_art / "artifacts_report.html", "downloadTableCSV")
     _assert_contains(out_art / "artifacts_report.html", "Download CSV")
 
-    for _d in (out_nf_a, out_nf_b):
-        assert render_nf_feedback_report.main(["--input", str(_d)]) == 0
+    for _d, _jobs in ((out_nf_a, "1"), (out_nf_b, "2")):
+        # --jobs 2 exercises the process-pool chart path (falls back to serial if unavailable).
+        assert render_nf_feedback_report.main(["--input", str(_d), "--jobs", _jobs]) == 0
         _assert_file(_d / "nf_feedback_report.html")
         _assert_contains(_d / "nf_feedback_report.html", "downloadTableCSV")
         _assert_contains(_d / "nf_feedback_report.html", "Download CSV")
@@ -2509,11 +2513,40 @@ def _run_renderers(root: Path) -> None:
         _assert_contains(_d / "nf_feedback_report.html", "Z-scores")
         _assert_contains(_d / "nf_feedback_report.html", "Continuous feedback")
 
+    _nf_no_svg = out_nf_a / "nf_feedback_report_no_svg.html"
+    assert render_nf_feedback_report.main(["--input", str(out_nf_a), "--out", str(_nf_no_svg), "--no-svg"]) == 0
+    _assert_contains(_nf_no_svg, "Phase stats")
+    assert "<svg" not in _nf_no_svg.read_text(encoding="utf-8")
+    _nf_no_svg.unlink()
+
+    # 600 rows at --table-rows 150 sample every 4th row plus the last one (151 rows);
+    # the table must show that sample as-is rather than thinning it again.
+    _nf_rows = out_nf_a / "nf_feedback_report_rows.html"
+    assert render_nf_feedback_report.main(["--input", str(out_nf_a), "--out", str(_nf_rows), "--table-rows", "150"]) == 0
+    _nf_tables = re.findall(r'<table class="data-table sticky">(.*?)</table>', _nf_rows.read_text(encoding="utf-8"), re.S)
+    assert _nf_tables and _nf_tables[-1].count("<tr>") == 1 + 151, [t.count("<tr>") for t in _nf_tables]
+    _nf_rows.unlink()
+
     assert render_pac_report.main(["--input", str(out_pac)]) == 0
     _assert_file(out_pac / "pac_report.html")
     _assert_contains(out_pac / "pac_report.html", "downloadTableCSV")
     _assert_contains(out_pac / "pac_report.html", "Download CSV")
 
+    # --gzip writes <out>.gz with the same document as the plain render.
+    _pac_gz = out_pac / "pac_report_gz.html"
+    assert render_pac_report.main(["--input", str(out_pac), "--out", str(_pac_gz), "--gzip"]) == 0
+    with gzip.open(str(_pac_gz) + ".gz", "rt", encoding="utf-8") as _f:
+        _pac_gz_html = _f.read()
+    assert "downloadTableCSV" in _pac_gz_html and _pac_gz_html.rstrip().endswith("</html>")
+    assert not _pac_gz.exists() and not list(out_pac.glob("*.tmp"))
+    os.remove(str(_pac_gz) + ".gz")
+    try:
+        render_pac_report.main(["--input", str(out_pac), "--gzip", "--open"])
+    except SystemExit as _exc:
+        assert _exc.code == 2
+    else:
+        raise AssertionError("--gzip --open should be rejected")
+
     assert render_epoch_report.main(["--input", str(out_epoch)]) == 0
     _assert_file(out_epoch / "epoch_report.html")
     _assert_contains(out_epoch / "epoch_report.html", "downloadTableCSV")
@@ -2537,6 +2570,19 @@ def _run_renderers(root: Path) -> None:
     assert render_quality_report.main(["--input", str(out_quality)]) == 0
     _assert_file(out_quality / "quality_report.html")
     _assert_contains(out_quality / "quality_report.html", "Download CSV")
+    # Neither mains frequency dominates in the synthetic data: both charts are drawn.
+    _assert_contains(out_quality / "quality_report.html", "channels by 50 Hz peak/baseline ratio")
+    _assert_contains(out_quality / "quality_report.html", "channels by 60 Hz peak/baseline ratio")
+    # Batch mode: several outdirs in one call, rendered in worker processes.
+    # (The copies live outside root so the dashboards below do not pick them up.)
+    with tempfile.TemporaryDirectory(prefix="qeeg_quality_batch_") as td:
+        batch = [Path(td) / "a", Path(td) / "b"]
+        for d in batch:
+            shutil.copytree(out_quality, d)
+            (d / "quality_report.html").unlink()
+        assert render_quality_report.main(["--input", *map(str, batch), "--jobs", "2"]) == 0
+        for d in batch:
+            _assert_contains(d / "quality_report.html", "Download CSV")
 
     assert render_trace_plot_report.main(["--input", str(out_traces)]) == 0
     _assert_file(out_traces / "trace_plot_report.html")
@@ -2562,8 +2608,17 @@ def _run_renderers(root: Path) -> None:
     # Exercise the convenience flags:
     #  - --bundle (with no explicit path): defaults to <out-dir>/qeeg_reports_bundle.zip
     #  - implicit JSON index creation when --bundle is present (even if --json-index is omitted)
+    #  - --scan-threads (threaded directory listing)
     dash_out = root / "qeeg_reports_dashboard.html"
     dash_json = root / "qeeg_reports_dashboard_index.json"
+    # Matrix-only connectivity folders are detected by <measure>_matrix_<band>.csv.
+    assert render_reports_dashboard._looks_like_connectivity(["plv_matrix_theta.csv"])
+    assert render_reports_dashboard._looks_like_connectivity(["coherence_matrix_alpha.csv", "notes.txt"])
+    assert not render_reports_dashboard._looks_like_connectivity(["weights_matrix_alpha.csv"])
+    # Outputs inside skipped folders (VCS metadata, caches, ...) must not be picked up.
+    pruned = root / "node_modules" / "out_quality_copy"
+    pruned.mkdir(parents=True, exist_ok=True)
+    (pruned / "quality_report.json").write_text("{}\n", encoding="utf-8")
     bundle_zip = root / "qeeg_reports_bundle.zip"
     assert (
         render_reports_dashboard.main(
@@ -2574,6 +2629,8 @@ def _run_renderers(root: Path) -> None:
                 "--no-render",
                 "--bundle",
                 "--verify-bundle",
+                "--scan-threads",
+                "2",
             ]
         )
         == 0
@@ -2592,6 +2649,7 @@ def _run_renderers(root: Path) -> None:
     assert isinstance(dash_idx.get("reports"), list)
     assert isinstance(dash_idx.get("reports_summary"), dict)
     assert any((r.get("kind") == "quality") for r in dash_idx.get("reports", []))
+    assert not any("node_modules" in str(r.get("outdir", "")) for r in dash_idx.get("reports", []))
     assert any((r.get("kind") == "spectrogram") for r in dash_idx.get("reports", []))
     assert any((r.get("kind") == "topomap") for r in dash_idx.get("reports", []))
     # When 2+ NF runs are present, the dashboard should also emit an aggregated
@@ -2674,6 +2732,37 @@ def _run_renderers(root: Path) -> None:
     ]:
         _assert_table_enhancements(p)
 
+    # Dashboard refreshes keep up-to-date reports and re-render stale ones
+    # (a report older than the outputs it was rendered from).
+    bp_report = out_bp / "bandpowers_report.html"
+    bp_task = [("bandpowers", str(out_bp))]
+    src_ns = max(p.stat().st_mtime_ns for p in out_bp.iterdir() if p != bp_report)
+    os.utime(bp_report, ns=(src_ns, src_ns))
+    assert render_reports_dashboard._render_reports(bp_task, force=False, jobs=1)[0].status == "skipped"
+    os.utime(bp_report, ns=(src_ns - 5_000_000_000, src_ns - 5_000_000_000))
+    assert render_reports_dashboard._render_reports(bp_task, force=False, jobs=1)[0].status == "ok"
+    assert render_reports_dashboard._render_reports(bp_task, force=False, jobs=1)[0].status == "skipped"
+
+    # A render that fails mid-write leaves no partial report behind, so the
+    # next refresh renders it again instead of skipping a truncated file.
+    q_report = out_quality / "quality_report.html"
+    q_task = [("quality", str(out_quality))]
+    q_report.unlink()
+    _write_table = render_quality_report._write_table
+
+    def _failing_write_table(*a: object, **kw: object) -> None:
+        raise RuntimeError("simulated render failure")
+
+    render_quality_report._write_table = _failing_write_table  # type: ignore[assignment]
+    try:
+        assert render_reports_dashboard._render_reports(q_task, force=False, jobs=1)[0].status == "error"
+    finally:
+        render_quality_report._write_table = _write_table  # type: ignore[assignment]
+    assert not q_report.exists() and not list(out_quality.glob("*.tmp"))
+    assert render_reports_dashboard._render_reports(q_task, force=False, jobs=1)[0].status == "ok"
+    assert q_report.read_text(encoding="utf-8").rstrip().endswith("</html>")
+    assert render_reports_dashboard._render_reports(q_task, force=False, jobs=1)[0].status == "skipped"
+
 
 
 def main(argv: Sequence[str] | None = None) -> int:
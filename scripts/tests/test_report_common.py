@@ -41,6 +41,71 @@ class ReportCommonTests(unittest.TestCase):
         self.assertNotIn("\\", rel)
         self.assertTrue(rel.lower().startswith("d:/"))
 
+    def test_e_matches_html_escape(self) -> None:
+        import html
+
+        for v in ["Fp1", "0.125", "", "a<b & 'c' > \"d\"", "&amp;", 1.5, None]:
+            self.assertEqual(rc.e(v), html.escape(str(v), quote=True))
+
+    def test_e_many_matches_e(self) -> None:
+        vals = ["Fp1", "0.125", "", "a<b & 'c' > \"d\"", "&amp;", 1.5, None]
+        self.assertEqual(rc.e_many(vals), [rc.e(v) for v in vals])
+        self.assertEqual(rc.e_many([]), [])
+        self.assertEqual(rc.e_many(["1", "2.5e-3", "a\x00b"]), ["1", "2.5e-3", "a\x00b"])
+        # NUL inside a value falls back to per-value escaping.
+        self.assertEqual(rc.e_many(["a\x00<b", "c"]), ["a\x00&lt;b", "c"])
+
+    def test_read_json_if_exists_dicts_only(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="qeeg_report_common_test_") as td:
+            base = Path(td)
+            (base / "ok.json").write_text('{"a": 1, "b": NaN}', encoding="utf-8")
+            (base / "bom.json").write_bytes(b'\xef\xbb\xbf{"a": "\xc3\xa9"}')
+            (base / "list.json").write_text("[1, 2]", encoding="utf-8")
+            (base / "bad.json").write_text("{", encoding="utf-8")
+
+            ok = rc.read_json_if_exists(str(base / "ok.json"))
+            self.assertIsNotNone(ok)
+            self.assertEqual(ok["a"], 1)
+            self.assertEqual(rc.read_json_if_exists(str(base / "bom.json")), {"a": "\u00e9"})
+            self.assertIsNone(rc.read_json_if_exists(str(base / "list.json")))
+            self.assertIsNone(rc.read_json_if_exists(str(base / "bad.json")))
+            self.assertIsNone(rc.read_json_if_exists(str(base / "missing.json")))
+
+    def test_report_is_fresh_compares_mtimes(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="qeeg_report_common_test_") as td:
+            base = Path(td)
+            src = base / "data.csv"
+            rep = base / "report.html"
+            src.write_text("x\n", encoding="utf-8")
+            rep.write_text("<html></html>", encoding="utf-8")
+            os.utime(src, (1_000_000, 1_000_000))
+            os.utime(rep, (2_000_000, 2_000_000))
+
+            # str and PathLike both work; missing/None sources are ignored.
+            self.assertTrue(rc.report_is_fresh(str(rep), [str(src)]))
+            self.assertTrue(rc.report_is_fresh(rep, [src, None, base / "missing.csv"]))
+            self.assertFalse(rc.report_is_fresh(base / "missing.html", [src]))
+
+            os.utime(src, (3_000_000, 3_000_000))
+            self.assertFalse(rc.report_is_fresh(rep, [src]))
+
+    def test_atomic_output_replaces_only_on_success(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="qeeg_report_common_test_") as td:
+            out = Path(td) / "report.html"
+            out.write_text("old", encoding="utf-8")
+
+            with self.assertRaises(RuntimeError):
+                with rc.atomic_output(str(out)) as tmp, open(tmp, "w", encoding="utf-8") as f:
+                    f.write("partial")
+                    raise RuntimeError("render failed")
+            self.assertEqual(out.read_text(encoding="utf-8"), "old")
+            self.assertEqual(sorted(p.name for p in Path(td).iterdir()), ["report.html"])
+
+            with rc.atomic_output(str(out)) as tmp, open(tmp, "w", encoding="utf-8") as f:
+                f.write("new")
+            self.assertEqual(out.read_text(encoding="utf-8"), "new")
+            self.assertEqual(sorted(p.name for p in Path(td).iterdir()), ["report.html"])
+
 
 if __name__ == "__main__":
     raise SystemExit(unittest.main())